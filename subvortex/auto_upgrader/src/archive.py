@@ -0,0 +1,404 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import json
+import shutil
+import time
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.dedup as saudd
+
+
+class PathFilter:
+    """
+    Members of a release archive to extract, by path relative to its top-level
+    directory: the ones under `included` if given, except the ones under
+    `excluded`. The excluded members are recorded, to be extracted later if needed.
+    """
+
+    def __init__(self, included: list = None, excluded: list = None, role: str = None):
+        self.included = included
+        self.excluded = excluded or []
+        self.role = role
+        self.skipped = {}
+
+    def __call__(self, member):
+        # The top-level directory itself is always needed
+        parts = member.name.split("/", 1)
+        if len(parts) < 2 or not parts[1]:
+            return True
+
+        relpath = parts[1].rstrip("/")
+        if self.included is not None and not any(
+            _is_under(relpath, x) for x in self.included
+        ):
+            return False
+
+        prefix = next((x for x in self.excluded if _is_under(relpath, x)), None)
+        if prefix is None:
+            return True
+
+        entry = self.skipped.setdefault(prefix, {"members": 0, "bytes": 0})
+        entry["members"] += 1
+        entry["bytes"] += member.size if member.isreg() else 0
+
+        return False
+
+    def save(self, directory: str):
+        if not self.skipped:
+            return
+
+        save_skipped(directory=directory, role=self.role, skipped=self.skipped)
+
+        btul.logging.debug(
+            f"{sum(x['members'] for x in self.skipped.values())} member(s) not needed by the {self.role} skipped ({sum(x['bytes'] for x in self.skipped.values())} bytes)",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+
+def get_role_filter(role: str):
+    # Everything but the directories of the other roles
+    return PathFilter(
+        excluded=[f"subvortex/{x}" for x in sauc.SV_EXECUTION_ROLES if x != role],
+        role=role,
+    )
+
+
+def load_skipped(directory: str):
+    """
+    Return the record of the members skipped when extracting `directory`, if any.
+    """
+    path = os.path.join(directory, sauc.SV_ASSET_SKIPPED_FILE)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_skipped(directory: str, role: str, skipped: dict):
+    path = os.path.join(directory, sauc.SV_ASSET_SKIPPED_FILE)
+
+    # Nothing left to extract
+    if not skipped:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+
+    with open(path, "w") as f:
+        json.dump({"role": role, "skipped": skipped}, f, indent=2)
+
+
+def extract_stream(
+    fileobj,
+    directory: str,
+    dedup: saudd.DedupIndex = None,
+    include: PathFilter = None,
+):
+    """
+    Extract a gzipped tarball read sequentially from `fileobj` into a staging
+    directory created in `directory`, each member being written as soon as its
+    bytes are read. Return the staging directory and the top-level directory.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=directory)
+
+    top_level_dir = None
+    try:
+        with (
+            tarfile.open(fileobj=fileobj, mode="r|gz") as tar,
+            Extractor(path=staging_dir, dedup=dedup) as extractor,
+        ):
+            for member in tar:
+                # Get top-level directory from the first member
+                if top_level_dir is None:
+                    top_level_dir = member.name.split("/")[0]
+
+                # Skip the members not needed
+                if include and not include(member):
+                    continue
+
+                extractor.extract(tar=tar, member=member)
+
+        if not top_level_dir:
+            raise ValueError("Could not determine top-level directory from archive.")
+
+        if include:
+            include.save(os.path.join(staging_dir, top_level_dir))
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    return staging_dir, top_level_dir
+
+
+class Extractor:
+    """
+    Extract the members of a tarball into `path`. The tarball is read and
+    decompressed on the calling thread, the files are written and synced to disk in
+    batches by a bounded pool of threads, their directories once the extraction is
+    closed.
+    """
+
+    # Files handed to a thread at once, a thread per file costs more than a write
+    BATCH_FILES = 64
+    BATCH_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        dedup: saudd.DedupIndex = None,
+        workers: int = None,
+        sync: bool = None,
+    ):
+        self.path = os.path.abspath(path)
+        self.dedup = dedup
+        self.workers = max(1, workers or sauc.SV_EXTRACT_WORKERS)
+        self.sync = sauc.SV_EXTRACT_FSYNC if sync is None else sync
+        self.files = 0
+        self.bytes = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+        self._futures = []
+        self._batch = []
+        self._batch_bytes = 0
+        self._created = set()
+        self._directories = []
+        self._error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return
+
+        # Let the writes in progress finish, the caller removes the files
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def extract(self, tar, member):
+        # Stop at the first failed write rather than at the end
+        if self._error:
+            raise self._error
+
+        target = os.path.abspath(os.path.join(self.path, member.name))
+        is_inside = target.startswith(self.path + os.sep)
+
+        # The target directory itself, e.g. "./"
+        if target == self.path and member.isdir():
+            return
+
+        # Never write outside the target directory, e.g. "../evil"
+        if not is_inside:
+            raise saue.UnsafeArchiveMemberError(
+                archive_path=tar.name or "<stream>", member=member.name
+            )
+
+        if member.isdir():
+            self._makedirs(target)
+            self._directories.append((target, member))
+            return
+
+        if not member.isreg():
+            # A link may point to a file being written
+            self.wait()
+            self._extract_special(tar, member)
+            return
+
+        # Decompress here, the members of a tarball can only be read in order
+        data = tar.extractfile(member).read()
+
+        # Create the directories here, the threads only write files
+        self._makedirs(os.path.dirname(target))
+
+        self._batch.append((target, data, member))
+        self._batch_bytes += len(data)
+        if (
+            len(self._batch) >= self.BATCH_FILES
+            or self._batch_bytes >= self.BATCH_BYTES
+        ):
+            self._submit()
+
+        self.files += 1
+        self.bytes += len(data)
+
+    def _extract_special(self, tar, member):
+        # Let tarfile reject links escaping the target directory, where supported
+        if hasattr(tarfile, "data_filter"):
+            try:
+                tar.extract(member, path=self.path, filter="data")
+            except tarfile.FilterError as e:
+                raise saue.UnsafeArchiveMemberError(
+                    archive_path=tar.name or "<stream>", member=member.name
+                ) from e
+            return
+
+        tar.extract(member, path=self.path)
+
+    def wait(self):
+        self._submit()
+
+        # Raise the first error of a write, if any
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+        # Set the attributes of the directories last, writing their files changes them
+        for target, member in reversed(self._directories):
+            os.chmod(target, member.mode & 0o777)
+            os.utime(target, (member.mtime, member.mtime))
+
+        if self.sync:
+            self._sync()
+
+    def _makedirs(self, directory: str):
+        if directory in self._created:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        self._created.add(directory)
+
+    def _submit(self):
+        if not self._batch:
+            return
+
+        batch, self._batch, self._batch_bytes = self._batch, [], 0
+
+        # Bound the memory used by the batches waiting to be written
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write_batch, batch)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._on_written)
+        self._futures.append(future)
+
+    def _on_written(self, future):
+        self._slots.release()
+
+        if not future.cancelled() and future.exception() and not self._error:
+            self._error = future.exception()
+
+    def _write_batch(self, batch: list):
+        for target, data, member in batch:
+            self._write(target, data, member)
+
+    def _write(self, target: str, data: bytes, member):
+        if self.dedup and self.dedup.has_size(len(data)):
+            if os.path.lexists(target):
+                os.remove(target)
+
+            if self.dedup.link(data, target, mode=member.mode):
+                return
+
+        # Never write through a link, which may come from an earlier member
+        if os.path.islink(target):
+            os.remove(target)
+
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            self._write_all(fd, data)
+            os.fchmod(fd, member.mode & 0o777)
+            os.utime(fd, (member.mtime, member.mtime))
+
+            # Sync here, in parallel with the other writes, and only the files extracted
+            if self.sync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _write_all(self, fd: int, data: bytes):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def _sync(self):
+        # Persist the entries of the extracted tree, the files are synced when written
+        for directory in sorted(self._created | {self.path}, reverse=True):
+            sync_directory(directory)
+
+
+def sync_directory(directory: str):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def promote(staging_dir: str, top_level_dir: str, directory: str):
+    """
+    Move the directory extracted in `staging_dir` into `directory` with a rename,
+    marked as complete, so a version directory is never seen half-extracted.
+    """
+    # Build the target directory
+    target_dir = os.path.join(directory, top_level_dir)
+
+    source_dir = os.path.join(staging_dir, top_level_dir)
+    if not os.path.isdir(source_dir):
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise saue.MissingDirectoryError(directory_path=target_dir)
+
+    # Mark the directory as complete, the marker moves with it
+    with open(os.path.join(source_dir, sauc.SV_ASSET_COMPLETE_MARKER), "w") as f:
+        f.write(f"{time.time()}\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Move any previous directory aside, it is removed with the staging directory
+    if os.path.lexists(target_dir):
+        os.replace(target_dir, os.path.join(staging_dir, ".previous"))
+
+    # Move the extracted directory in place
+    os.replace(source_dir, target_dir)
+
+    # Persist the rename, the version is only complete once it survives a crash
+    if sauc.SV_EXTRACT_FSYNC:
+        sync_directory(directory)
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    btul.logging.trace(
+        f"Staging {staging_dir} moved into {target_dir}",
+        prefix=sauc.SV_LOGGER_NAME,
+    )
+
+    return target_dir
+
+
+def _is_under(relpath: str, prefix: str):
+    return relpath == prefix or relpath.startswith(f"{prefix}/")
@@ -0,0 +1,290 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import json
+import time
+import argparse
+import threading
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+
+
+class ArchiveCache:
+    """
+    Cache of the release archives, stored by digest and indexed by role and version,
+    so a rollback or a re-pull of a recent version does not download it again.
+
+    The archives are kept within SV_ARCHIVE_CACHE_SIZE bytes, the least recently used
+    ones being evicted first.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self.directory or os.path.join(sauc.SV_ASSET_DIR, ".cache", "archives")
+
+    @property
+    def index(self):
+        return os.path.join(self.path, "index.json")
+
+    def get(self, version: str, role: str):
+        with self._lock:
+            self._load()
+
+            sha256 = self._find(version=version, role=role)
+            if sha256 is None:
+                self.misses += 1
+                self._save()
+                return None
+
+            # Refresh the entry so it is not evicted
+            self.entries[sha256]["accessed_at"] = time.time()
+            self.hits += 1
+            self._save()
+
+            btul.logging.debug(
+                f"Archive {role}-{version} found in cache ({self._stats()})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            return self._get_blob_path(sha256)
+
+    def contains(self, version: str, role: str):
+        with self._lock:
+            self._load()
+            return self._find(version=version, role=role) is not None
+
+    def owns(self, path: str):
+        return os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.path)
+
+    def put(self, version: str, role: str, path: str, sha256: str):
+        if sauc.SV_ARCHIVE_CACHE_SIZE <= 0:
+            return False
+
+        with self._lock:
+            self._load()
+
+            os.makedirs(self.path, exist_ok=True)
+
+            # Same content, same blob
+            blob_path = self._get_blob_path(sha256)
+            if not os.path.exists(blob_path):
+                os.replace(path, blob_path)
+
+            now = time.time()
+            entry = self.entries.setdefault(
+                sha256, {"size": os.path.getsize(blob_path), "keys": []}
+            )
+            entry["accessed_at"] = now
+            entry.setdefault("stored_at", now)
+
+            # A version is only stored once
+            key = self._get_key(version=version, role=role)
+            for other in self.entries.values():
+                if key in other["keys"]:
+                    other["keys"].remove(key)
+            entry["keys"].append(key)
+
+            self._evict()
+            self._save()
+
+            btul.logging.trace(
+                f"Archive {key} cached as {blob_path} ({self._stats()})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            return True
+
+    def list(self):
+        with self._lock:
+            self._load()
+            return sorted(
+                ({"sha256": sha256, **entry} for sha256, entry in self.entries.items()),
+                key=lambda x: x["accessed_at"],
+                reverse=True,
+            )
+
+    def purge(self, version: str = None, role: str = None):
+        with self._lock:
+            self._load()
+
+            key = self._get_key(version=version, role=role) if version else None
+            removed = [
+                sha256
+                for sha256, entry in self.entries.items()
+                if key is None or key in entry["keys"]
+            ]
+
+            for sha256 in removed:
+                self._remove(sha256)
+
+            self._save()
+
+            return len(removed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._load()
+            return self._stats()
+
+    def _stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "size": sum(x["size"] for x in self.entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _find(self, version: str, role: str):
+        key = self._get_key(version=version, role=role)
+        for sha256, entry in self.entries.items():
+            if key in entry["keys"] and os.path.isfile(self._get_blob_path(sha256)):
+                return sha256
+
+        return None
+
+    def _get_key(self, version: str, role: str):
+        return f"{role}-{version}"
+
+    def _get_blob_path(self, sha256: str):
+        return os.path.join(self.path, f"{sha256}.tar.gz")
+
+    def _load(self):
+        # Read the index again each time, the cli may have changed it in the meantime
+        self.entries = {}
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+        if not os.path.isfile(self.index):
+            return
+
+        try:
+            with open(self.index, "r", encoding="utf-8") as f:
+                content = json.load(f)
+
+            self.entries = content.get("entries", {})
+            self.hits = content.get("hits", 0)
+            self.misses = content.get("misses", 0)
+            self.evictions = content.get("evictions", 0)
+        except (OSError, ValueError) as e:
+            # A corrupted index is not an error, the cache is rebuilt
+            btul.logging.warning(
+                f"⚠️ Could not load archive cache {self.index}: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            self.entries = {}
+
+        # Forget the archives removed behind our back
+        for sha256 in list(self.entries):
+            if not os.path.isfile(self._get_blob_path(sha256)):
+                del self.entries[sha256]
+
+    def _evict(self):
+        # Remove the least recently used archives above the budget
+        size = sum(x["size"] for x in self.entries.values())
+        for sha256, entry in sorted(
+            self.entries.items(), key=lambda x: x[1]["accessed_at"]
+        ):
+            if size <= sauc.SV_ARCHIVE_CACHE_SIZE:
+                break
+
+            size -= entry["size"]
+            self._remove(sha256)
+            self.evictions += 1
+
+    def _remove(self, sha256: str):
+        self.entries.pop(sha256, None)
+
+        blob_path = self._get_blob_path(sha256)
+        if os.path.exists(blob_path):
+            os.remove(blob_path)
+
+    def _save(self):
+        # Write in a temporary file first so a crash never leaves a truncated index
+        temp_file = f"{self.index}.tmp"
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "entries": self.entries,
+                        "hits": self.hits,
+                        "misses": self.misses,
+                        "evictions": self.evictions,
+                    },
+                    f,
+                )
+
+            os.replace(temp_file, self.index)
+        except OSError as e:
+            btul.logging.warning(
+                f"⚠️ Could not save archive cache {self.index}: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Manage the release archive cache")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List the cached archives")
+
+    purge_parser = subparsers.add_parser("purge", help="Remove cached archives")
+    purge_parser.add_argument("--version", help="Only remove this version")
+    purge_parser.add_argument(
+        "--role", default=sauc.SV_EXECUTION_ROLE, help="Role of the version"
+    )
+
+    config = parser.parse_args(args)
+
+    cache = ArchiveCache()
+
+    if config.command == "purge":
+        count = cache.purge(version=config.version, role=config.role)
+        print(f"{count} archive(s) removed")
+
+    for entry in cache.list():
+        accessed_at = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(entry["accessed_at"])
+        )
+        print(
+            f"{entry['sha256'][:12]}  {entry['size']:>12}  {accessed_at}  {', '.join(entry['keys'])}"
+        )
+
+    stats = cache.stats()
+    print(
+        f"{stats['entries']} archive(s), {stats['size']} bytes, "
+        f"hit rate {stats['hit_rate']:.0%} ({stats['hits']} hits, {stats['misses']} misses), "
+        f"{stats['evictions']} eviction(s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import json
+from typing import Dict
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+
+# Instances a service can run as, the new one starts as the other one
+INSTANCES = ["blue", "green"]
+
+
+def get_instances_file():
+    return os.path.join(sauc.SV_ASSET_DIR, sauc.SV_INSTANCES_FILE)
+
+
+def load_instances() -> Dict[str, str]:
+    try:
+        with open(get_instances_file(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        # No service has been upgraded side by side yet
+        return {}
+    except (OSError, ValueError) as e:
+        btul.logging.warning(
+            f"⚠️ Could not load the service instances: {e}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+        return {}
+
+
+def get_instance(service_id: str):
+    return load_instances().get(service_id, INSTANCES[0])
+
+
+def get_other_instance(instance: str):
+    return INSTANCES[1] if instance == INSTANCES[0] else INSTANCES[0]
+
+
+def set_instance(service_id: str, instance: str):
+    instances = load_instances()
+    instances[service_id] = instance
+
+    # Write in a temporary file first so a crash never leaves a truncated file
+    path = get_instances_file()
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(instances, f)
+
+    os.replace(temp_file, path)
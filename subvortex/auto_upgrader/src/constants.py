@@ -27,9 +27,85 @@ SV_EXECUTION_DIR = os.path.abspath(os.path.expanduser("~/subvortex"))
 # Time in seconds to run the check of new release
 SV_CHECK_INTERVAL = int(os.getenv("SUBVORTEX_CHECK_INTERVAL", 60))
 
+# Time in seconds between two checks of new release to prefetch, 0 to disable
+SV_PREFETCH_INTERVAL = int(os.getenv("SUBVORTEX_PREFETCH_INTERVAL", 15))
+
 # Github
 SV_GITHUB_TOKEN = os.getenv("SUBVORTEX_GITHUB_TOKEN")
 
+# Time in seconds an unused cached GitHub response is kept on disk
+SV_HTTP_CACHE_TTL = int(os.getenv("SUBVORTEX_HTTP_CACHE_TTL", 7 * 24 * 60 * 60))
+
+# Maximum number of GitHub responses kept in the cache
+SV_HTTP_CACHE_MAX_ENTRIES = int(os.getenv("SUBVORTEX_HTTP_CACHE_MAX_ENTRIES", 64))
+
+# Number of connections kept alive per host
+SV_HTTP_POOL_SIZE = int(os.getenv("SUBVORTEX_HTTP_POOL_SIZE", 10))
+
+# Time in seconds to wait for a connection and between two received bytes
+SV_HTTP_CONNECT_TIMEOUT = float(os.getenv("SUBVORTEX_HTTP_CONNECT_TIMEOUT", 10))
+SV_HTTP_READ_TIMEOUT = float(os.getenv("SUBVORTEX_HTTP_READ_TIMEOUT", 60))
+
+# Retries of a request failing on a connection error or a 5xx
+SV_HTTP_MAX_RETRIES = int(os.getenv("SUBVORTEX_HTTP_MAX_RETRIES", 3))
+SV_HTTP_BACKOFF_FACTOR = float(os.getenv("SUBVORTEX_HTTP_BACKOFF_FACTOR", 0.5))
+
+# Size in bytes of the chunks read from the network and of the write buffer
+SV_DOWNLOAD_CHUNK_SIZE = int(os.getenv("SUBVORTEX_DOWNLOAD_CHUNK_SIZE", 1024 * 1024))
+SV_DOWNLOAD_BUFFER_SIZE = int(
+    os.getenv("SUBVORTEX_DOWNLOAD_BUFFER_SIZE", 4 * 1024 * 1024)
+)
+
+# Number of times an interrupted download is resumed before giving up
+SV_DOWNLOAD_MAX_RESUMES = int(os.getenv("SUBVORTEX_DOWNLOAD_MAX_RESUMES", 5))
+
+# Number of byte ranges of a release archive downloaded concurrently, 1 for a single stream
+SV_DOWNLOAD_SEGMENTS = int(os.getenv("SUBVORTEX_DOWNLOAD_SEGMENTS", 1))
+
+# Extract the release archive while it is downloaded, optionally keeping the archive on disk
+SV_DOWNLOAD_STREAMING = (
+    os.getenv("SUBVORTEX_DOWNLOAD_STREAMING", "False").lower() == "true"
+)
+SV_DOWNLOAD_KEEP_ARCHIVE = (
+    os.getenv("SUBVORTEX_DOWNLOAD_KEEP_ARCHIVE", "False").lower() == "true"
+)
+
+# Maximum size in bytes of the release archives kept for rollbacks and re-pulls, 0 to disable
+SV_ARCHIVE_CACHE_SIZE = int(os.getenv("SUBVORTEX_ARCHIVE_CACHE_SIZE", 0))
+
+# Build a new version from the installed one, getting only the files that changed
+SV_DELTA_UPDATE = os.getenv("SUBVORTEX_DELTA_UPDATE", "False").lower() == "true"
+
+# Number of versions pulled at the same time in container mode
+SV_PULL_CONCURRENCY = int(os.getenv("SUBVORTEX_PULL_CONCURRENCY", 3))
+
+# Number of threads writing the extracted files, and sync them to disk once extracted
+SV_EXTRACT_WORKERS = int(os.getenv("SUBVORTEX_EXTRACT_WORKERS", 4))
+SV_EXTRACT_FSYNC = os.getenv("SUBVORTEX_EXTRACT_FSYNC", "True").lower() == "true"
+
+# Link the extracted files identical to the ones of the other versions instead of copying them
+SV_DEDUP = os.getenv("SUBVORTEX_DEDUP", "False").lower() == "true"
+
+# Give a private copy to the linked files of a service before running its setup
+SV_DEDUP_BREAK_ON_WRITE = (
+    os.getenv("SUBVORTEX_DEDUP_BREAK_ON_WRITE", "True").lower() == "true"
+)
+
+# Paths of a version, besides the directory of the service, its setup writes in place
+SV_DEDUP_WRITABLE_PATHS = [
+    x.strip()
+    for x in os.getenv("SUBVORTEX_DEDUP_WRITABLE_PATHS", "").split(",")
+    if x.strip()
+]
+
+# Files and bytes per second deleted from the trash of the removed versions, 0 for no limit
+SV_TRASH_GC_FILES_PER_SECOND = int(
+    os.getenv("SUBVORTEX_TRASH_GC_FILES_PER_SECOND", 1000)
+)
+SV_TRASH_GC_BYTES_PER_SECOND = int(
+    os.getenv("SUBVORTEX_TRASH_GC_BYTES_PER_SECOND", 50 * 1024 * 1024)
+)
+
 # Prerelease
 SV_PRERELEASE_ENABLED = os.getenv("SUBVORTEX_PRERELEASE_ENABLED", "False").lower() == "true"
 SV_PRERELEASE_TYPE = os.getenv("SUBVORTEX_PRERELEASE_TYPE", "")
@@ -37,10 +113,65 @@ SV_PRERELEASE_TYPE = os.getenv("SUBVORTEX_PRERELEASE_TYPE", "")
 # Variables about execution
 SV_EXECUTION_ROLE = os.getenv("SUBVORTEX_EXECUTION_ROLE", "miner")
 SV_EXECUTION_METHOD = os.getenv("SUBVORTEX_EXECUTION_METHOD", "service")
+SV_EXECUTION_ROLES = ["miner", "validator"]
+
+# Number of services set up, stopped or started at the same time, among the ones not depending on each other
+SV_SERVICE_CONCURRENCY = int(os.getenv("SUBVORTEX_SERVICE_CONCURRENCY", 4))
+
+# Time in seconds a script of a service can run, unless its manifest sets one for the action, 0 for no limit
+SV_SCRIPT_TIMEOUT = int(os.getenv("SUBVORTEX_SCRIPT_TIMEOUT", 600))
+
+# Time in seconds a script is given to stop gracefully before being killed
+SV_SCRIPT_KILL_TIMEOUT = int(os.getenv("SUBVORTEX_SCRIPT_KILL_TIMEOUT", 10))
+
+# Number of the last lines of the output of a script reported when it fails
+SV_SCRIPT_OUTPUT_LINES = int(os.getenv("SUBVORTEX_SCRIPT_OUTPUT_LINES", 50))
+
+# Start the new instance of a service next to the previous one, and stop the previous one once the new one is ready
+SV_BLUE_GREEN = os.getenv("SUBVORTEX_BLUE_GREEN", "False").lower() == "true"
+
+# Time in seconds a service started has to pass its readiness probes, unless its manifest sets one
+SV_READINESS_TIMEOUT = int(os.getenv("SUBVORTEX_READINESS_TIMEOUT", 120))
+
+# Time in seconds between two checks of a readiness probe, doubling from the min to the max
+SV_READINESS_MIN_INTERVAL = float(os.getenv("SUBVORTEX_READINESS_MIN_INTERVAL", 0.05))
+SV_READINESS_MAX_INTERVAL = float(os.getenv("SUBVORTEX_READINESS_MAX_INTERVAL", 1))
+
+# Extract only the files of the release used by the execution role
+SV_EXTRACT_ROLE_ONLY = (
+    os.getenv("SUBVORTEX_EXTRACT_ROLE_ONLY", "False").lower() == "true"
+)
 
 # Variables about assets
 SV_ASSET_DIR = os.getenv("SUBVORTEX_ASSET_DIR", "/var/tmp/subvortex")
 
+# File marking a version directory as completely extracted
+SV_ASSET_COMPLETE_MARKER = ".complete"
+
+# File recording the parts of the release not extracted for the execution role
+SV_ASSET_SKIPPED_FILE = ".skipped.json"
+
+# File recording the instance (blue or green) each service upgraded side by side runs as
+SV_INSTANCES_FILE = ".instances.json"
+
+# File recording the previous versions kept until their soak period is over, and when it is
+SV_SOAKING_FILE = ".soaking.json"
+
+# Number of versions and bytes kept extracted for an instant rollback, besides the ones
+# in use, 0 for no limit (both 0 to only keep the ones in use), overridable per role
+SV_RETENTION_KEEP = int(
+    os.getenv(
+        f"SUBVORTEX_{SV_EXECUTION_ROLE.upper()}_RETENTION_KEEP",
+        os.getenv("SUBVORTEX_RETENTION_KEEP", 0),
+    )
+)
+SV_RETENTION_SIZE = int(
+    os.getenv(
+        f"SUBVORTEX_{SV_EXECUTION_ROLE.upper()}_RETENTION_SIZE",
+        os.getenv("SUBVORTEX_RETENTION_SIZE", 0),
+    )
+)
+
 # Variables about versions before releasing Auto Upgrader
 DEFAULT_LAST_RELEASE = {
     "global": "2.3.3",
@@ -50,3 +181,9 @@ DEFAULT_LAST_RELEASE = {
 }
 
 SV_DISABLE_ROLLBACK = os.getenv("SUBVORTEX_DISABLE_ROLLBACK", "False").lower() == "true"
+
+# Time in seconds the previous version is kept after an upgrade for an instant rollback, 0 to remove it right away
+SV_SOAK_PERIOD = int(os.getenv("SUBVORTEX_SOAK_PERIOD", 0))
+
+# Time in seconds the services have to pass their probes at each check of the soak period
+SV_SOAK_HEALTH_TIMEOUT = int(os.getenv("SUBVORTEX_SOAK_HEALTH_TIMEOUT", 30))
@@ -0,0 +1,155 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import hashlib
+import threading
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.delta as saudt
+import subvortex.auto_upgrader.src.utils as sauu
+
+
+class DedupIndex:
+    """
+    Files of the version directories already present in a directory, indexed by
+    size and hashed only when a file of the same size has to be written.
+    """
+
+    def __init__(self, directory: str = None, exclude: list = None):
+        self.directory = directory or sauc.SV_ASSET_DIR
+        self.linked = 0
+        self.bytes = 0
+
+        self._sizes = {}
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+        exclude = set(exclude or [])
+        if not os.path.isdir(self.directory):
+            return
+
+        for name in sorted(os.listdir(self.directory)):
+            version_dir = os.path.join(self.directory, name)
+            if (
+                not name.startswith("subvortex-")
+                or name in exclude
+                or os.path.islink(version_dir)
+                or not os.path.isdir(version_dir)
+            ):
+                continue
+
+            self._add_directory(version_dir)
+
+    def has_size(self, size: int):
+        # Empty files are not worth a link
+        return size > 0 and size in self._sizes
+
+    def find(self, size: int, sha256: str, mode: int = None):
+        for path in self._sizes.get(size, []):
+            if path not in self._hashes:
+                try:
+                    self._hashes[path] = saudt.hash_file(path)
+                except OSError:
+                    self._hashes[path] = None
+
+            if self._hashes[path] != sha256:
+                continue
+
+            # A linked file shares its mode
+            if mode is not None and os.stat(path).st_mode & 0o777 != mode & 0o777:
+                continue
+
+            return path
+
+        return None
+
+    def link(self, data: bytes, target: str, mode: int = None):
+        """
+        Link `target` to an identical file of the index, if any. Return True if
+        linked, False if the caller has to write the file.
+        """
+        if not self.has_size(len(data)):
+            return False
+
+        source = self.find(len(data), hashlib.sha256(data).hexdigest(), mode=mode)
+        if source is None:
+            return False
+
+        saudt.link_file(source, target)
+
+        # Files may be linked by several threads
+        with self._lock:
+            self.linked += 1
+            self.bytes += len(data)
+
+        return True
+
+    def log(self, target_dir: str):
+        if not self.linked:
+            return
+
+        btul.logging.debug(
+            f"🔗 {self.linked} file(s) of {target_dir} shared with other versions ({self.bytes} bytes saved)",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+    def _add_directory(self, directory: str):
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                if os.path.islink(path) or not os.path.isfile(path):
+                    continue
+
+                self._sizes.setdefault(os.path.getsize(path), []).append(path)
+
+
+def break_links(directory: str):
+    """
+    Give a private copy to every file of `directory`, or to `directory` itself when
+    it is a file, sharing its inode with another version, so the ones written in
+    place (setup scripts, ...) do not change it. Return the number of links broken.
+    """
+    if not directory or not os.path.exists(directory):
+        return 0
+
+    paths = [directory]
+    if os.path.isdir(directory):
+        paths = [
+            os.path.join(root, x)
+            for root, _, filenames in os.walk(directory)
+            for x in filenames
+        ]
+
+    count = 0
+    for path in paths:
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+
+        if os.stat(path).st_nlink < 2:
+            continue
+
+        sauu.copy_file(path, path)
+        count += 1
+
+    if count:
+        btul.logging.trace(
+            f"{count} link(s) broken in {directory}", prefix=sauc.SV_LOGGER_NAME
+        )
+
+    return count
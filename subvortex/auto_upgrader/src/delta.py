@@ -0,0 +1,178 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import shutil
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+
+# ioctl cloning a file on copy-on-write file systems (btrfs, xfs)
+FICLONE = 0x40049409
+
+
+def hash_file(path: str):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(sauc.SV_DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def build_manifest(directory: str, candidates: dict = None):
+    """
+    Build the manifest (size, sha256 and mode per relative path) of the files of
+    `directory`. With `candidates`, only the files that may match one of them are
+    hashed.
+    """
+    files = {}
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if os.path.islink(path) or not os.path.isfile(path):
+                continue
+
+            relpath = os.path.relpath(path, directory).replace(os.sep, "/")
+            stat = os.stat(path)
+
+            # Hashing a file that cannot match is useless
+            candidate = candidates.get(relpath) if candidates is not None else None
+            if candidates is not None and (
+                candidate is None or candidate["size"] != stat.st_size
+            ):
+                continue
+
+            files[relpath] = {
+                "size": stat.st_size,
+                "sha256": hash_file(path),
+                "mode": stat.st_mode & 0o777,
+            }
+
+    return files
+
+
+def link_file(source: str, target: str):
+    # Clone the file when the file system supports it, writes never reach the source
+    try:
+        import fcntl
+
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+        shutil.copystat(source, target)
+        return "reflink"
+    except (ImportError, OSError):
+        if os.path.exists(target):
+            os.remove(target)
+
+    # Share the inode otherwise, files are always replaced and never written in place
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        shutil.copy2(source, target)
+        return "copy"
+
+
+def assemble(base_dir: str, manifest: dict, fetch, directory: str):
+    """
+    Assemble the version described by `manifest` into a staging directory created in
+    `directory`. Files identical in `base_dir` are linked, the others are got from
+    `fetch(relpath)` and verified. Return the staging directory and some statistics.
+    """
+    top_level_dir = manifest["top_level_dir"]
+    files = manifest["files"]
+
+    # Hash only the files of the base that may be reused
+    base_files = build_manifest(base_dir, candidates=files)
+
+    staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=directory)
+    root = os.path.join(staging_dir, top_level_dir)
+
+    stats = {"reused": 0, "fetched": 0, "bytes": 0}
+    try:
+        for relpath in manifest.get("directories", []):
+            os.makedirs(_get_path(root, relpath), exist_ok=True)
+
+        changed = []
+        for relpath, entry in files.items():
+            target = _get_path(root, relpath)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            base = base_files.get(relpath)
+            if not base or base["sha256"] != entry["sha256"]:
+                changed.append(relpath)
+                continue
+
+            source = os.path.join(base_dir, relpath)
+            if base["mode"] == entry.get("mode", base["mode"]):
+                link_file(source, target)
+            else:
+                # A linked file shares its mode, copy it to change it
+                shutil.copy2(source, target)
+                os.chmod(target, entry["mode"])
+
+            stats["reused"] += 1
+
+        def download(relpath: str):
+            entry = files[relpath]
+            data = fetch(relpath)
+
+            actual = hashlib.sha256(data).hexdigest()
+            if actual != entry["sha256"]:
+                raise saue.ChecksumMismatchError(
+                    file_path=relpath, expected=entry["sha256"], actual=actual
+                )
+
+            target = _get_path(root, relpath)
+            with open(target, "wb") as f:
+                f.write(data)
+
+            if "mode" in entry:
+                os.chmod(target, entry["mode"])
+
+            return len(data)
+
+        # Get the changed files concurrently, on the connections of the pool
+        with ThreadPoolExecutor(max_workers=sauc.SV_HTTP_POOL_SIZE) as executor:
+            for size in executor.map(download, changed):
+                stats["fetched"] += 1
+                stats["bytes"] += size
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    btul.logging.debug(
+        f"Delta of {top_level_dir}: {stats['reused']} file(s) reused, {stats['fetched']} fetched ({stats['bytes']} bytes)",
+        prefix=sauc.SV_LOGGER_NAME,
+    )
+
+    return staging_dir, stats
+
+
+def _get_path(root: str, relpath: str):
+    # Never write outside of the version directory
+    path = os.path.normpath(os.path.join(root, relpath))
+    if os.path.isabs(relpath) or not path.startswith(root + os.sep):
+        raise ValueError(f"Invalid path in manifest: {relpath}")
+
+    return path
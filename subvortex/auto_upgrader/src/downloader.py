@@ -0,0 +1,598 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import re
+import json
+import hashlib
+import threading
+import contextlib
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.http_client as sauhcl
+
+
+class Downloader:
+    """
+    Download files into a `.part` file, with a sidecar recording the url, validators and
+    expected length, so an interrupted download is resumed with a Range request.
+
+    When SV_DOWNLOAD_SEGMENTS is above 1, the file is split in byte ranges downloaded
+    concurrently and written at their offset in a preallocated file.
+
+    The SHA-256 of each downloaded file is kept in a `.verified` record, so a file
+    already downloaded is accepted with a stat rather than read again.
+    """
+
+    def __init__(self, session: requests.Session, cancelled: threading.Event = None):
+        self.session = session
+        self.cancelled = cancelled or threading.Event()
+
+    def download(
+        self, url: str, target_path: str, headers: dict = None, sha256: str = None
+    ):
+        part_path = f"{target_path}.part"
+        headers = headers or {}
+
+        digest = None
+        if sauc.SV_DOWNLOAD_SEGMENTS > 1:
+            digest = self._download_segmented(
+                url=url, part_path=part_path, headers=headers
+            )
+
+        if digest is None:
+            digest = self._download_stream(
+                url=url, part_path=part_path, headers=headers
+            )
+
+        if not digest:
+            return None
+
+        # Check the file is the one published
+        self._verify_checksum(path=part_path, expected=sha256, actual=digest)
+
+        # Move the complete file in place, a reader never sees a partial file
+        os.replace(part_path, target_path)
+        self._remove(self._get_sidecar_path(part_path))
+        self._save_record(path=target_path, sha256=digest)
+
+        return target_path
+
+    def is_verified(self, path: str, sha256: str = None):
+        # A file is verified if it has not changed since its digest was recorded
+        record = self._load_sidecar(self._get_record_path(path))
+        if not record or not os.path.isfile(path):
+            return False
+
+        stat = os.stat(path)
+        if (
+            record.get("size") != stat.st_size
+            or record.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            return False
+
+        return sha256 is None or record.get("sha256") == sha256.lower()
+
+    def verify(self, path: str, sha256: str):
+        # Hash the file and record its digest if it is the expected one
+        if self._hash_file(path=path) != sha256.lower():
+            return False
+
+        self._save_record(path=path, sha256=sha256.lower())
+        return True
+
+    def get_digest(self, path: str):
+        # Use the recorded digest if the file has not changed since
+        record = self._load_sidecar(self._get_record_path(path))
+        if self.is_verified(path):
+            return record["sha256"]
+
+        return self._hash_file(path=path)
+
+    def is_recorded(self, path: str):
+        return os.path.exists(self._get_record_path(path))
+
+    def remove(self, path: str):
+        # Remove the file and everything recorded about it
+        for x in (
+            path,
+            self._get_record_path(path),
+            f"{path}.part",
+            self._get_sidecar_path(f"{path}.part"),
+        ):
+            self._remove(x)
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        url: str,
+        target_path: str = None,
+        headers: dict = None,
+        sha256: str = None,
+    ):
+        """
+        Open the file as a readable stream, for consumers processing the bytes as they
+        arrive. When `target_path` is set the bytes are also written into its `.part`
+        file, moved in place once complete or left to be resumed otherwise.
+        """
+        part_path = f"{target_path}.part" if target_path else None
+
+        with self.session.get(
+            url, headers=headers or {}, stream=True, timeout=sauhcl.get_timeout()
+        ) as response:
+            if response.status_code == 404:
+                yield None
+                return
+
+            response.raise_for_status()
+
+            expected_length = self._get_expected_length(response=response, offset=0)
+
+            if part_path:
+                self._save_sidecar(
+                    self._get_sidecar_path(part_path),
+                    {
+                        "url": url,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "expected_length": expected_length,
+                    },
+                )
+
+            stream = DownloadStream(
+                response=response, cancelled=self.cancelled, part_path=part_path
+            )
+            try:
+                yield stream
+
+                # Consume what the reader did not need, e.g. the tar padding
+                stream.drain()
+            finally:
+                stream.close()
+
+        # Check the whole file has been received
+        if expected_length is not None and stream.length != expected_length:
+            raise requests.ConnectionError(
+                f"Incomplete download: {stream.length}/{expected_length} bytes"
+            )
+
+        # Check the file is the one published
+        self._verify_checksum(
+            path=part_path or url, expected=sha256, actual=stream.digest.hexdigest()
+        )
+
+        if part_path:
+            os.replace(part_path, target_path)
+            self._remove(self._get_sidecar_path(part_path))
+            self._save_record(path=target_path, sha256=stream.digest.hexdigest())
+
+    def _download_stream(self, url: str, part_path: str, headers: dict):
+        attempt = 0
+        while True:
+            try:
+                return self._download_part(
+                    url=url, part_path=part_path, headers=headers
+                )
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                # Connection dropped or stalled mid-stream, what has been written is kept
+                attempt += 1
+                if attempt > sauc.SV_DOWNLOAD_MAX_RESUMES:
+                    raise
+
+                btul.logging.warning(
+                    f"⚠️ Download of {url} interrupted ({e}), resuming ({attempt}/{sauc.SV_DOWNLOAD_MAX_RESUMES})",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+
+    def _download_segmented(self, url: str, part_path: str, headers: dict):
+        # Keep resuming a previous single stream download rather than losing it
+        sidecar = self._load_sidecar(self._get_sidecar_path(part_path))
+        if sidecar.get("url") == url and os.path.exists(part_path):
+            return None
+
+        response = self.session.head(
+            url, headers=headers, allow_redirects=True, timeout=sauhcl.get_timeout()
+        )
+        if response.status_code == 404:
+            return False
+
+        length = int(response.headers.get("Content-Length") or 0)
+        if (
+            not response.ok
+            or response.headers.get("Accept-Ranges") != "bytes"
+            or length < sauc.SV_DOWNLOAD_SEGMENTS * sauc.SV_DOWNLOAD_CHUNK_SIZE
+        ):
+            # No range support or too small to be worth it, use a single stream
+            btul.logging.debug(
+                f"Segmented download not possible for {url}, using a single stream",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return None
+
+        # Make sure every segment comes from the same version of the file
+        validator = response.headers.get("ETag") or response.headers.get(
+            "Last-Modified"
+        )
+
+        # Preallocate the file so each segment can be written at its offset
+        with open(part_path, "wb") as f:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, length)
+            else:
+                f.truncate(length)
+
+        # Build the byte ranges, the last one takes the remainder
+        size = length // sauc.SV_DOWNLOAD_SEGMENTS
+        ranges = [
+            (i * size, (i + 1) * size - 1) for i in range(sauc.SV_DOWNLOAD_SEGMENTS)
+        ]
+        ranges[-1] = (ranges[-1][0], length - 1)
+
+        btul.logging.debug(
+            f"Downloading {url} in {len(ranges)} segments",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        aborted = threading.Event()
+        fd = os.open(part_path, os.O_WRONLY)
+        try:
+            # Do not open more connections than the pool keeps alive
+            workers = min(len(ranges), sauc.SV_HTTP_POOL_SIZE)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_segment,
+                        url=url,
+                        fd=fd,
+                        start=start,
+                        end=end,
+                        headers=headers,
+                        validator=validator,
+                        aborted=aborted,
+                    )
+                    for start, end in ranges
+                ]
+
+                try:
+                    completed = all(x.result() for x in futures)
+                except BaseException:
+                    # Stop the other segments
+                    aborted.set()
+                    raise
+
+            os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            self._remove(part_path)
+            raise
+
+        os.close(fd)
+
+        if not completed:
+            # The range was not honoured, the file may have changed
+            self._remove(part_path)
+            return None
+
+        # Segments arrive out of order, hash the file once complete
+        return self._hash_file(path=part_path)
+
+    def _download_segment(
+        self,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        headers: dict,
+        validator: str,
+        aborted: threading.Event,
+    ):
+        offset = start
+
+        attempt = 0
+        while True:
+            request_headers = {**headers, "Range": f"bytes={offset}-{end}"}
+            if validator:
+                request_headers["If-Range"] = validator
+
+            try:
+                with self.session.get(
+                    url,
+                    headers=request_headers,
+                    stream=True,
+                    timeout=sauhcl.get_timeout(),
+                ) as response:
+                    response.raise_for_status()
+
+                    if (
+                        response.status_code != 206
+                        or self._get_range_start(response) != offset
+                    ):
+                        aborted.set()
+                        return False
+
+                    for chunk in response.iter_content(
+                        chunk_size=sauc.SV_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        if self.cancelled.is_set():
+                            raise saue.OperationCancelledError(action="download")
+
+                        if aborted.is_set():
+                            return False
+
+                        if chunk:
+                            # Never write past the end of the segment
+                            chunk = chunk[: end + 1 - offset]
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+
+                if offset > end:
+                    return True
+
+                raise requests.ConnectionError(
+                    f"Incomplete segment: {offset - start}/{end + 1 - start} bytes"
+                )
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                attempt += 1
+                if attempt > sauc.SV_DOWNLOAD_MAX_RESUMES:
+                    raise
+
+                btul.logging.warning(
+                    f"⚠️ Segment {start}-{end} of {url} interrupted ({e}), resuming ({attempt}/{sauc.SV_DOWNLOAD_MAX_RESUMES})",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+
+    def _verify_checksum(self, path: str, expected: str, actual: str):
+        if not expected or actual == expected.lower():
+            return
+
+        # A corrupted file must not be resumed
+        if os.path.exists(path):
+            self._remove(path)
+            self._remove(self._get_sidecar_path(path))
+
+        raise saue.ChecksumMismatchError(
+            file_path=path, expected=expected, actual=actual
+        )
+
+    def _hash_file(self, path: str, digest=None):
+        digest = digest or hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(sauc.SV_DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def _download_part(self, url: str, part_path: str, headers: dict):
+        sidecar_path = self._get_sidecar_path(part_path)
+
+        # Resume only if the part has been downloaded from the same url
+        sidecar = self._load_sidecar(sidecar_path)
+        offset = (
+            os.path.getsize(part_path)
+            if sidecar.get("url") == url and os.path.exists(part_path)
+            else 0
+        )
+
+        request_headers = dict(headers)
+        if offset > 0:
+            request_headers["Range"] = f"bytes={offset}-"
+
+            # Get the whole file again if it has changed since the part was downloaded
+            validator = sidecar.get("etag") or sidecar.get("last_modified")
+            if validator:
+                request_headers["If-Range"] = validator
+
+        with self.session.get(
+            url, headers=request_headers, stream=True, timeout=sauhcl.get_timeout()
+        ) as response:
+            if response.status_code == 404:
+                return False
+
+            if response.status_code == 416 and offset > 0:
+                if offset == sidecar.get("expected_length"):
+                    # The part was already complete
+                    return self._hash_file(path=part_path)
+
+                # The part is not consistent with the remote file anymore, start over
+                self._remove(part_path)
+                self._remove(sidecar_path)
+                return self._download_part(
+                    url=url, part_path=part_path, headers=headers
+                )
+
+            response.raise_for_status()
+
+            if (
+                response.status_code == 206
+                and self._get_range_start(response) == offset
+            ):
+                mode = "ab"
+                btul.logging.debug(
+                    f"Resuming download of {url} at byte {offset}",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+            else:
+                # Range not honoured or file changed, the body is the whole file
+                mode = "wb"
+                offset = 0
+
+            # Hash the bytes already on disk, the rest is hashed as it arrives
+            digest = hashlib.sha256()
+            if mode == "ab":
+                self._hash_file(path=part_path, digest=digest)
+
+            expected_length = self._get_expected_length(
+                response=response, offset=offset
+            )
+
+            # Record what is being downloaded before writing any byte
+            self._save_sidecar(
+                sidecar_path,
+                {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "expected_length": expected_length,
+                },
+            )
+
+            with open(part_path, mode, buffering=sauc.SV_DOWNLOAD_BUFFER_SIZE) as f:
+                for chunk in response.iter_content(
+                    chunk_size=sauc.SV_DOWNLOAD_CHUNK_SIZE
+                ):
+                    if self.cancelled.is_set():
+                        raise saue.OperationCancelledError(action="download")
+
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Check the whole file has been received
+        size = os.path.getsize(part_path)
+        if expected_length is not None and size != expected_length:
+            raise requests.ConnectionError(
+                f"Incomplete download: {size}/{expected_length} bytes"
+            )
+
+        return digest.hexdigest()
+
+    def _get_range_start(self, response: requests.Response):
+        # Content-Range: bytes <start>-<end>/<total>
+        match = re.match(
+            r"bytes (\d+)-\d+/(?:\d+|\*)", response.headers.get("Content-Range", "")
+        )
+        return int(match.group(1)) if match else None
+
+    def _get_expected_length(self, response: requests.Response, offset: int):
+        content_range = response.headers.get("Content-Range", "")
+        match = re.match(r"bytes \d+-\d+/(\d+)", content_range)
+        if match:
+            return int(match.group(1))
+
+        content_length = response.headers.get("Content-Length")
+        if content_length is None:
+            return None
+
+        return offset + int(content_length)
+
+    def _get_sidecar_path(self, part_path: str):
+        return f"{part_path}.json"
+
+    def _get_record_path(self, path: str):
+        return f"{path}.verified"
+
+    def _save_record(self, path: str, sha256: str):
+        stat = os.stat(path)
+        self._save_sidecar(
+            self._get_record_path(path),
+            {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+        )
+
+    def _load_sidecar(self, path: str):
+        if not os.path.exists(path):
+            return {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_sidecar(self, path: str, content: dict):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(content, f)
+
+    def _remove(self, path: str):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class DownloadStream:
+    """
+    File-like reader over the body of a response, hashing the bytes read and copying
+    them into `part_path` if set.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        cancelled: threading.Event,
+        part_path: str = None,
+    ):
+        self.chunks = response.iter_content(chunk_size=sauc.SV_DOWNLOAD_CHUNK_SIZE)
+        self.cancelled = cancelled
+        self.buffer = bytearray()
+        self.digest = hashlib.sha256()
+        self.length = 0
+        self.file = (
+            open(part_path, "wb", buffering=sauc.SV_DOWNLOAD_BUFFER_SIZE)
+            if part_path
+            else None
+        )
+
+    def read(self, size: int = -1):
+        # Fill the buffer with enough bytes
+        while size < 0 or len(self.buffer) < size:
+            if self.cancelled.is_set():
+                raise saue.OperationCancelledError(action="download")
+
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+
+            self.digest.update(chunk)
+            self.length += len(chunk)
+            if self.file:
+                self.file.write(chunk)
+
+            self.buffer += chunk
+
+        if size < 0:
+            size = len(self.buffer)
+
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+
+        return data
+
+    def drain(self):
+        while self.read(sauc.SV_DOWNLOAD_CHUNK_SIZE):
+            pass
+
+    def close(self):
+        if not self.file:
+            return
+
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
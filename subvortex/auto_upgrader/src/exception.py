@@ -141,6 +141,81 @@ class PackageNotFoundError(AutoUpgraderError):
         )
 
 
+class OperationCancelledError(AutoUpgraderError):
+    def __init__(self, action: str):
+        super().__init__(
+            code="AU1015",
+            message="Operation cancelled",
+            details=f"Action: {action}",
+        )
+
+
+class ChecksumMismatchError(AutoUpgraderError):
+    def __init__(self, file_path: str, expected: str, actual: str):
+        super().__init__(
+            code="AU1016",
+            message="Checksum mismatch",
+            details=f"File: {file_path}, Expected: {expected}, Actual: {actual}",
+        )
+
+
+class AssetsPullError(AutoUpgraderError):
+    def __init__(self, versions: list, details: str):
+        super().__init__(
+            code="AU1017",
+            message=f"Failed to pull assets of version(s) {', '.join(versions)}",
+            details=details,
+        )
+
+
+class InvalidPlanError(AutoUpgraderError):
+    def __init__(self, details: str):
+        super().__init__(code="AU1018", message="Invalid plan", details=details)
+
+
+class CyclicDependencyError(AutoUpgraderError):
+    def __init__(self, cycle: list):
+        super().__init__(
+            code="AU1019",
+            message="Cyclic dependency detected",
+            details=" -> ".join(cycle),
+        )
+
+
+class UnknownDependencyError(AutoUpgraderError):
+    def __init__(self, service: str, dependency: str):
+        super().__init__(
+            code="AU1020",
+            message="Unknown dependency",
+            details=f"Service {service} depends on unknown service {dependency}",
+        )
+
+
+class InvalidProbeError(AutoUpgraderError):
+    def __init__(self, service: str, details: str):
+        super().__init__(
+            code="AU1021",
+            message=f"Invalid readiness probe for {service}",
+            details=details,
+        )
+
+
+class ServiceNotReadyError(AutoUpgraderError):
+    def __init__(self, service: str, details: str):
+        super().__init__(
+            code="AU1022", message=f"Service {service} is not ready", details=details
+        )
+
+
+class UnsafeArchiveMemberError(AutoUpgraderError):
+    def __init__(self, archive_path: str, member: str):
+        super().__init__(
+            code="AU1023",
+            message="Unsafe archive member",
+            details=f"Archive: {archive_path}, Member {member} is outside the target directory",
+        )
+
+
 class UnexpectedError(AutoUpgraderError):
     def __init__(self, reason: str = "An unexpected error occurred"):
         super().__init__(
@@ -16,10 +16,12 @@
 # DEALINGS IN THE SOFTWARE.
 import os
 import re
-import time
 import json
 import shutil
+import asyncio
 import tarfile
+import tempfile
+import threading
 import requests
 import importlib
 import subprocess
@@ -32,6 +34,14 @@ import subvortex.auto_upgrader.src.constants as sauc
 import subvortex.auto_upgrader.src.version as sauv
 import subvortex.auto_upgrader.src.exception as saue
 import subvortex.auto_upgrader.src.utils as sauu
+import subvortex.auto_upgrader.src.http_cache as sauhc
+import subvortex.auto_upgrader.src.http_client as sauhcl
+import subvortex.auto_upgrader.src.downloader as saudl
+import subvortex.auto_upgrader.src.archive as saua
+import subvortex.auto_upgrader.src.archive_cache as sauac
+import subvortex.auto_upgrader.src.delta as saudt
+import subvortex.auto_upgrader.src.dedup as saudd
+import subvortex.auto_upgrader.src.path as saup
 
 
 class Github:
@@ -40,23 +50,31 @@ class Github:
         self.repo_name = repo_name
         self.latest_versions = {}
         self.local_versions = {}
+        self.http_cache = sauhc.HttpCache()
+        self.session = sauhcl.create_session()
+        self.cancelled = threading.Event()
+        self.archive_cache = sauac.ArchiveCache()
+        self.downloader = saudl.Downloader(
+            session=self.session, cancelled=self.cancelled
+        )
 
-    def get_local_version(self):
+    async def get_local_version(self):
         version = None
 
         if sauc.SV_EXECUTION_METHOD == "container":
-            version = self._get_local_container_version()
+            version = await self._get_local_container_version()
         else:
             version = self._get_local_version()
 
         return version
 
-    def get_latest_version(self):
+    async def get_latest_version(self):
         version = None
         if sauc.SV_EXECUTION_METHOD == "container":
-            version = self._get_latest_container_version()
+            version = await self._get_latest_container_version()
         else:
-            version = self._get_latest_version()
+            # Network calls are blocking, run them outside of the event loop
+            version = await asyncio.to_thread(self._get_latest_version)
 
         return version
 
@@ -78,7 +96,59 @@ class Github:
 
         return versions
 
-    def download_and_unzip_assets(self, version: str, role: str):
+    async def download_and_unzip_assets(self, version: str, role: str):
+        # Downloading and extracting are blocking, run them outside of the event loop
+        return await asyncio.to_thread(
+            self.download_and_unzip_assets_sync, version=version, role=role
+        )
+
+    def download_and_unzip_assets_sync(self, version: str, role: str):
+        # Build the version from the installed one, unless the archive is already on disk
+        if (
+            sauc.SV_DELTA_UPDATE
+            and sauc.SV_EXECUTION_METHOD != "container"
+            and not self.archive_cache.contains(version=version, role=role)
+        ):
+            asset_path = self._download_delta_assets(version=version, role=role)
+            if asset_path:
+                return asset_path
+
+        # Download and extract in a single pass, unless the archive is already on disk
+        archive_path = self._get_archive_path(version=version, role=role)
+        if (
+            sauc.SV_DOWNLOAD_STREAMING
+            and not any(
+                os.path.exists(x) for x in (archive_path, f"{archive_path}.part")
+            )
+            and not self.archive_cache.contains(version=version, role=role)
+        ):
+            try:
+                asset_path = self._download_and_extract_assets(
+                    role=role, version=version
+                )
+                if not asset_path:
+                    btul.logging.warning(
+                        f"No assets available for version {version}",
+                        prefix=sauc.SV_LOGGER_NAME,
+                    )
+
+                # Keep the archive for a later reuse, if it has been kept
+                self._cache_archive(
+                    version=version, role=role, archive_path=archive_path
+                )
+
+                return asset_path
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                # Any byte kept on disk will be resumed by the regular download
+                btul.logging.warning(
+                    f"⚠️ Streaming of version {version} interrupted ({e}), downloading it instead",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+
         # Download the version
         archive_path = self._download_assets(role=role, version=version)
         if not archive_path:
@@ -88,33 +158,97 @@ class Github:
             return None
 
         # Unzip the version
-        asset_path = self._unzip_assets(archive_path=archive_path)
+        asset_path = self._unzip_assets(
+            archive_path=archive_path, include=self._get_include_filter(role=role)
+        )
 
-        # Remove the archive
-        if os.path.isfile(archive_path):
-            # Remove the archive
-            os.remove(archive_path)
+        # Move the archive into the cache, for a later rollback or re-pull
+        self._cache_archive(version=version, role=role, archive_path=archive_path)
 
-            # Log it
-            archive_name = os.path.basename(archive_path)
-            btul.logging.trace(
-                f"Archive {archive_name} removed", prefix=sauc.SV_LOGGER_NAME
+        return asset_path
+
+    async def complete_assets(self, version: str, role: str):
+        # Extracting is blocking, run it outside of the event loop
+        return await asyncio.to_thread(
+            self.complete_assets_sync, version=version, role=role
+        )
+
+    def complete_assets_sync(self, version: str, role: str):
+        """
+        Extract the members of the version skipped when it has been pulled and now
+        needed by `role`. Return the list of the extracted paths.
+        """
+        version_dir = saup.get_version_directory(version=version)
+        record = saua.load_skipped(directory=version_dir)
+        if not record:
+            return []
+
+        # Get the skipped paths still not needed
+        include = self._get_include_filter(role=role)
+        excluded = include.excluded if include else []
+
+        skipped = record["skipped"]
+        needed = [x for x in skipped if x not in excluded]
+        if not needed:
+            return []
+
+        btul.logging.info(
+            f"🧩 Extracting {', '.join(needed)} of version {version}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        # Get the archive the version has been extracted from
+        archive_role = record.get("role") or role
+        archive_path = self._download_assets(version=version, role=archive_role)
+        if not archive_path:
+            raise saue.MissingFileError(
+                file_path=self._get_archive_path(version=version, role=archive_role)
             )
 
-        return asset_path
+        staging_dir, top_level_dir, _ = self._extract_archive(
+            archive_path=archive_path, include=saua.PathFilter(included=needed)
+        )
 
-    def prune_images(self):
+        try:
+            for relpath in needed:
+                source = os.path.join(staging_dir, top_level_dir, relpath)
+                if not os.path.lexists(source):
+                    continue
+
+                # Move the extracted path in place
+                target = os.path.join(version_dir, relpath)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if os.path.isdir(target) and not os.path.islink(target):
+                    shutil.rmtree(target)
+                os.replace(source, target)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        # Keep the record of what is still skipped
+        saua.save_skipped(
+            directory=version_dir,
+            role=record.get("role"),
+            skipped={x: y for x, y in skipped.items() if x not in needed},
+        )
+
+        # Move the archive into the cache, for a later rollback or re-pull
+        self._cache_archive(
+            version=version, role=archive_role, archive_path=archive_path
+        )
+
+        return needed
+
+    async def prune_images(self):
         # Pull the floating tag image
         btul.logging.debug(f"Prune images", prefix=sauc.SV_LOGGER_NAME)
-        pull_result = subprocess.run(
-            ["docker", "image", "prune", "-f"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+        pull_result = await self._run_command("docker", "image", "prune", "-f")
         if pull_result.returncode != 0:
             btul.logging.warning(f"Failed to prune images", prefix=sauc.SV_LOGGER_NAME)
 
+    def cancel(self):
+        # Abort any download in progress, the check is done between two chunks
+        self.cancelled.set()
+
     def _is_valid_release_or_prerelease(self, tag_name: str) -> bool:
         try:
             version = Version(tag_name)
@@ -148,108 +282,367 @@ class Github:
 
         return []
 
-    def _download_assets(self, version: str, role: str):
-        # Ensure the working directory exists
-        os.makedirs(sauc.SV_ASSET_DIR, exist_ok=True)
+    def _cache_archive(self, version: str, role: str, archive_path: str):
+        if not os.path.isfile(archive_path) or self.archive_cache.owns(archive_path):
+            return
+
+        # Cache the archive, stored by its digest
+        self.archive_cache.put(
+            version=version,
+            role=role,
+            path=archive_path,
+            sha256=self.downloader.get_digest(archive_path),
+        )
+
+        # Remove the archive, if not moved in the cache, and its records
+        self.downloader.remove(archive_path)
+
+        # Log it
+        archive_name = os.path.basename(archive_path)
+        btul.logging.trace(
+            f"Archive {archive_name} removed", prefix=sauc.SV_LOGGER_NAME
+        )
+
+    def _get_dedup_index(self):
+        if not sauc.SV_DEDUP:
+            return None
+
+        return saudd.DedupIndex(directory=sauc.SV_ASSET_DIR)
+
+    def _get_include_filter(self, role: str):
+        if not sauc.SV_EXTRACT_ROLE_ONLY:
+            return None
+
+        return saua.get_role_filter(role=role)
 
+    def _get_archive_path(self, version: str, role: str):
         # Normalized the version
         normalized_version = sauv.normalize_version(version)
 
         # Build the archive name
         archive_name = f"subvortex_{role}-{normalized_version}.tar.gz"
 
+        return os.path.join(sauc.SV_ASSET_DIR, archive_name)
+
+    def _get_archive_url(self, version: str, archive_path: str):
+        archive_name = os.path.basename(archive_path)
+        return f"https://github.com/eclipsevortex/SubVortex/releases/download/v{version}/{archive_name}"
+
+    def _download_and_extract_assets(self, version: str, role: str):
+        # Build the archive path
+        archive_path = self._get_archive_path(version=version, role=role)
+        url = self._get_archive_url(version=version, archive_path=archive_path)
+
+        # Get the checksum published alongside the archive, if any
+        sha256 = self._get_published_checksum(url=url, version=version)
+
+        # Keep the archive only if requested
+        target_path = archive_path if sauc.SV_DOWNLOAD_KEEP_ARCHIVE else None
+        if target_path:
+            os.makedirs(sauc.SV_ASSET_DIR, exist_ok=True)
+
+        # Index the files of the versions already extracted
+        dedup = self._get_dedup_index()
+
+        staging_dir = None
+        try:
+            with self.downloader.stream(
+                url=url, target_path=target_path, sha256=sha256
+            ) as stream:
+                if stream is None:
+                    return None
+
+                # Extract members as their bytes arrive
+                staging_dir, top_level_dir = saua.extract_stream(
+                    fileobj=stream,
+                    directory=sauc.SV_ASSET_DIR,
+                    dedup=dedup,
+                    include=self._get_include_filter(role=role),
+                )
+        except BaseException:
+            # Nothing extracted is used unless the whole archive has been verified
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        target_dir = saua.promote(
+            staging_dir=staging_dir,
+            top_level_dir=top_level_dir,
+            directory=sauc.SV_ASSET_DIR,
+        )
+
+        if dedup:
+            dedup.log(target_dir)
+
+        btul.logging.trace(
+            f"Archive {os.path.basename(archive_path)} streamed into {target_dir}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        return target_dir
+
+    def _download_delta_assets(self, version: str, role: str):
+        # Get the installed version to build the new one from
+        base_version = self.get_installed_version()
+        if (
+            base_version is None
+            or base_version == version
+            or not saup.is_version_pulled(version=base_version)
+        ):
+            btul.logging.debug(
+                f"No delta base available for version {version}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return None
+
+        base_dir = saup.get_version_directory(version=base_version)
+        archive_path = self._get_archive_path(version=version, role=role)
+        url = self._get_archive_url(version=version, archive_path=archive_path)
+
+        delta_dir = None
+        try:
+            # Get the manifest published alongside the archive
+            response = self.session.get(
+                url.replace(".tar.gz", ".manifest.json"), timeout=sauhcl.get_timeout()
+            )
+            if response.status_code == 404:
+                btul.logging.debug(
+                    f"No manifest published for version {version}",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+                return None
+
+            response.raise_for_status()
+
+            manifest = response.json()
+            manifest.setdefault(
+                "top_level_dir",
+                os.path.basename(saup.get_version_directory(version=version)),
+            )
+
+            # Get the archive of the files changed since the base version, if published
+            delta_dir = self._download_delta_archive(
+                url=url, role=role, base_version=base_version, version=version
+            )
+
+            def fetch(relpath: str):
+                if self.cancelled.is_set():
+                    raise saue.OperationCancelledError(action="download")
+
+                if delta_dir:
+                    path = os.path.join(delta_dir, manifest["top_level_dir"], relpath)
+                    if os.path.isfile(path):
+                        with open(path, "rb") as f:
+                            return f.read()
+
+                # Get the file of the release from the repository
+                response = self.session.get(
+                    f"https://raw.githubusercontent.com/{self.repo_owner}/{self.repo_name}/v{version}/{relpath}",
+                    timeout=sauhcl.get_timeout(),
+                )
+                response.raise_for_status()
+                return response.content
+
+            staging_dir, _ = saudt.assemble(
+                base_dir=base_dir,
+                manifest=manifest,
+                fetch=fetch,
+                directory=sauc.SV_ASSET_DIR,
+            )
+        except saue.OperationCancelledError:
+            raise
+        except Exception as e:
+            # Not an error, the full archive has everything needed
+            btul.logging.warning(
+                f"⚠️ Delta update of version {version} failed ({e}), downloading the full archive",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return None
+        finally:
+            if delta_dir:
+                shutil.rmtree(delta_dir, ignore_errors=True)
+
+        target_dir = saua.promote(
+            staging_dir=staging_dir,
+            top_level_dir=manifest["top_level_dir"],
+            directory=sauc.SV_ASSET_DIR,
+        )
+
+        btul.logging.info(
+            f"🧩 Version {version} assembled from version {base_version} in {target_dir}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        return target_dir
+
+    def _download_delta_archive(
+        self, url: str, role: str, base_version: str, version: str
+    ):
+        # Build the name of the archive of the changed files
+        name = f"subvortex_{role}-{sauv.normalize_version(base_version)}-{sauv.normalize_version(version)}.delta.tar.gz"
+
+        with self.downloader.stream(url=f"{os.path.dirname(url)}/{name}") as stream:
+            if stream is None:
+                return None
+
+            staging_dir, _ = saua.extract_stream(
+                fileobj=stream, directory=sauc.SV_ASSET_DIR
+            )
+
+        return staging_dir
+
+    def _download_assets(self, version: str, role: str):
+        # Ensure the working directory exists
+        os.makedirs(sauc.SV_ASSET_DIR, exist_ok=True)
+
+        # Use the archive from the cache, verified when it was downloaded
+        cached_path = self.archive_cache.get(version=version, role=role)
+        if cached_path:
+            btul.logging.debug(
+                f"✅ Archive found in cache at {cached_path}, skipping download.",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return cached_path
+
         # Build the target path
-        target_path = os.path.join(sauc.SV_ASSET_DIR, archive_name)
+        target_path = self._get_archive_path(version=version, role=role)
+        archive_name = os.path.basename(target_path)
+
+        url = self._get_archive_url(version=version, archive_path=target_path)
+
+        # Archive downloaded and hashed by us, and not modified since
+        if self.downloader.is_verified(target_path):
+            btul.logging.debug(
+                f"✅ Verified archive already exists at {target_path}, skipping download.",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return target_path
+
+        # Get the checksum published alongside the archive, if any
+        sha256 = self._get_published_checksum(url=url, version=version)
 
         # Ensure valid archive
-        if self.validate_archive_or_remove(target_path):
+        if self.validate_archive_or_remove(target_path, sha256=sha256):
             btul.logging.debug(
                 f"✅ Valid archive already exists at {target_path}, skipping download.",
                 prefix=sauc.SV_LOGGER_NAME,
             )
             return target_path
 
-        url = f"https://github.com/eclipsevortex/SubVortex/releases/download/v{version}/{archive_name}"
+        # Download the archive, resuming any previous interrupted download
+        archive_path = self.downloader.download(
+            url=url, target_path=target_path, sha256=sha256
+        )
+        if not archive_path:
+            return None
 
-        # Download the archive
-        response = requests.get(url, stream=True)
-        if response.status_code == 404:
+        btul.logging.trace(
+            f"Archive {archive_name} downloaded into {target_path}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        return target_path
+
+    def _get_published_checksum(self, url: str, version: str):
+        try:
+            return self._fetch_published_checksum(url=url, version=version)
+        except requests.RequestException as e:
+            # Rate limited or unavailable, the archive is still checked by its format
+            btul.logging.warning(
+                f"⚠️ Could not get the published checksum of {url}: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
             return None
 
-        response.raise_for_status()
+    def _fetch_published_checksum(self, url: str, version: str):
+        # Get the checksum from the asset published alongside the archive
+        response = self.session.get(f"{url}.sha256", timeout=sauhcl.get_timeout())
+        if response.status_code != 404:
+            response.raise_for_status()
 
-        # Save the archive on disk
-        with open(target_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            # Format of sha256sum: "<digest>  <file name>"
+            content = response.text.split()
+            return content[0].lower() if content else None
 
-            f.flush()
-            os.fsync(f.fileno())
+        # Otherwise, get it from the release notes
+        release = self._get_json(
+            f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases/tags/v{version}"
+        )
+        if not release or not release.get("body"):
+            return None
 
-        # Check with retry the file has been downloaded on the file system
-        for _ in range(5):  # Try for ~500ms
-            if os.path.exists(target_path):
-                break
-            time.sleep(0.5)
-        else:
-            raise saue.MissingFileError(
-                file_path=target_path,
-                message=f"Downloaded archive {target_path} does not exist after writing.",
-            )
+        archive_name = os.path.basename(url)
+        match = re.search(
+            rf"\b([0-9a-fA-F]{{64}})\s+\*?{re.escape(archive_name)}\b",
+            release["body"],
+        )
+
+        return match.group(1).lower() if match else None
+
+    def _unzip_assets(self, archive_path: str, include: saua.PathFilter = None):
+        # Extract into a staging directory, an interrupted extraction is never used
+        staging_dir, top_level_dir, dedup = self._extract_archive(
+            archive_path=archive_path, include=include
+        )
+
+        # Move the extracted directory in place
+        target_dir = saua.promote(
+            staging_dir=staging_dir,
+            top_level_dir=top_level_dir,
+            directory=sauc.SV_ASSET_DIR,
+        )
+
+        if dedup:
+            dedup.log(target_dir)
 
         btul.logging.trace(
-            f"Archive {archive_name} downloaded into {target_path}",
+            f"Archive {archive_path} unzipped into {target_dir}",
             prefix=sauc.SV_LOGGER_NAME,
         )
 
-        return target_path
+        return target_dir
 
-    def _unzip_assets(self, archive_path: str):
+    def _extract_archive(self, archive_path: str, include: saua.PathFilter = None):
         if not os.path.isfile(archive_path):
             raise saue.MissingFileError(file_path=archive_path)
 
         # Ensure the directory exists
         os.makedirs(sauc.SV_ASSET_DIR, exist_ok=True)
 
-        # Extract archive
-        with tarfile.open(archive_path, "r:gz") as tar:
-            # Get top-level directory from the first member
-            top_level_dirs = {
-                member.name.split("/")[0]
-                for member in tar.getmembers()
-                if member.name and "/" in member.name
-            }
-
-            if not top_level_dirs:
-                raise ValueError(
-                    "Could not determine top-level directory from archive."
-                )
+        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=sauc.SV_ASSET_DIR)
 
-            top_level_dir = sorted(top_level_dirs)[0]
+        try:
+            with tarfile.open(archive_path, "r:gz") as tar:
+                # Index the files of the versions already extracted
+                dedup = self._get_dedup_index()
 
-            # Build the target directory
-            target_dir = os.path.join(sauc.SV_ASSET_DIR, top_level_dir)
-            # if os.path.exists(target_dir):
-            #     # The asset has already been unzipped
-            #     return target_dir
+                # Extract archive, in a single pass over the members
+                top_level_dirs = set()
+                with saua.Extractor(path=staging_dir, dedup=dedup) as extractor:
+                    for member in tar:
+                        if member.name and "/" in member.name:
+                            top_level_dirs.add(member.name.split("/")[0])
 
-            # If target directory exists, remove it to allow clean overwrite
-            if os.path.exists(target_dir):
-                shutil.rmtree(target_dir, onerror=lambda *args, **kwargs: None)
+                        # Skip the members not needed
+                        if include and not include(member):
+                            continue
 
-            # Extract archive
-            tar.extractall(path=sauc.SV_ASSET_DIR)
+                        extractor.extract(tar=tar, member=member)
 
-        btul.logging.trace(
-            f"Archive {archive_path} unzipped into {target_dir}",
-            prefix=sauc.SV_LOGGER_NAME,
-        )
+                if not top_level_dirs:
+                    raise ValueError(
+                        "Could not determine top-level directory from archive."
+                    )
 
-        if not os.path.exists(target_dir):
-            raise saue.MissingDirectoryError(directory_path=target_dir)
+                top_level_dir = sorted(top_level_dirs)[0]
 
-        return target_dir
+                if include:
+                    include.save(os.path.join(staging_dir, top_level_dir))
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        return staging_dir, top_level_dir, dedup
 
     def _get_latest_version(self):
         # Build the url to get the list of releases
@@ -257,26 +650,13 @@ class Github:
             f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases"
         )
 
-        # Build the headers
-        headers = (
-            {"Authorization": f"token {sauc.SV_GITHUB_TOKEN}"}
-            if sauc.SV_GITHUB_TOKEN
-            else {}
-        )
-
-        # Send the request
-        response = requests.get(url, headers=headers)
+        # Get the releases
+        releases = self._get_json(url=url)
 
         # Check the the releases have not be found
-        if response.status_code == 404:
+        if releases is None:
             raise saue.ReleaseNotFoundError(url=url)
 
-        # Raise any failed response
-        response.raise_for_status()
-
-        # Deseralized the resposne
-        releases = response.json()
-
         if not releases:
             raise saue.NoReleaseAvailableError()
 
@@ -300,7 +680,7 @@ class Github:
         version = tag[1:] if tag.startswith("v") else tag
         return version
 
-    def _get_latest_container_version(self):
+    async def _get_latest_container_version(self):
         """
         Get the latest container version from GitHub registry,
         inspecting the floating tag (latest/stable/dev) of each service.
@@ -311,21 +691,12 @@ class Github:
         # Build the URL to list packages in GitHub registry
         url = f"https://api.github.com/users/{self.repo_owner}/packages?package_type=container"
 
-        headers = (
-            {"Authorization": f"token {sauc.SV_GITHUB_TOKEN}"}
-            if sauc.SV_GITHUB_TOKEN
-            else {}
-        )
-
         # Fetch list of container packages
-        response = requests.get(url, headers=headers)
+        packages = await asyncio.to_thread(self._get_json, url=url)
 
-        if response.status_code == 404:
+        if packages is None:
             raise saue.PackageNotFoundError(url=url)
 
-        response.raise_for_status()
-        packages = response.json()
-
         # Filter packages matching the execution role
         packages = [
             package
@@ -345,11 +716,8 @@ class Github:
             btul.logging.trace(
                 f"Pull the image {full_image}", prefix=sauc.SV_LOGGER_NAME
             )
-            pull_result = subprocess.run(
-                ["docker", "pull", "--quiet", full_image],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            pull_result = await self._run_command(
+                "docker", "pull", "--quiet", full_image
             )
             pulled_successfully = pull_result.returncode == 0
 
@@ -371,17 +739,12 @@ class Github:
             btul.logging.trace(
                 f"Attempting to inspect image: {full_image}", prefix=sauc.SV_LOGGER_NAME
             )
-            inspect_result = subprocess.run(
-                [
-                    "docker",
-                    "inspect",
-                    "--format",
-                    "{{ json .Config.Labels }}",
-                    full_image,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            inspect_result = await self._run_command(
+                "docker",
+                "inspect",
+                "--format",
+                "{{ json .Config.Labels }}",
+                full_image,
             )
             if inspect_result.returncode != 0 or not inspect_result.stdout.strip():
                 btul.logging.warning(
@@ -482,7 +845,7 @@ class Github:
         )
 
         # Fetch list of container packages
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers, timeout=sauhcl.get_timeout())
 
         if response.status_code == 404:
             raise saue.PackageNotFoundError(url=url)
@@ -503,7 +866,9 @@ class Github:
             package_name = package["name"]
             version_url = f"https://api.github.com/users/{self.repo_owner}/packages/container/{package_name}/versions"
 
-            version_response = requests.get(version_url, headers=headers)
+            version_response = self.session.get(
+                version_url, headers=headers, timeout=sauhcl.get_timeout()
+            )
             if version_response.status_code != 200:
                 continue
 
@@ -605,7 +970,11 @@ class Github:
 
         return versions.get("version")
 
-    def _get_local_version(self):
+    def get_installed_version(self):
+        """
+        Get the version the execution directory links to, leaving any force
+        reinstall marker in place for the upgrade to act on.
+        """
         if not os.path.islink(sauc.SV_EXECUTION_DIR):
             btul.logging.warning(
                 f"❌ {sauc.SV_EXECUTION_DIR} is not a symlink",
@@ -637,17 +1006,6 @@ class Github:
                 )
                 return None
 
-            # Check for optional force_reinstall flag
-            version_dir = os.path.join(sauc.SV_ASSET_DIR, f"subvortex-{version_str}")
-            marker_path = os.path.join(version_dir, "force_reinstall")
-            if os.path.isfile(marker_path):
-                btul.logging.warning(
-                    f"⚠️ Force reinstall marker found for version {version_str}",
-                    prefix=sauc.SV_LOGGER_NAME,
-                )
-                os.remove(marker_path)
-                return None
-
             return sauv.denormalize_version(version_str)
 
         except OSError as e:
@@ -656,6 +1014,25 @@ class Github:
             )
             return None
 
+    def _get_local_version(self):
+        version = self.get_installed_version()
+        if version is None:
+            return None
+
+        # Check for optional force_reinstall flag
+        version_str = sauv.normalize_version(version)
+        version_dir = os.path.join(sauc.SV_ASSET_DIR, f"subvortex-{version_str}")
+        marker_path = os.path.join(version_dir, "force_reinstall")
+        if os.path.isfile(marker_path):
+            btul.logging.warning(
+                f"⚠️ Force reinstall marker found for version {version_str}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            os.remove(marker_path)
+            return None
+
+        return version
+
     def _get_local_version_decommissioned(self):
         versions = []
 
@@ -723,7 +1100,7 @@ class Github:
 
         return latest_version_denormalized
 
-    def _get_local_container_version(self):
+    async def _get_local_container_version(self):
         """
         Get the latest local version for container-based execution,
         inspecting the labels of the locally pulled images.
@@ -735,11 +1112,12 @@ class Github:
             ftag = sauu.get_tag()
 
             # List all local images with their tags
-            result = subprocess.run(
-                ["docker", "image", "ls", "--format", "{{.Repository}}:{{.Tag}}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            result = await self._run_command(
+                "docker",
+                "image",
+                "ls",
+                "--format",
+                "{{.Repository}}:{{.Tag}}",
                 check=True,
             )
             images = result.stdout.strip().split("\n")
@@ -760,7 +1138,7 @@ class Github:
                     continue
 
                 # Inspect labels of the local image
-                container_versions = self._get_local_container_versions(
+                container_versions = await self._get_local_container_versions(
                     repo_name=repo, tag=ftag
                 )
 
@@ -815,7 +1193,7 @@ class Github:
 
         return versions["version"]
 
-    def _get_local_container_versions(self, repo_name: str, tag: str) -> dict:
+    async def _get_local_container_versions(self, repo_name: str, tag: str) -> dict:
         """
         Inspect a local Docker container (if running) or image and extract version labels.
 
@@ -827,7 +1205,7 @@ class Github:
             dict: Dictionary of label key-values (e.g., {"version": "1.2.3", "neuron.version": "1.2.3"})
         """
 
-        def inspect(target: str) -> dict:
+        async def inspect(target: str) -> dict:
             try:
                 cmd = [
                     "docker",
@@ -836,13 +1214,7 @@ class Github:
                     "{{ json .Config.Labels }}",
                     target,
                 ]
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=True,
-                )
+                result = await self._run_command(*cmd, check=True)
                 raw = result.stdout.strip()
                 if not raw or raw == "null":
                     return {}
@@ -855,12 +1227,78 @@ class Github:
         container_name = repo_name.replace(f"ghcr.io/{self.repo_owner}/", "")
 
         # Step 1: Try inspecting container by name
-        labels = inspect(container_name)
+        labels = await inspect(container_name)
         if labels:
             return labels
 
         # Step 2: Fallback to image inspection
-        return inspect(f"{repo_name}:{tag}")
+        return await inspect(f"{repo_name}:{tag}")
+
+    async def _run_command(self, *cmd: str, check: bool = False):
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+
+        result = subprocess.CompletedProcess(
+            args=list(cmd),
+            returncode=process.returncode,
+            stdout=stdout.decode(),
+            stderr=stderr.decode(),
+        )
+
+        if check:
+            result.check_returncode()
+
+        return result
+
+    def _get_json(self, url: str):
+        # Build the headers
+        headers = (
+            {"Authorization": f"token {sauc.SV_GITHUB_TOKEN}"}
+            if sauc.SV_GITHUB_TOKEN
+            else {}
+        )
+
+        # Only get the payload if it changed since the last request
+        validators = self.http_cache.get_validators(url=url)
+
+        # Send the request
+        response = self.session.get(
+            url, headers={**headers, **validators}, timeout=sauhcl.get_timeout()
+        )
+
+        # Nothing changed, reuse the payload of the previous request
+        if response.status_code == 304:
+            body = self.http_cache.hit(url=url)
+            if body is not None:
+                btul.logging.trace(
+                    f"Not modified: {url} ({self.http_cache.stats()})",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+                return body
+
+            # The cached payload has been evicted in the meantime, get it again
+            response = self.session.get(
+                url, headers=headers, timeout=sauhcl.get_timeout()
+            )
+
+        # Check the url has not be found
+        if response.status_code == 404:
+            return None
+
+        # Raise any failed response
+        response.raise_for_status()
+
+        # Deseralized the response
+        body = response.json()
+
+        # Store the response for the next conditional request
+        self.http_cache.store(url=url, headers=response.headers, body=body)
+
+        return body
 
     def _get_default_versions(self, name: str):
         component = sauc.SV_EXECUTION_ROLE
@@ -871,10 +1309,27 @@ class Github:
             service: sauc.DEFAULT_LAST_RELEASE.get(service),
         }
 
-    def validate_archive_or_remove(self, archive_path: str):
+    def validate_archive_or_remove(self, archive_path: str, sha256: str = None):
         if not os.path.exists(archive_path):
             return False
 
+        # Archive downloaded and hashed by us, and not modified since
+        if self.downloader.is_verified(archive_path, sha256=sha256):
+            return True
+
+        # Archive not recorded yet, e.g. downloaded by a previous version, hash it once
+        if sha256 and self.downloader.verify(archive_path, sha256=sha256):
+            return True
+
+        # Archive modified since recorded or not matching the published checksum
+        if sha256 or self.downloader.is_recorded(archive_path):
+            btul.logging.warning(
+                f"⚠️ Unverified archive at {archive_path}. Removing it.",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            self.downloader.remove(archive_path)
+            return False
+
         try:
             with tarfile.open(archive_path, "r:gz") as tar:
                 tar.getmembers()
@@ -0,0 +1,179 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import json
+import time
+import threading
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+
+
+class HttpCache:
+    """
+    Persistent cache of GitHub API responses, keyed by url, storing the ETag/Last-Modified
+    validators so the next request can be a conditional one answered by a 304.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._loaded = False
+        self._saved_at = 0
+        self._lock = threading.Lock()
+
+    @property
+    def file(self):
+        return self.path or os.path.join(sauc.SV_ASSET_DIR, ".cache", "http.json")
+
+    def get_validators(self, url: str) -> dict:
+        with self._lock:
+            self._load()
+
+            entry = self.entries.get(url)
+            if not entry:
+                return {}
+
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+            return headers
+
+    def hit(self, url: str):
+        with self._lock:
+            self._load()
+
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+
+            # Refresh the entry so it is not evicted
+            entry["accessed_at"] = time.time()
+            self.hits += 1
+
+            # Persist the access time from time to time only, a hit must stay cheap
+            if entry["accessed_at"] - self._saved_at > 60 * 60:
+                self._save()
+
+            return entry.get("body")
+
+    def store(self, url: str, headers: dict, body):
+        with self._lock:
+            self._load()
+            self.misses += 1
+
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            if not etag and not last_modified:
+                # Without validators the response can never be revalidated
+                self.entries.pop(url, None)
+                return
+
+            now = time.time()
+            self.entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+                "stored_at": now,
+                "accessed_at": now,
+            }
+
+            self._evict()
+            self._save()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def _load(self):
+        if self._loaded:
+            return
+
+        self._loaded = True
+
+        if not os.path.isfile(self.file):
+            return
+
+        try:
+            with open(self.file, "r", encoding="utf-8") as f:
+                content = json.load(f)
+
+            self.entries = content.get("entries", {})
+        except (OSError, ValueError) as e:
+            # A corrupted cache is not an error, it will be rebuilt
+            btul.logging.warning(
+                f"⚠️ Could not load http cache {self.file}: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            self.entries = {}
+
+        self._evict()
+
+    def _evict(self):
+        # Remove the entries that have not been used for too long
+        deadline = time.time() - sauc.SV_HTTP_CACHE_TTL
+        expired = [
+            url
+            for url, entry in self.entries.items()
+            if entry.get("accessed_at", 0) < deadline
+        ]
+
+        # Remove the least recently used entries above the limit
+        overflow = len(self.entries) - len(expired) - sauc.SV_HTTP_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            remaining = sorted(
+                (x for x in self.entries.items() if x[0] not in expired),
+                key=lambda x: x[1].get("accessed_at", 0),
+            )
+            expired += [url for url, _ in remaining[:overflow]]
+
+        for url in expired:
+            del self.entries[url]
+
+        self.evictions += len(expired)
+
+    def _save(self):
+        # Write in a temporary file first so a crash never leaves a truncated cache
+        temp_file = f"{self.file}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self.file), exist_ok=True)
+
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"entries": self.entries}, f)
+
+            os.replace(temp_file, self.file)
+            self._saved_at = time.time()
+        except OSError as e:
+            btul.logging.warning(
+                f"⚠️ Could not save http cache {self.file}: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
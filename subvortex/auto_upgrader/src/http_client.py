@@ -0,0 +1,49 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import subvortex.auto_upgrader.src.constants as sauc
+
+
+def create_session() -> requests.Session:
+    # Retry idempotent requests on connection resets and transient server errors
+    retry = Retry(
+        total=sauc.SV_HTTP_MAX_RETRIES,
+        backoff_factor=sauc.SV_HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+
+    # Keep the connections alive to reuse them across cycles
+    adapter = HTTPAdapter(
+        pool_connections=sauc.SV_HTTP_POOL_SIZE,
+        pool_maxsize=sauc.SV_HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def get_timeout():
+    return (sauc.SV_HTTP_CONNECT_TIMEOUT, sauc.SV_HTTP_READ_TIMEOUT)
@@ -14,6 +14,7 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import signal
 import asyncio
 import argparse
 import traceback
@@ -70,20 +71,13 @@ class Worker:
             # Reset success
             success = False
 
-            try:
-                if not first_run:
-                    btul.logging.debug(
-                        f"Waiting {sauc.SV_CHECK_INTERVAL} seconds before next check..."
-                    )
-                    await asyncio.sleep(sauc.SV_CHECK_INTERVAL)
+            if not first_run and await self._wait_for_next_check():
+                break
 
+            try:
                 # Rollout the plan
                 success = await self.orchestrator.run_plan()
 
-            except asyncio.TimeoutError:
-                # Normal cycle timeout, no problem
-                pass
-
             except (KeyboardInterrupt, asyncio.CancelledError):
                 btul.logging.debug("Shutdown requested", prefix=sauc.SV_LOGGER_NAME)
                 success = True
@@ -113,13 +107,53 @@ class Worker:
         # Signal the waiter the service has finished
         self.finished.set()
 
+    async def _wait_for_next_check(self):
+        btul.logging.debug(
+            f"Waiting {sauc.SV_CHECK_INTERVAL} seconds before next check..."
+        )
+
+        # Prefetch a new release while waiting, so the next check finds it ready
+        prefetch = asyncio.create_task(self.orchestrator.prefetcher.watch())
+
+        # Delete the removed versions, out of the critical path of the upgrade
+        collect = asyncio.create_task(self.orchestrator.trash.collect())
+
+        try:
+            # Wake up as soon as a shutdown is requested
+            await asyncio.wait_for(
+                self.should_exit.wait(), timeout=sauc.SV_CHECK_INTERVAL
+            )
+        except asyncio.TimeoutError:
+            # Normal cycle timeout, time for the next check
+            return False
+        finally:
+            prefetch.cancel()
+            collect.cancel()
+
+        btul.logging.debug("Shutdown requested", prefix=sauc.SV_LOGGER_NAME)
+        return True
+
     async def shutdown(self):
         # Signal the service to stop
         self.should_exit.set()
 
+        # Abort any download in progress instead of waiting for its completion
+        self.orchestrator.cancel()
+
         # Wait until the service has finished
         await self.finished.wait()
 
 
+async def main():
+    worker = Worker()
+
+    # Shutdown gracefully on signals, the event loop is never blocked so it is handled right away
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.create_task(worker.shutdown()))
+
+    await worker.run()
+
+
 if __name__ == "__main__":
-    asyncio.run(Worker().run())
+    asyncio.run(main())
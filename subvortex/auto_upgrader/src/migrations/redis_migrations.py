@@ -17,7 +17,6 @@
 import os
 import re
 import shutil
-import asyncio
 import importlib
 from dotenv import load_dotenv
 from redis import asyncio as aioredis
@@ -26,6 +25,7 @@ import bittensor.utils.btlogging as btul
 import subvortex.auto_upgrader.src.constants as sauc
 import subvortex.auto_upgrader.src.path as saup
 import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.readiness as saurd
 from subvortex.auto_upgrader.src.service import Service
 from subvortex.auto_upgrader.src.migrations.base import Migration
 from packaging.version import Version
@@ -420,11 +420,11 @@ class RedisMigrations(Migration):
         return dump_dir, db_filename
 
     async def wait_for_redis(self, redis_client, timeout=30):
-        for _ in range(timeout):
+        async def ping():
             try:
-                pong = await redis_client.ping()
-                if pong:
-                    return True
+                return await redis_client.ping()
             except Exception:
-                pass
-            await asyncio.sleep(1)
+                return False
+
+        # Poll often at first, redis is usually up within a few hundred milliseconds
+        return await saurd.poll(ping, timeout=timeout)
@@ -15,12 +15,13 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 import os
+import time
 import shutil
 import asyncio
 import traceback
-import subprocess
 from os import path
-from typing import List, Tuple, Callable
+from collections import defaultdict
+from typing import Awaitable, Dict, List, Tuple, Callable
 from packaging.version import Version
 
 import bittensor.utils.btlogging as btul
@@ -33,6 +34,15 @@ import subvortex.auto_upgrader.src.exception as saue
 import subvortex.auto_upgrader.src.version as sauv
 import subvortex.auto_upgrader.src.resolvers.dependency_resolver as saudr
 import subvortex.auto_upgrader.src.github as saug
+import subvortex.auto_upgrader.src.prefetcher as saupf
+import subvortex.auto_upgrader.src.dedup as saudd
+import subvortex.auto_upgrader.src.trash as sautr
+import subvortex.auto_upgrader.src.retention as saurt
+import subvortex.auto_upgrader.src.plan as saupl
+import subvortex.auto_upgrader.src.runner as saurn
+import subvortex.auto_upgrader.src.readiness as saurd
+import subvortex.auto_upgrader.src.blue_green as saubg
+import subvortex.auto_upgrader.src.soak as sausk
 import subvortex.auto_upgrader.src.resolvers.metadata_resolver as saumr
 from subvortex.auto_upgrader.src.migration_manager import MigrationManager
 
@@ -43,14 +53,37 @@ class Orchestrator:
     def __init__(self):
         self.rollback_steps: List[Tuple[str, callable]] = []
         self.previously_started_services: List[str] = []
+        self.pulled_versions: List[str] = []
+        self.step_durations: Dict[str, float] = {}
+
+        # Services whose setup, stop, start or teardown has completed, by action
+        self.completed_services: Dict[str, List[str]] = defaultdict(list)
+
+        # Dependency plans of the sets of services, computed once per upgrade
+        self.dependency_plans: Dict[tuple, saudr.DependencyPlan] = {}
+
+        # Links broken in each path, once for all the setups writing in it
+        self.link_breaks: Dict[str, asyncio.Future] = {}
 
         self.services: List[saus.Service] = []
         self.current_services: List[saus.Service] = []
         self.latest_services: List[saus.Service] = []
 
         self.github = saug.Github()
+        self.prefetcher = saupf.Prefetcher(github=self.github)
+        self.trash = sautr.Trash()
+        self.runner = saurn.Runner()
+        self.retention = saurt.RetentionManager(trash=self.trash)
         self.metadata_resolver = saumr.MetadataResolver()
 
+        # Previous versions kept until the soak period of the upgrade is over, across restarts
+        self.soaking_versions: Dict[str, float] = sausk.load_soaking_versions()
+
+        # Time the previous instance of each service stopped, the new one was ready, and the one each service was unavailable
+        self.stopped_at: Dict[str, float] = {}
+        self.ready_at: Dict[str, float] = {}
+        self.unavailability: Dict[str, float] = {}
+
         self.has_changed = True
 
     async def run_plan(self):
@@ -59,35 +92,58 @@ class Orchestrator:
         # Get version before auto upgrader
         last_version_before_auto_upgrader = sauc.DEFAULT_LAST_RELEASE.get("global")
 
-        # Get the current version
-        await self._step(
-            "Get current version",
-            self._rollback_nop,
-            self._get_current_version,
-        )
-
-        # Get the latest version
-        await self._step(
-            "Get latest version",
-            self._rollback_nop,
-            self._get_latest_version,
-        )
-
-        # Pull the assets of the current version for the neuron
-        await self._step(
-            "Pull current version",
-            self._rollback_nop,
-            self._pull_current_assets,
-            condition=lambda: self.current_version != last_version_before_auto_upgrader
-            and not self._is_already_pulled_current_version(),
+        start_time = time.monotonic()
+
+        # Discover the versions and pull their assets
+        plan = await self._run_steps(
+            [
+                # Get the current version
+                saupl.Step(
+                    id="get_current_version",
+                    description="Get current version",
+                    action=self._get_current_version,
+                ),
+                # Get the latest version, once the local images are known in container
+                # as it reads them and pulls the tag they may be inspected from
+                saupl.Step(
+                    id="get_latest_version",
+                    description="Get latest version",
+                    action=self._get_latest_version,
+                    depends_on=(
+                        ["get_current_version"]
+                        if sauc.SV_EXECUTION_METHOD == "container"
+                        else None
+                    ),
+                ),
+                # Pull the assets of the current version for the neuron
+                saupl.Step(
+                    id="pull_current_version",
+                    description="Pull current version",
+                    action=self._pull_current_assets,
+                    condition=lambda: self.current_version
+                    != last_version_before_auto_upgrader
+                    and not self._is_already_pulled_current_version(),
+                    depends_on=["get_current_version"],
+                ),
+                # Pull the assets of the latest version for the neuron
+                saupl.Step(
+                    id="pull_latest_version",
+                    description="Pull latest version",
+                    action=self._pull_latest_assets,
+                    rollback=self._rollback_pull_latest_assets,
+                    condition=lambda: self.current_version != self.latest_version,
+                    depends_on=["get_current_version", "get_latest_version"],
+                ),
+            ]
         )
 
-        # Pull the assets of the latest version for the neuron
-        await self._step(
-            "Pull latest version",
-            self._rollback_pull_latest_assets,
-            self._pull_latest_assets,
-            condition=lambda: self.current_version != self.latest_version,
+        # Report the time saved by not running the steps one after the other
+        elapsed = time.monotonic() - start_time
+        sequential = sum(plan.timings.values())
+        btul.logging.debug(
+            f"⏱️ Versions discovered and pulled in {elapsed:.2f}s, "
+            f"{max(0, sequential - elapsed):.2f}s saved on the critical path",
+            prefix=sauc.SV_LOGGER_NAME,
         )
 
         if (
@@ -98,6 +154,10 @@ class Orchestrator:
                 "🟢 No new release available. All services are up-to-date.",
                 prefix=sauc.SV_LOGGER_NAME,
             )
+
+            # Roll back if the services are unhealthy, or remove the versions soaked
+            await self._check_soaking_versions()
+
             return True
 
         # Set the action
@@ -106,105 +166,150 @@ class Orchestrator:
         )
         emoji = "⬆️" if self.current_version < self.latest_version else "⬇️"
 
-        # Load the services of the current version
-        await self._step(
-            "Load current services",
-            self._rollback_nop,
-            self._load_current_services,
-            condition=lambda: self.current_version != last_version_before_auto_upgrader,
-        )
-
-        # Load the services of the latest version
-        await self._step(
-            "Load latest services", self._rollback_nop, self._load_latest_services
+        # Load and compare the services
+        await self._run_steps(
+            [
+                # Load the services of the current version
+                saupl.Step(
+                    id="load_current_services",
+                    description="Load current services",
+                    action=self._load_current_services,
+                    condition=lambda: self.current_version
+                    != last_version_before_auto_upgrader,
+                ),
+                # Load the services of the latest version, once the current ones are valid
+                saupl.Step(
+                    id="load_latest_services",
+                    description="Load latest services",
+                    action=self._load_latest_services,
+                    depends_on=["load_current_services"],
+                ),
+                # Check the latest version and the current one
+                saupl.Step(
+                    id="check_versions",
+                    description="Check versions",
+                    action=self._check_versions,
+                    depends_on=["load_current_services", "load_latest_services"],
+                ),
+            ]
         )
 
-        # Check the latest version and the current one
-        await self._step("Check versions", self._rollback_nop, self._check_versions)
-
         # Stop if no services have changed
         if not self.has_changed:
             btul.logging.success(
                 "🟢 No service changes detected. All services are up-to-date.",
                 prefix=sauc.SV_LOGGER_NAME,
             )
-            return True
 
-        # Copy the env var file in the latest version services
-        await self._step(
-            "📦 Copying environment variables",
-            self._rollback_nop,
-            self._copy_env_files,
-        )
+            # Roll back if the services are unhealthy, or remove the versions soaked
+            await self._check_soaking_versions()
 
-        # Copy the template files in the latest version services
-        await self._step(
-            "📦 Copying templates",
-            self._rollback_nop,
-            self._copy_templates_files,
-        )
-
-        # Upgrade the services that have changed
-        await self._step(
-            f"{action.capitalize()} services".capitalize(),
-            self._rollback_services,
-            self._rollout_service,
-        )
-
-        # Stop previous services
-        await self._step(
-            "🛑 Stop previous services",
-            self._rollback_stop_current_services,
-            self._stop_current_services,
-        )
-
-        # Pre-migration setup
-        await self._step(
-            "🔧 Pre-migration setup",
-            self._rollback_nop,
-            self._pre_migrations,
-        )
-
-        # Switch services to new version
-        await self._step(
-            "🔁 Switching to new version",
-            self._rollback_switch_services,
-            self._switch_services,
-        )
-
-        # Start latest services
-        await self._step(
-            "🚀 Start new services",
-            self._rollback_start_latest_services,
-            self._start_latest_services,
-        )
-
-        # Rollout migrations
-        await self._step(
-            "🛠️ Run migrations",
-            self._rollback_migrations,
-            self._rollout_migrations,
-        )
-
-        # Remove prune services
-        await self._step(
-            "🧹 Remove pruned services",
-            self._rollback_prune_services,
-            self._prune_services,
-        )
-
-        # Remove previous services
-        await self._step(
-            "🗑️ Remove previous version",
-            self._rollback_remove_services,
-            self._remove_services,
-        )
+            return True
 
-        # Finalize service versions
-        await self._step(
-            "✅ Finalize service versions",
-            self._rollback_nop,
-            self._finalize_versions,
+        # Roll out the services that have changed
+        await self._run_steps(
+            [
+                # Copy the env var file in the latest version services
+                saupl.Step(
+                    id="copy_env_files",
+                    description="📦 Copying environment variables",
+                    action=self._copy_env_files,
+                ),
+                # Copy the template files in the latest version services
+                saupl.Step(
+                    id="copy_templates_files",
+                    description="📦 Copying templates",
+                    action=self._copy_templates_files,
+                ),
+                # Upgrade the services that have changed
+                saupl.Step(
+                    id="rollout_services",
+                    description=f"{action.capitalize()} services".capitalize(),
+                    action=self._rollout_service,
+                    rollback=self._rollback_services,
+                    depends_on=["copy_env_files", "copy_templates_files"],
+                ),
+                # Start the new instances of the services upgraded side by side
+                saupl.Step(
+                    id="start_next_instances",
+                    description="🟢 Start new instances next to the previous ones",
+                    action=self._start_next_instances,
+                    rollback=self._rollback_start_next_instances,
+                    condition=self._has_blue_green_services,
+                    depends_on=["rollout_services"],
+                ),
+                # Stop previous services
+                saupl.Step(
+                    id="stop_current_services",
+                    description="🛑 Stop previous services",
+                    action=self._stop_current_services,
+                    rollback=self._rollback_stop_current_services,
+                    depends_on=["rollout_services", "start_next_instances"],
+                ),
+                # Pre-migration setup, once the previous services have flushed their data
+                saupl.Step(
+                    id="pre_migrations",
+                    description="🔧 Pre-migration setup",
+                    action=self._pre_migrations,
+                    depends_on=["stop_current_services"],
+                ),
+                # Switch services to new version
+                saupl.Step(
+                    id="switch_services",
+                    description="🔁 Switching to new version",
+                    action=self._switch_services,
+                    rollback=self._rollback_switch_services,
+                    depends_on=["stop_current_services", "pre_migrations"],
+                ),
+                # Start latest services
+                saupl.Step(
+                    id="start_latest_services",
+                    description="🚀 Start new services",
+                    action=self._start_latest_services,
+                    rollback=self._rollback_start_latest_services,
+                    depends_on=["switch_services"],
+                ),
+                # Stop the previous instances, the new ones serve since the switch
+                saupl.Step(
+                    id="stop_previous_instances",
+                    description="🔵 Stop previous instances",
+                    action=self._stop_previous_instances,
+                    rollback=self._rollback_stop_previous_instances,
+                    condition=self._has_blue_green_services,
+                    depends_on=["switch_services"],
+                ),
+                # Rollout migrations
+                saupl.Step(
+                    id="rollout_migrations",
+                    description="🛠️ Run migrations",
+                    action=self._rollout_migrations,
+                    rollback=self._rollback_migrations,
+                    depends_on=["start_latest_services", "stop_previous_instances"],
+                ),
+                # Remove prune services
+                saupl.Step(
+                    id="prune_services",
+                    description="🧹 Remove pruned services",
+                    action=self._prune_services,
+                    rollback=self._rollback_prune_services,
+                    depends_on=["rollout_migrations"],
+                ),
+                # Remove previous services
+                saupl.Step(
+                    id="remove_services",
+                    description="🗑️ Remove previous version",
+                    action=self._remove_services,
+                    rollback=self._rollback_remove_services,
+                    depends_on=["prune_services"],
+                ),
+                # Finalize service versions
+                saupl.Step(
+                    id="finalize_versions",
+                    description="✅ Finalize service versions",
+                    action=self._finalize_versions,
+                    depends_on=["remove_services"],
+                ),
+            ]
         )
 
         btul.logging.success(
@@ -217,6 +322,8 @@ class Orchestrator:
     async def run_rollback_plan(self):
         btul.logging.info("🔄 Rolling back upgrade plan...", prefix=sauc.SV_LOGGER_NAME)
 
+        start_time = time.monotonic()
+
         success = True
         for description, rollback_func in reversed(self.rollback_steps):
             btul.logging.info(
@@ -242,15 +349,37 @@ class Orchestrator:
                 )
                 btul.logging.debug(traceback.format_exc())
 
+        btul.logging.info(
+            f"⏱️ Rollback wall time: {time.monotonic() - start_time:.2f}s",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
         if success:
             btul.logging.success(
                 "✅ Rollback completed successfully",
                 prefix=sauc.SV_LOGGER_NAME,
             )
 
+    def cancel(self):
+        # Abort the long running operations such as downloads
+        self.github.cancel()
+        self.prefetcher.cancel()
+        self.trash.stopped.set()
+
+        # Kill the scripts in flight
+        self.runner.cancel()
+
     def reset(self):
         self.rollback_steps.clear()
         self.previously_started_services.clear()
+        self.pulled_versions.clear()
+        self.step_durations.clear()
+        self.completed_services.clear()
+        self.dependency_plans.clear()
+        self.link_breaks.clear()
+        self.stopped_at.clear()
+        self.ready_at.clear()
+        self.unavailability.clear()
         self.current_services.clear()
         self.latest_services.clear()
         self.current_version = None
@@ -291,6 +420,23 @@ class Orchestrator:
             f"✅ \033[32mCompleted: {description}\033[0m", prefix=sauc.SV_LOGGER_NAME
         )
 
+    async def _run_steps(self, steps: List[saupl.Step]):
+        plan = saupl.Plan(steps=steps)
+
+        # Each step registers its rollback when it starts, after the ones it depends on
+        await plan.run(
+            lambda step: self._step(
+                step.description,
+                step.rollback or self._rollback_nop,
+                step.action,
+                condition=step.condition,
+            )
+        )
+
+        self.step_durations.update(plan.timings)
+
+        return plan
+
     def _rollback_nop(self):
         btul.logging.trace(
             "No rollback action for this step", prefix=sauc.SV_LOGGER_NAME
@@ -298,7 +444,7 @@ class Orchestrator:
 
     async def _get_current_version(self):
         # Get the latest version
-        version = self.github.get_local_version()
+        version = await self.github.get_local_version()
 
         # Store the current version
         self.current_version = version or sauc.DEFAULT_LAST_RELEASE.get("global")
@@ -309,7 +455,7 @@ class Orchestrator:
 
     async def _get_latest_version(self):
         # Get the latest version
-        version = self.github.get_latest_version()
+        version = await self.github.get_latest_version()
 
         if version is None:
             raise saue.MissingVersionError(name="global", type="latest")
@@ -321,7 +467,7 @@ class Orchestrator:
             f"📌 Latest version: {self.latest_version}", prefix=sauc.SV_LOGGER_NAME
         )
 
-    def _pull_current_assets(self):
+    async def _pull_current_assets(self):
         # Normalized the current version
         denormalized_version = sauv.normalize_version(version=self.current_version)
 
@@ -329,13 +475,18 @@ class Orchestrator:
         version_path = os.path.join(
             sauc.SV_ASSET_DIR, f"subvortex-{denormalized_version}"
         )
-        is_exist = os.path.exists(version_path)
+        is_exist = saup.is_version_pulled(version=self.current_version)
         if is_exist:
             btul.logging.debug(
                 f"📦 Current assets already exist at: {version_path}",
                 prefix=sauc.SV_LOGGER_NAME,
             )
 
+            # Extract what has been skipped when pulled for another role, if any
+            await self.github.complete_assets(
+                version=self.current_version, role=sauc.SV_EXECUTION_ROLE
+            )
+
             return
 
         btul.logging.info(
@@ -344,25 +495,13 @@ class Orchestrator:
         )
 
         # Download and unzip the latest version
-        self._pull_assets(version=self.current_version)
+        await self._pull_assets(version=self.current_version)
 
-    def _pull_latest_assets(self):
-        if sauc.SV_EXECUTION_METHOD == "container":
-            # Collect all unique version strings from the nested structure
-            versions_to_pull = set()
-
-            for value in self.github.latest_versions.values():
-                if isinstance(value, dict):
-                    for v in value.values():
-                        if isinstance(v, str):
-                            versions_to_pull.add(v)
-                elif isinstance(value, str):
-                    versions_to_pull.add(value)
-
-            context = "container"
-        else:
-            versions_to_pull = {self.latest_version}
-            context = "non-container"
+    async def _pull_latest_assets(self):
+        versions_to_pull = self._get_latest_versions()
+        context = (
+            "container" if sauc.SV_EXECUTION_METHOD == "container" else "non-container"
+        )
 
         btul.logging.info(
             f"📦 Starting asset pull for {len(versions_to_pull)} version(s) "
@@ -370,52 +509,85 @@ class Orchestrator:
             prefix=sauc.SV_LOGGER_NAME,
         )
 
-        for version in versions_to_pull:
-            btul.logging.info(
-                f"📥 Pulling assets for version: {version}",
+        # Bound the number of downloads and extractions running at the same time
+        semaphore = asyncio.Semaphore(max(1, sauc.SV_PULL_CONCURRENCY))
+
+        async def pull(version: str):
+            async with semaphore:
+                await self._pull_latest_version_assets(version=version)
+
+        versions = sorted(versions_to_pull)
+        results = await asyncio.gather(
+            *[pull(version=x) for x in versions], return_exceptions=True
+        )
+
+        # Report every version that failed, not only the first one
+        failures = {
+            version: result
+            for version, result in zip(versions, results)
+            if isinstance(result, BaseException)
+        }
+        for version, error in failures.items():
+            btul.logging.error(
+                f"❌ Failed to pull assets for version {version}: {error}",
                 prefix=sauc.SV_LOGGER_NAME,
             )
 
-            try:
-                self._pull_assets(version=version)
-            except Exception as e:
-                btul.logging.error(
-                    f"❌ Failed to pull assets for version {version}: {e}",
-                    prefix=sauc.SV_LOGGER_NAME,
-                )
-                raise
+        if len(failures) == 1:
+            raise next(iter(failures.values()))
+
+        if failures:
+            raise saue.AssetsPullError(
+                versions=list(failures),
+                details="; ".join(f"{k}: {v}" for k, v in failures.items()),
+            )
+
+        btul.logging.info(
+            "✅ Asset pull completed.",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
 
-            path = saup.get_version_directory(version=version)
-            if not os.path.exists(path):
-                raise saue.MissingDirectoryError(directory_path=path)
+    async def _pull_latest_version_assets(self, version: str):
+        btul.logging.info(
+            f"📥 Pulling assets for version: {version}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
 
+        # Use the assets prefetched in the background, if any, already checked as pulled
+        await self.prefetcher.wait(version=version)
+        if self.prefetcher.consume(version=version):
+            # Prefetched by this cycle, removed by a rollback
+            self.pulled_versions.append(version)
+            return
+
+        if saup.is_version_pulled(version=version):
+            # Version already on disk, it is not removed by a rollback
             btul.logging.debug(
-                f"📁 Assets for version {version} extracted to: {path}",
+                f"📦 Assets for version {version} already pulled",
                 prefix=sauc.SV_LOGGER_NAME,
             )
+            return
 
-        btul.logging.info(
-            "✅ Asset pull completed.",
+        await self._pull_assets(version=version)
+
+        path = saup.get_version_directory(version=version)
+        if not saup.is_version_pulled(version=version):
+            raise saue.MissingDirectoryError(directory_path=path)
+
+        # Only the directories this cycle created are removed by a rollback
+        self.pulled_versions.append(version)
+
+        btul.logging.debug(
+            f"📁 Assets for version {version} extracted to: {path}",
             prefix=sauc.SV_LOGGER_NAME,
         )
 
     def _rollback_pull_latest_assets(self):
-        if sauc.SV_EXECUTION_METHOD == "container":
-            # Collect all unique version strings from the nested structure
-            versions_to_remove = set()
-
-            for value in self.github.latest_versions.values():
-                if isinstance(value, dict):
-                    for v in value.values():
-                        if isinstance(v, str):
-                            versions_to_remove.add(v)
-                elif isinstance(value, str):
-                    versions_to_remove.add(value)
-
-            context = "container"
-        else:
-            versions_to_remove = {self.latest_version}
-            context = "non-container"
+        # Only remove the versions pulled by this cycle
+        versions_to_remove = set(self.pulled_versions)
+        context = (
+            "container" if sauc.SV_EXECUTION_METHOD == "container" else "non-container"
+        )
 
         btul.logging.info(
             f"♻️ Rolling back pulled assets for {len(versions_to_remove)} version(s) "
@@ -442,6 +614,23 @@ class Orchestrator:
             prefix=sauc.SV_LOGGER_NAME,
         )
 
+    def _get_latest_versions(self):
+        if sauc.SV_EXECUTION_METHOD != "container":
+            return {self.latest_version}
+
+        # Collect all unique version strings from the nested structure
+        versions = set()
+
+        for value in self.github.latest_versions.values():
+            if isinstance(value, dict):
+                for v in value.values():
+                    if isinstance(v, str):
+                        versions.add(v)
+            elif isinstance(value, str):
+                versions.add(value)
+
+        return versions
+
     def _copy_env_files(self):
         for service in self.latest_services:
             # Create the env file path
@@ -459,7 +648,7 @@ class Orchestrator:
             env_file = f"{target_dir}/.env"
 
             # Copy the env file to the service directory
-            shutil.copy2(source_file, env_file)
+            sauu.copy_file(source_file, env_file)
 
             # Check if the file is there
             if not os.path.isfile(env_file):
@@ -490,7 +679,7 @@ class Orchestrator:
                 filename = os.path.basename(source_file).replace("template-", "")
                 target_path = os.path.join(target_dir, filename)
 
-                shutil.copy2(source_file, target_path)
+                sauu.copy_file(source_file, target_path)
 
                 if not os.path.isfile(target_path):
                     raise saue.MissingFileError(file_path=target_path)
@@ -613,48 +802,59 @@ class Orchestrator:
             x for x in self.services if x.must_remove or x.needs_update
         )
 
-    def _rollout_service(self):
+    async def _rollout_service(self):
         btul.logging.info("🚧 Rolling out services...", prefix=sauc.SV_LOGGER_NAME)
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.latest_services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.latest_services)
 
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order()
-
-        for service in sorted_services:
-            if not service.needs_update:
-                continue
+        # Set up each service once the ones it depends on are
+        services = [x for x in dependency_plan.order if x.needs_update]
 
+        async def setup(service: saus.Service):
             btul.logging.debug(
                 f"🔧 Setting up service: {service.name}", prefix=sauc.SV_LOGGER_NAME
             )
 
             # Execute the setup
-            self._execute_setup(service=service, version=self.latest_version)
+            await self._execute_setup(service=service, version=self.latest_version)
 
-    def _rollback_services(self):
+        await self._run_services(
+            services=services,
+            execute=setup,
+            plan=dependency_plan,
+            completed=self.completed_services["setup"],
+        )
+
+    async def _rollback_services(self):
         btul.logging.info(
             "♻️ Rolling back service installations...", prefix=sauc.SV_LOGGER_NAME
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.latest_services)
-
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order(reverse=True)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.latest_services)
 
-        for service in sorted_services:
-            if not service.needs_update or service.upgrade_type != "install":
-                continue
+        # Only tear down the services set up, the dependent ones first
+        services = [
+            x
+            for x in dependency_plan.reverse_order
+            if x.needs_update
+            and x.upgrade_type == "install"
+            and x.id in self.completed_services["setup"]
+        ]
 
+        async def teardown(service: saus.Service):
             btul.logging.debug(
                 f"🧨 Tearing down newly installed service: {service.name}",
                 prefix=sauc.SV_LOGGER_NAME,
             )
 
             # Execute the setup
-            self._execute_teardown(service=service, version=self.latest_version)
+            await self._execute_teardown(service=service, version=self.latest_version)
+
+        await self._run_services(
+            services=services, execute=teardown, plan=dependency_plan, reverse=True
+        )
 
     async def _pre_migrations(self):
         btul.logging.info(
@@ -718,74 +918,87 @@ class Orchestrator:
         btul.logging.info("↩️ Rolling back migrations...", prefix=sauc.SV_LOGGER_NAME)
         await self.migration_manager.rollback()
 
-    def _stop_current_services(self, service_filter: Callable = None):
+    async def _stop_current_services(self, service_filter: Callable = None):
         btul.logging.info(
             "🛑 Stopping outdated/removed services...", prefix=sauc.SV_LOGGER_NAME
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
-
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order(reverse=True)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
         # Create services mapping
         current_services_map = {s.id: s for s in self.current_services}
 
-        # Build the list of services to stop
-        services_to_stop = [
+        # Services upgraded side by side keep running until the new instance is ready
+        blue_green = {x.id for x in self._get_blue_green_services()}
+
+        # Build the services to stop, the dependent ones first
+        services = [
             service
-            for service in sorted_services
+            for service in dependency_plan.reverse_order
             if (service.needs_update or service.must_remove)
             and (not service_filter or service_filter(service))
             and service.id in current_services_map
+            and service.id not in blue_green
         ]
 
-        if not services_to_stop:
+        if not services:
             btul.logging.debug("No services to stop", prefix=sauc.SV_LOGGER_NAME)
             return
 
-        for service in services_to_stop:
+        async def stop(service: saus.Service):
             btul.logging.debug(
                 f"✋ Stopping service: {service.name}", prefix=sauc.SV_LOGGER_NAME
             )
-            self._execute_stop(
+
+            # The service is unavailable from now on, until the new one is ready
+            self.stopped_at[service.id] = time.monotonic()
+
+            await self._execute_stop(
                 service=current_services_map[service.id], version=self.current_version
             )
 
-    def _rollback_stop_current_services(self, service_filter: Callable = None):
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
+        await self._run_services(
+            services=services,
+            execute=stop,
+            plan=dependency_plan,
+            reverse=True,
+            completed=self.completed_services["stop"],
+        )
 
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order()
+    async def _rollback_stop_current_services(self, service_filter: Callable = None):
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
         # Create services mapping
         current_services_map = {s.id: s for s in self.current_services}
 
-        # Build the list of services to start
-        services_to_start = [
+        # Build the services to start, only the ones stopped
+        services = [
             service
-            for service in sorted_services
+            for service in dependency_plan.order
             if (service.needs_update or service.must_remove)
             and (not service_filter or service_filter(service))
             and service.id in current_services_map
+            and service.id in self.completed_services["stop"]
         ]
 
-        if not services_to_start:
+        if not services:
             btul.logging.debug(
                 "No services to start during rollback", prefix=sauc.SV_LOGGER_NAME
             )
             return
 
-        for service in services_to_start:
+        async def start(service: saus.Service):
             btul.logging.debug(
                 f"🔁 Restarting service: {service.name}", prefix=sauc.SV_LOGGER_NAME
             )
-            self._execute_start(
+            await self._execute_start(
                 service=current_services_map[service.id], version=self.current_version
             )
 
+        await self._run_services(services=services, execute=start, plan=dependency_plan)
+
     def _switch_services(self):
         btul.logging.info(
             "🔁 Switching service links to new versions...", prefix=sauc.SV_LOGGER_NAME
@@ -794,11 +1007,11 @@ class Orchestrator:
         # Ensure the working directory exists
         os.makedirs(sauc.SV_EXECUTION_DIR, exist_ok=True)
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
         # Sort the services
-        sorted_services = dependency_resolver.resolve_order()
+        sorted_services = dependency_plan.order
 
         for service in sorted_services:
             if not service.needs_update:
@@ -817,11 +1030,11 @@ class Orchestrator:
             "↩️ Reverting service version switches...", prefix=sauc.SV_LOGGER_NAME
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
         # Sort the services
-        sorted_services = dependency_resolver.resolve_order(reverse=True)
+        sorted_services = dependency_plan.reverse_order
 
         for service in sorted_services:
             if not service.needs_update:
@@ -842,19 +1055,21 @@ class Orchestrator:
             # Switch to previous version
             service.switch_to_version(version=service.rollback_version)
 
-    def _start_latest_services(self, service_filter: Callable = None):
+    async def _start_latest_services(self, service_filter: Callable = None):
         btul.logging.info(
             "🚀 Starting new/updated services...", prefix=sauc.SV_LOGGER_NAME
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order()
+        # Services upgraded side by side have been started already
+        blue_green = {x.id for x in self._get_blue_green_services()}
 
-        for service in sorted_services:
-            if not service.needs_update:
+        # Start each service once the ones it depends on are ready
+        services = []
+        for service in dependency_plan.order:
+            if not service.needs_update or service.id in blue_green:
                 continue
 
             if service_filter and not service_filter(service):
@@ -865,108 +1080,295 @@ class Orchestrator:
                     f"⏩ Skipping {service.name} (already started before migration)",
                     prefix=sauc.SV_LOGGER_NAME,
                 )
+                self.completed_services["start"].append(service.id)
                 continue
 
-            self._execute_start(service=service, version=self.latest_version)
+            services.append(service)
+
+        async def start(service: saus.Service):
+            await self._execute_start(service=service, version=self.latest_version)
+
+            # The service is available again, once ready
+            self._record_unavailability(service=service)
 
-    def _rollback_start_latest_services(self, service_filter: Callable = None):
+        await self._run_services(
+            services=services,
+            execute=start,
+            plan=dependency_plan,
+            completed=self.completed_services["start"],
+        )
+
+    async def _rollback_start_latest_services(self, service_filter: Callable = None):
         btul.logging.info(
             "🛑 Stopping newly started services (rollback)...",
             prefix=sauc.SV_LOGGER_NAME,
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order(reverse=True)
+        # Only stop the services started, the dependent ones first
+        services = [
+            x
+            for x in dependency_plan.reverse_order
+            if x.needs_update
+            and (not service_filter or service_filter(x))
+            and x.id in self.completed_services["start"]
+        ]
 
-        for service in sorted_services:
-            if not service.needs_update:
-                continue
+        async def stop(service: saus.Service):
+            btul.logging.debug(
+                f"✋ Stopping service: {service.name}", prefix=sauc.SV_LOGGER_NAME
+            )
 
-            if service_filter and not service_filter(service):
-                continue
+            await self._execute_stop(service=service, version=self.latest_version)
+
+        await self._run_services(
+            services=services, execute=stop, plan=dependency_plan, reverse=True
+        )
+
+    async def _start_next_instances(self):
+        btul.logging.info(
+            "🟢 Starting new instances next to the previous ones...",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
 
+        async def start(service: saus.Service):
+            instance = saubg.get_other_instance(saubg.get_instance(service.id))
             btul.logging.debug(
-                f"✋ Stopping service: {service.name}", prefix=sauc.SV_LOGGER_NAME
+                f"🟢 Starting service: {service.name} ({instance})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            try:
+                await self._execute_start(
+                    service=service, version=self.latest_version, instance=instance
+                )
+                self.ready_at[service.id] = time.monotonic()
+            except Exception:
+                # Do not leave the new instance half started, the previous one keeps serving
+                await self._execute_stop(
+                    service=service, version=self.latest_version, instance=instance
+                )
+                raise
+
+        await self._run_services(
+            services=self._get_blue_green_services(),
+            execute=start,
+            plan=dependency_plan,
+            completed=self.completed_services["start_next"],
+        )
+
+    async def _rollback_start_next_instances(self):
+        btul.logging.info(
+            "♻️ Stopping new instances, keeping the previous ones...",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
+
+        # Only stop the new instances started, the dependent ones first
+        services = [
+            x
+            for x in dependency_plan.reverse_order
+            if x.id in self.completed_services["start_next"]
+        ]
+
+        async def stop(service: saus.Service):
+            instance = saubg.get_other_instance(saubg.get_instance(service.id))
+            btul.logging.debug(
+                f"✋ Stopping service: {service.name} ({instance})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            await self._execute_stop(
+                service=service, version=self.latest_version, instance=instance
+            )
+
+        await self._run_services(
+            services=services, execute=stop, plan=dependency_plan, reverse=True
+        )
+
+    async def _stop_previous_instances(self):
+        btul.logging.info(
+            "🔵 Stopping previous instances...", prefix=sauc.SV_LOGGER_NAME
+        )
+
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
+
+        # Create services mapping
+        current_services_map = {s.id: s for s in self.current_services}
+
+        # Only stop the previous instances of the new ones started, the dependent ones first
+        services = [
+            x
+            for x in dependency_plan.reverse_order
+            if x.id in self.completed_services["start_next"]
+        ]
+
+        async def stop(service: saus.Service):
+            instance = saubg.get_instance(service.id)
+            btul.logging.debug(
+                f"✋ Stopping service: {service.name} ({instance})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            self.stopped_at[service.id] = time.monotonic()
+            await self._execute_stop(
+                service=current_services_map[service.id],
+                version=self.current_version,
+                instance=instance,
+            )
+
+            # The new instance serves from now on
+            saubg.set_instance(service.id, saubg.get_other_instance(instance))
+
+            # Unavailable from the stop of the previous instance until the new one was ready
+            self._record_unavailability(
+                service=service, ready_at=self.ready_at.pop(service.id, None)
+            )
+
+        await self._run_services(
+            services=services,
+            execute=stop,
+            plan=dependency_plan,
+            reverse=True,
+            completed=self.completed_services["stop_previous"],
+        )
+
+    async def _rollback_stop_previous_instances(self):
+        btul.logging.info(
+            "♻️ Restarting previous instances...", prefix=sauc.SV_LOGGER_NAME
+        )
+
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.services)
+
+        # Create services mapping
+        current_services_map = {s.id: s for s in self.current_services}
+
+        # Only restart the previous instances stopped
+        services = [
+            x
+            for x in dependency_plan.order
+            if x.id in self.completed_services["stop_previous"]
+        ]
+
+        async def start(service: saus.Service):
+            instance = saubg.get_other_instance(saubg.get_instance(service.id))
+            btul.logging.debug(
+                f"🔁 Restarting service: {service.name} ({instance})",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            await self._execute_start(
+                service=current_services_map[service.id],
+                version=self.current_version,
+                instance=instance,
             )
 
-            self._execute_stop(service=service, version=self.latest_version)
+            # The previous instance serves again
+            saubg.set_instance(service.id, instance)
 
-    def _prune_services(self):
+        await self._run_services(services=services, execute=start, plan=dependency_plan)
+
+    async def _prune_services(self):
         btul.logging.info("🧹 Pruning removed services...", prefix=sauc.SV_LOGGER_NAME)
 
         if sauc.SV_EXECUTION_METHOD == "container":
             # Prune useless images
-            self.github.prune_images()
+            await self.github.prune_images()
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.current_services)
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.current_services)
 
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order(reverse=True)
+        # Build the services to tear down, the dependent ones first
+        services = [x for x in dependency_plan.reverse_order if x.must_remove]
 
-        has_turndown_services = False
-        for service in sorted_services:
-            if not service.must_remove:
-                continue
-
-            has_turndown_services = True
+        if not services:
+            btul.logging.debug("No services to prune", prefix=sauc.SV_LOGGER_NAME)
+            return
 
+        async def teardown(service: saus.Service):
             btul.logging.debug(
                 f"🗑️ Tearing down service: {service.name}", prefix=sauc.SV_LOGGER_NAME
             )
 
             # Execute the setup
-            self._execute_teardown(service=service, version=self.current_version)
-
-        if not has_turndown_services:
-            btul.logging.debug("No services to prune", prefix=sauc.SV_LOGGER_NAME)
+            await self._execute_teardown(service=service, version=self.current_version)
+
+        await self._run_services(
+            services=services,
+            execute=teardown,
+            plan=dependency_plan,
+            reverse=True,
+            completed=self.completed_services["teardown"],
+        )
 
-    def _rollback_prune_services(self):
+    async def _rollback_prune_services(self):
         btul.logging.info(
             "♻️ Re-installing previously pruned services...", prefix=sauc.SV_LOGGER_NAME
         )
 
-        # Create the dependency resolver
-        dependency_resolver = saudr.DependencyResolver(services=self.current_services)
-
-        # Sort the services
-        sorted_services = dependency_resolver.resolve_order()
+        # Get the dependency plan
+        dependency_plan = self._get_dependency_plan(services=self.current_services)
 
-        has_turndown_services = False
-        for service in sorted_services:
-            if not service.must_remove:
-                continue
+        # Only set up the services torn down
+        services = [
+            x
+            for x in dependency_plan.order
+            if x.must_remove and x.id in self.completed_services["teardown"]
+        ]
 
-            has_turndown_services = True
+        if not services:
+            btul.logging.debug(f"No services to teardown", prefix=sauc.SV_LOGGER_NAME)
+            return
 
+        async def setup(service: saus.Service):
             btul.logging.debug(
                 f"📦 Re-setting up service: {service.name}", prefix=sauc.SV_LOGGER_NAME
             )
 
             # Execute the setup
-            self._execute_setup(service=service, version=self.current_version)
+            await self._execute_setup(service=service, version=self.current_version)
 
-        if not has_turndown_services:
-            btul.logging.debug(f"No services to teardown", prefix=sauc.SV_LOGGER_NAME)
+        await self._run_services(services=services, execute=setup, plan=dependency_plan)
 
     def _remove_services(self):
-        if sauc.SV_EXECUTION_METHOD == "container":
-            # Collect versions that are in current but not in latest
+        if sauc.SV_SOAK_PERIOD > 0:
+            # Keep the previous versions warm until the new ones have soaked, so a rollback needs no download
+            deadline = time.time() + sauc.SV_SOAK_PERIOD
+            for version in self._get_previous_versions():
+                btul.logging.info(
+                    f"⏳ Keeping version {version} for a soak period of {sauc.SV_SOAK_PERIOD}s",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+                self.soaking_versions[version] = deadline
 
-            # Get all the version in the latest services
-            latest_versions = [x.version for x in self.latest_services]
+            sausk.save_soaking_versions(self.soaking_versions)
+            return
 
-            # Get all the versions that are not used in latest services
-            obsolete_versions = [
-                svc.version
-                for svc in self.current_services
-                if svc.version not in latest_versions
-            ]
+        if self.retention.enabled:
+            # Keep the previous versions warm for a rollback, within the retention policy
+            protected = {x.version for x in self.latest_services}
+            protected.add(self.latest_version)
+            protected.update(self.soaking_versions)
+
+            reclaimed = self.retention.apply(protected=list(protected))
+            btul.logging.info(
+                f"🗑️ {len(reclaimed)} version(s) reclaimed by the retention policy",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return
 
-            for version in obsolete_versions:
+        if sauc.SV_EXECUTION_METHOD == "container":
+            # Collect versions that are in current but not in latest
+            for version in self._get_previous_versions():
                 btul.logging.info(
                     f"🗑️ Removing obsolete version assets: {version}",
                     prefix=sauc.SV_LOGGER_NAME,
@@ -981,7 +1383,150 @@ class Orchestrator:
             )
             self._remove_assets(version=self.current_version)
 
-    def _rollback_remove_services(self):
+    async def _check_soaking_versions(self):
+        # The versions of the containers are not switched back by a link
+        if self.soaking_versions and sauc.SV_EXECUTION_METHOD != "container":
+            if await self._rollback_unhealthy_services():
+                return
+
+        self._remove_soaked_versions()
+
+    async def _rollback_unhealthy_services(self):
+        # The version soaking the longest to go is the one the last upgrade came from
+        version = max(self.soaking_versions, key=self.soaking_versions.get)
+        if version == self.current_version or not saup.is_version_pulled(
+            version=version
+        ):
+            return False
+
+        # Check the services of the version installed
+        services = self._load_services(
+            version=self.current_version, versions=lambda name: {}
+        )
+        errors = await self._check_services_health(services=services)
+        if not errors:
+            return False
+
+        btul.logging.error(
+            f"❌ Services unhealthy during the soak period of version {self.current_version}: {'; '.join(errors)}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        await self._rollback_to_soaking_version(version=version, services=services)
+        return True
+
+    async def _check_services_health(self, services: List[saus.Service]):
+        async def check(service: saus.Service):
+            readiness = saurd.Readiness(
+                service=service,
+                instance=saubg.get_instance(service.id) if service.blue_green else None,
+                health=True,
+            )
+            await readiness.wait()
+
+        results = await asyncio.gather(
+            *[check(x) for x in services], return_exceptions=True
+        )
+
+        return [str(x) for x in results if isinstance(x, Exception)]
+
+    async def _rollback_to_soaking_version(
+        self, version: str, services: List[saus.Service]
+    ):
+        started_at = time.monotonic()
+        btul.logging.warning(
+            f"⏪ Rolling back to version {version}, kept warm during the soak period",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        previous_services = self._load_services(
+            version=version, versions=lambda name: {}
+        )
+
+        # Stop the unhealthy services, the dependent ones first
+        dependency_plan = self._get_dependency_plan(services=services)
+
+        async def stop(service: saus.Service):
+            btul.logging.debug(
+                f"✋ Stopping service: {service.name}", prefix=sauc.SV_LOGGER_NAME
+            )
+            await self._execute_stop(service=service, version=self.current_version)
+
+        await self._run_services(
+            services=dependency_plan.reverse_order,
+            execute=stop,
+            plan=dependency_plan,
+            reverse=True,
+        )
+
+        # Switch back to the version kept warm, nothing to download
+        dependency_plan = self._get_dependency_plan(services=previous_services)
+        for service in dependency_plan.order:
+            service.switch_to_version(version=version)
+
+        async def start(service: saus.Service):
+            btul.logging.debug(
+                f"🔁 Restarting service: {service.name}", prefix=sauc.SV_LOGGER_NAME
+            )
+            await self._execute_start(service=service, version=version)
+
+        await self._run_services(
+            services=dependency_plan.order, execute=start, plan=dependency_plan
+        )
+
+        # The version is in use again, it does not soak anymore
+        self.current_version = version
+        del self.soaking_versions[version]
+        sausk.save_soaking_versions(self.soaking_versions)
+
+        btul.logging.success(
+            f"⏱️ Rolled back to version {version} in {time.monotonic() - started_at:.2f}s",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+    def _remove_soaked_versions(self):
+        # Versions in use again, after a rollback, are not removed anymore
+        versions_in_use = self._get_versions_in_use()
+
+        now = time.time()
+        soaking_versions = dict(self.soaking_versions)
+        soaked_versions = []
+        for version, deadline in list(self.soaking_versions.items()):
+            if version in versions_in_use:
+                del self.soaking_versions[version]
+                continue
+
+            if deadline > now:
+                continue
+
+            del self.soaking_versions[version]
+            soaked_versions.append(version)
+
+        if self.soaking_versions != soaking_versions:
+            sausk.save_soaking_versions(self.soaking_versions)
+
+        if not soaked_versions:
+            return
+
+        btul.logging.info(
+            f"🧪 Soak period over for version(s): {', '.join(sorted(soaked_versions))}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        if self.retention.enabled:
+            # Let the retention policy decide which ones to keep warm
+            protected = versions_in_use | set(self.soaking_versions)
+            self.retention.apply(protected=list(protected))
+            return
+
+        for version in soaked_versions:
+            btul.logging.info(
+                f"🗑️ Removing previous version assets: {version}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            self._remove_assets(version=version)
+
+    async def _rollback_remove_services(self):
         if sauc.SV_EXECUTION_METHOD == "container":
             # Determine versions that were removed and should be re-pulled
 
@@ -1007,7 +1552,7 @@ class Orchestrator:
                         f"♻️ Re-pulling container version: {version}",
                         prefix=sauc.SV_LOGGER_NAME,
                     )
-                    self._pull_assets(version=version)
+                    await self._pull_assets(version=version)
                 except Exception as e:
                     btul.logging.error(
                         f"❌ Failed to re-pull container version {version}: {e}",
@@ -1020,7 +1565,7 @@ class Orchestrator:
                 prefix=sauc.SV_LOGGER_NAME,
             )
             try:
-                self._pull_assets(version=self.current_version)
+                await self._pull_assets(version=self.current_version)
             except Exception as e:
                 btul.logging.error(
                     f"❌ Failed to re-pull current version {self.current_version}: {e}",
@@ -1043,6 +1588,25 @@ class Orchestrator:
             service.version = service.rollback_version
             service.rollback_version = None
 
+    def _get_previous_versions(self):
+        if sauc.SV_EXECUTION_METHOD != "container":
+            return [self.current_version]
+
+        # Get all the version in the latest services
+        latest_versions = [x.version for x in self.latest_services]
+
+        # Get all the versions that are not used in latest services
+        return [
+            svc.version
+            for svc in self.current_services
+            if svc.version not in latest_versions
+        ]
+
+    def _get_versions_in_use(self):
+        versions = {self.current_version, self.latest_version}
+        versions.update(x.version for x in self.current_services + self.latest_services)
+        return {x for x in versions if x}
+
     def _is_already_pulled_current_version(self):
         # Normalized the current version
         denormalized_version = sauv.normalize_version(version=self.current_version)
@@ -1051,7 +1615,7 @@ class Orchestrator:
         version_path = os.path.join(
             sauc.SV_ASSET_DIR, f"subvortex-{denormalized_version}"
         )
-        is_exist = os.path.exists(version_path)
+        is_exist = saup.is_version_pulled(version=self.current_version)
         if is_exist:
             btul.logging.debug(
                 f"Version {self.current_version} already pulled in {version_path}",
@@ -1101,27 +1665,176 @@ class Orchestrator:
 
         return services
 
-    def _execute_setup(self, service: saus.Service, version: str):
+    def _get_blue_green_services(self) -> List[saus.Service]:
+        if not sauc.SV_BLUE_GREEN or sauc.SV_EXECUTION_METHOD == "container":
+            return []
+
+        # Upgraded services whose scripts can run two instances, without data to migrate
+        current_ids = {x.id for x in self.current_services}
+        candidates = {
+            x.id
+            for x in self.services
+            if x.needs_update
+            and x.blue_green
+            and x.id in current_ids
+            and not self._has_migrations(x)
+            and saurd.is_instance_aware(x)
+        }
+
+        # A service depending on one restarted would lose it during the switch
+        dependency_plan = self._get_dependency_plan(services=self.services)
+        for service in self.services:
+            if (service.needs_update or service.must_remove) and (
+                service.id not in candidates
+            ):
+                candidates -= dependency_plan.get_dependents(service.id)
+
+        return [x for x in dependency_plan.order if x.id in candidates]
+
+    def _has_blue_green_services(self):
+        return len(self._get_blue_green_services()) > 0
+
+    def _record_unavailability(self, service: saus.Service, ready_at: float = None):
+        # A new service was not available before
+        stopped_at = self.stopped_at.pop(service.id, None)
+        if stopped_at is None:
+            return
+
+        # A new instance ready before the previous one stopped left no gap
+        ready_at = time.monotonic() if ready_at is None else ready_at
+        self.unavailability[service.id] = max(0.0, ready_at - stopped_at)
+        btul.logging.info(
+            f"⏱️ {service.name} unavailable for {self.unavailability[service.id]:.2f}s",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+    def _has_shared_files(self):
+        # Deduplicated and delta-updated versions link their files to the other versions
+        return (sauc.SV_DEDUP or sauc.SV_DELTA_UPDATE) and sauc.SV_DEDUP_BREAK_ON_WRITE
+
+    async def _break_links(self, service: saus.Service, version: str):
+        # Only the files the setup writes in place lose their link, the others stay shared
+        version_dir = saup.get_version_directory(version=version)
+        paths = [saup.get_service_directory(service=service, version=version)]
+        paths += [os.path.join(version_dir, x) for x in sauc.SV_DEDUP_WRITABLE_PATHS]
+
+        link_breaks = []
+        for path in paths:
+            # A path shared by several services is copied once
+            link_break = self.link_breaks.get(path)
+            if link_break is None:
+                link_break = asyncio.ensure_future(
+                    asyncio.to_thread(saudd.break_links, path)
+                )
+                self.link_breaks[path] = link_break
+
+            link_breaks.append(link_break)
+
+        await asyncio.gather(*link_breaks)
+
+    def _get_dependency_plan(self, services: List[saus.Service]):
+        # Identify the set by its services, which the plan holds, and their dependencies
+        key = tuple((id(x), tuple(x.depends_on or [])) for x in services)
+
+        plan = self.dependency_plans.get(key)
+        if plan is None:
+            plan = saudr.DependencyPlan(services=services)
+            self.dependency_plans[key] = plan
+
+        return plan
+
+    async def _run_services(
+        self,
+        services: List[saus.Service],
+        execute: Callable[[saus.Service], Awaitable],
+        plan: saudr.DependencyPlan,
+        reverse: bool = False,
+        completed: List[str] = None,
+    ):
+        # Bound the number of scripts running at the same time
+        semaphore = asyncio.Semaphore(max(1, sauc.SV_SERVICE_CONCURRENCY))
+        tasks: Dict[str, asyncio.Task] = {}
+        failures: List[BaseException] = []
+
+        async def run(service: saus.Service):
+            # Wait for the services to run before, the dependent ones when reversed
+            previous = plan.dependents[service.id] if reverse else service.depends_on
+            waiting = [tasks[x] for x in previous or [] if x in tasks]
+            if waiting:
+                await asyncio.wait(waiting)
+
+            async with semaphore:
+                # Start nothing more once a script has failed
+                if failures:
+                    return
+
+                try:
+                    await execute(service)
+                except Exception as err:
+                    failures.append(err)
+                    return
+
+            # Record the service, so only the completed ones are rolled back
+            if completed is not None:
+                completed.append(service.id)
+
+        for service in services:
+            tasks[service.id] = asyncio.ensure_future(run(service))
+
+        await asyncio.gather(*tasks.values())
+
+        # The scripts in flight have completed, stop at the first failure
+        if failures:
+            raise failures[0]
+
+    async def _execute_setup(self, service: saus.Service, version: str):
         # Run the script
-        self._run(action="setup", service=service, version=version)
+        await self._run(action="setup", service=service, version=version)
 
-    def _execute_start(self, service: saus.Service, version: str):
+    async def _execute_start(
+        self, service: saus.Service, version: str, instance: str = None
+    ):
         # Define the action
         args = ["--recreate"] if sauc.SV_EXECUTION_METHOD == "container" else []
 
+        # Probe the instance started, for a service upgraded side by side
+        if service.blue_green and not instance:
+            instance = saubg.get_instance(service.id)
+
+        # Create the probes before starting, to only match what the new run logs
+        readiness = saurd.Readiness(service=service, instance=instance)
+
         # Run the script
-        self._run(action="start", service=service, version=version, args=args)
+        await self._run(
+            action="start",
+            service=service,
+            version=version,
+            args=args,
+            instance=instance,
+        )
+
+        # Wait for the service to be ready, before starting the ones depending on it
+        await readiness.wait()
 
-    def _execute_stop(self, service: saus.Service, version: str):
+    async def _execute_stop(
+        self, service: saus.Service, version: str, instance: str = None
+    ):
         # Run the script
-        self._run(action="stop", service=service, version=version)
+        await self._run(
+            action="stop", service=service, version=version, instance=instance
+        )
 
-    def _execute_teardown(self, service: saus.Service, version: str):
+    async def _execute_teardown(self, service: saus.Service, version: str):
         # Run the script
-        self._run(action="teardown", service=service, version=version)
+        await self._run(action="teardown", service=service, version=version)
 
-    def _run(
-        self, action: str, service: saus.Service, version: str, args: List[str] = []
+    async def _run(
+        self,
+        action: str,
+        service: saus.Service,
+        version: str,
+        args: List[str] = [],
+        instance: str = None,
     ):
         # Build the setup script path
         script_file = saup.get_service_script(
@@ -1134,6 +1847,10 @@ class Orchestrator:
 
         # TODO: display the script file to check it has the right path!!!
 
+        # Files shared with another version must not be changed by the setup
+        if action == "setup" and self._has_shared_files():
+            await self._break_links(service=service, version=version)
+
         btul.logging.debug(
             f"⚙️ Running {action} for {service.name} (version: {service.version})",
             prefix=sauc.SV_LOGGER_NAME,
@@ -1152,32 +1869,43 @@ class Orchestrator:
 
         env["SUBVORTEX_EXECUTION_DIR"] = sauc.SV_EXECUTION_DIR
 
-        try:
-            result = subprocess.run(
-                ["bash", script_file] + args,
-                cwd=os.path.dirname(script_file),
-                env=env,
-                capture_output=True,
-                text=True,
-                check=False,
+        # Tell the scripts of a service upgraded side by side which instance to act on
+        if service.blue_green:
+            env["SUBVORTEX_INSTANCE"] = instance or saubg.get_instance(service.id)
+
+        # The execution directory points to one version only, run both instances from their own
+        if instance and action in ["start", "stop"]:
+            env["SUBVORTEX_WORKING_DIR"] = saup.get_version_directory(version=version)
+
+        # Stream the output of the script, raise if it fails or times out
+        await self.runner.run(
+            ["bash", script_file] + args,
+            action=action,
+            name=service.name,
+            cwd=os.path.dirname(script_file),
+            env=env,
+            timeout=service.get_timeout(action),
+        )
+
+    async def _pull_assets(self, version: str):
+        # Use the version kept warm, if any
+        path = saup.get_version_directory(version=version)
+        if saup.is_version_pulled(version=version):
+            btul.logging.debug(
+                f"Version {version} already pulled in {path}",
+                prefix=sauc.SV_LOGGER_NAME,
             )
+            return
 
-            if btul.logging.current_state == btul.logging.Trace:
-                btul.logging.debug(
-                    f"📝 {service.name} {action} stdout:\n{result.stdout.strip()}",
-                    prefix=sauc.SV_LOGGER_NAME,
-                )
-                if result.stderr.strip():
-                    btul.logging.debug(
-                        f"⚠️ {service.name} {action} stderr:\n{result.stderr.strip()}",
-                        prefix=sauc.SV_LOGGER_NAME,
-                    )
-        except subprocess.CalledProcessError as e:
-            raise saue.RuntimeError(action=action, details=str(e))
+        # Undelete the version if it has not been collected yet
+        if self.trash.restore(path=path) and saup.is_version_pulled(version=version):
+            btul.logging.debug(
+                f"Version {version} restored in {path}", prefix=sauc.SV_LOGGER_NAME
+            )
+            return
 
-    def _pull_assets(self, version: str):
         # Download and unzip the latest version
-        path = self.github.download_and_unzip_assets(
+        path = await self.github.download_and_unzip_assets(
             version=version,
             role=sauc.SV_EXECUTION_ROLE,
         )
@@ -1192,8 +1920,17 @@ class Orchestrator:
         if not os.path.exists(asset_dir):
             return
 
-        # Remove the directory
-        shutil.rmtree(asset_dir, onerror=lambda *args, **kwargs: None)
+        try:
+            # Move the directory into the trash, it is deleted in the background
+            self.trash.put(path=asset_dir)
+        except OSError as e:
+            btul.logging.trace(
+                f"Could not move {asset_dir} into the trash: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+            # Remove the directory
+            shutil.rmtree(asset_dir, onerror=lambda *args, **kwargs: None)
 
         # Notify the success
         btul.logging.debug(
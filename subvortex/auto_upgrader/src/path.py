@@ -38,6 +38,22 @@ def get_version_directory(version: str):
     return path
 
 
+def is_version_pulled(version: str):
+    # Get the version directory
+    version_path = get_version_directory(version=version)
+    if not version_path:
+        return False
+
+    # Only a completely extracted directory has the marker
+    if os.path.exists(os.path.join(version_path, sauc.SV_ASSET_COMPLETE_MARKER)):
+        return True
+
+    # The installed version has been extracted before the marker existed
+    return os.path.isdir(version_path) and os.path.realpath(
+        sauc.SV_EXECUTION_DIR
+    ) == os.path.realpath(version_path)
+
+
 def get_role_directory(version: str):
     if not version:
         return None
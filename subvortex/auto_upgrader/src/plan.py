@@ -0,0 +1,131 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+import subvortex.auto_upgrader.src.exception as saue
+
+
+class Step:
+    def __init__(
+        self,
+        id: str,
+        description: str,
+        action: Callable,
+        rollback: Callable = None,
+        condition: Callable[[], bool] = None,
+        depends_on: List[str] = None,
+    ):
+        self.id = id
+        self.description = description
+        self.action = action
+        self.rollback = rollback
+        self.condition = condition
+        self.depends_on = depends_on or []
+
+
+class Plan:
+    """
+    Graph of steps, each one started as soon as the ones it depends on are completed.
+    """
+
+    def __init__(self, steps: List[Step]):
+        self.steps = {x.id: x for x in steps}
+        self.timings: Dict[str, float] = {}
+        self.completed: List[str] = []
+
+        # Fail before running anything rather than in the middle of the plan
+        self.order()
+
+    def order(self) -> List[Step]:
+        """
+        Return the steps in topological order, the declaration order breaking the ties.
+        """
+        for step in self.steps.values():
+            for dep in step.depends_on:
+                if dep not in self.steps:
+                    raise saue.InvalidPlanError(
+                        details=f"Step {step.id} depends on unknown step {dep}"
+                    )
+
+        ordered, done = [], set()
+        while len(ordered) < len(self.steps):
+            ready = [
+                x
+                for x in self.steps.values()
+                if x.id not in done and all(d in done for d in x.depends_on)
+            ]
+            if not ready:
+                raise saue.InvalidPlanError(details="Cyclic dependency detected")
+
+            ordered.extend(ready)
+            done.update(x.id for x in ready)
+
+        return ordered
+
+    async def run(self, execute: Callable[[Step], Awaitable]):
+        """
+        Run the steps with `execute`, the independent ones concurrently. On failure, no
+        other step is started and the ones in flight are awaited before raising the
+        first failure.
+        """
+        pending = dict(self.steps)
+        running: Dict[asyncio.Task, Step] = {}
+        failures = []
+
+        try:
+            while pending or running:
+                # Start every step whose dependencies are completed
+                for step in list(pending.values()) if not failures else []:
+                    if all(d in self.completed for d in step.depends_on):
+                        del pending[step.id]
+                        task = asyncio.create_task(self._run_step(step, execute))
+                        running[task] = step
+
+                if not running:
+                    break
+
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                # Handle the steps in the order they have been started
+                for task in [x for x in running if x in finished]:
+                    step = running.pop(task)
+                    if task.exception():
+                        failures.append(task.exception())
+                        continue
+
+                    self.completed.append(step.id)
+        finally:
+            # Cancelled, do not leave any step running
+            for task in running:
+                task.cancel()
+
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if failures:
+            raise failures[0]
+
+    async def _run_step(self, step: Step, execute: Callable[[Step], Awaitable]):
+        start_time = time.monotonic()
+        try:
+            await execute(step)
+        finally:
+            self.timings[step.id] = time.monotonic() - start_time
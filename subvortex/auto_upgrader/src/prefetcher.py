@@ -0,0 +1,156 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import time
+import asyncio
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.path as saup
+import subvortex.auto_upgrader.src.utils as sauu
+
+
+class Prefetcher:
+    """
+    Download, verify and extract a newer release in the background, between two
+    checks, so the upgrade finds its assets ready.
+    """
+
+    def __init__(self, github):
+        self.github = github
+        self.tasks = {}
+        self.prefetched = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="prefetcher",
+            initializer=sauu.lower_priority,
+        )
+
+    async def watch(self):
+        # Containers are pulled by docker, nothing to prefetch
+        if sauc.SV_EXECUTION_METHOD == "container" or sauc.SV_PREFETCH_INTERVAL <= 0:
+            return
+
+        while True:
+            await asyncio.sleep(sauc.SV_PREFETCH_INTERVAL)
+            await self.check()
+
+    async def check(self):
+        try:
+            # Leave the force reinstall marker for the upgrade to find
+            current_version = self.github.get_installed_version()
+
+            # Served by the http cache as long as no release is published
+            latest_version = await self.github.get_latest_version()
+        except Exception as e:
+            btul.logging.debug(
+                f"Prefetch check failed: {e}", prefix=sauc.SV_LOGGER_NAME
+            )
+            return
+
+        current_version = current_version or sauc.DEFAULT_LAST_RELEASE.get("global")
+        if not latest_version or latest_version == current_version:
+            return
+
+        self.schedule(version=latest_version)
+
+    def schedule(self, version: str):
+        # Prefetch each version once
+        if version in self.tasks or version in self.prefetched:
+            return
+
+        # Version already pulled
+        if saup.is_version_pulled(version=version):
+            return
+
+        btul.logging.info(
+            f"🔭 New version {version} detected, prefetching its assets",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        self.tasks[version] = asyncio.create_task(self._prefetch(version=version))
+
+    async def wait(self, version: str):
+        # Let a prefetch in progress finish rather than pulling the version twice
+        task = self.tasks.get(version)
+        if task is None:
+            return
+
+        btul.logging.debug(
+            f"Waiting for the prefetch of version {version} to finish",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+        await asyncio.wait([task])
+
+    def consume(self, version: str):
+        ready_at = self.prefetched.pop(version, None)
+        if ready_at is None:
+            return False
+
+        # The assets may have been removed since, e.g. by a rollback
+        if not saup.is_version_pulled(version=version):
+            return False
+
+        btul.logging.info(
+            f"⚡ Assets of version {version} prefetched {time.time() - ready_at:.1f}s ahead of the upgrade",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        return True
+
+    def cancel(self):
+        for task in self.tasks.values():
+            task.cancel()
+
+    async def _prefetch(self, version: str):
+        start = time.time()
+
+        try:
+            # Run at low priority to not slow down the running neuron
+            path = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                partial(
+                    self.github.download_and_unzip_assets_sync,
+                    version=version,
+                    role=sauc.SV_EXECUTION_ROLE,
+                ),
+            )
+        except saue.OperationCancelledError:
+            return
+        except Exception as e:
+            # Not an error, the upgrade will pull the version itself
+            btul.logging.warning(
+                f"⚠️ Prefetch of version {version} failed: {e}",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+            return
+        finally:
+            self.tasks.pop(version, None)
+
+        if not path:
+            return
+
+        self.prefetched[version] = time.time()
+
+        btul.logging.info(
+            f"📦 Version {version} prefetched in {path} ({time.time() - start:.1f}s)",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
@@ -0,0 +1,335 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import re
+import abc
+import time
+import asyncio
+import requests
+from typing import Awaitable, Callable, List
+from redis import asyncio as aioredis
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.blue_green as saubg
+
+
+class Probe(abc.ABC):
+    # Settings the manifest has to provide
+    required = []
+
+    def __init__(self, config: dict):
+        missing = [x for x in self.required if x not in config]
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+
+        self.config = config
+        self.error = None
+
+        # Time the service has to be ready by, set when the probe is polled
+        self.deadline = None
+
+    @property
+    def timeout(self):
+        # Time a check can take, its own if the manifest sets one, within the deadline
+        timeout = float(self.config.get("timeout") or sauc.SV_READINESS_TIMEOUT)
+        if self.deadline is None:
+            return timeout
+
+        remaining = self.deadline - time.monotonic()
+        return max(min(timeout, remaining), sauc.SV_READINESS_MIN_INTERVAL)
+
+    @property
+    def description(self):
+        return self.config["type"]
+
+    async def check(self) -> bool:
+        try:
+            return await self._check()
+        except Exception as err:
+            # Not ready yet, keep the reason for the report
+            self.error = str(err) or type(err).__name__
+            return False
+
+    @abc.abstractmethod
+    async def _check(self) -> bool:
+        pass
+
+
+class TcpProbe(Probe):
+    required = ["port"]
+
+    @property
+    def description(self):
+        return f"tcp {self.config.get('host', 'localhost')}:{self.config['port']}"
+
+    async def _check(self):
+        _, writer = await asyncio.open_connection(
+            self.config.get("host", "localhost"), int(self.config["port"])
+        )
+        writer.close()
+        await writer.wait_closed()
+        return True
+
+
+class HttpProbe(Probe):
+    required = ["url"]
+
+    @property
+    def description(self):
+        return f"http {self.config['url']}"
+
+    async def _check(self):
+        response = await asyncio.to_thread(
+            requests.get, self.config["url"], timeout=self.timeout
+        )
+
+        status = self.config.get("status")
+        if status:
+            ready = response.status_code == int(status)
+        else:
+            ready = 200 <= response.status_code < 400
+
+        if not ready:
+            self.error = f"status {response.status_code}"
+
+        return ready
+
+
+class RedisProbe(Probe):
+    @property
+    def description(self):
+        return f"redis {self._get_host()}:{self._get_port()}"
+
+    async def _check(self):
+        client = aioredis.StrictRedis(
+            host=self._get_host(),
+            port=self._get_port(),
+            db=int(self.config.get("index", os.getenv("SUBVORTEX_REDIS_INDEX", 0))),
+            password=self.config.get("password", os.getenv("SUBVORTEX_REDIS_PASSWORD")),
+            socket_connect_timeout=self.timeout,
+            socket_timeout=self.timeout,
+        )
+        try:
+            return await client.ping()
+        finally:
+            await client.close()
+
+    def _get_host(self):
+        return self.config.get("host", os.getenv("SUBVORTEX_REDIS_HOST", "localhost"))
+
+    def _get_port(self):
+        return int(self.config.get("port", os.getenv("SUBVORTEX_REDIS_PORT", 6379)))
+
+
+class ProcessProbe(Probe):
+    required = ["pattern"]
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.pattern = re.compile(config["pattern"])
+
+    @property
+    def description(self):
+        return f"process {self.config['pattern']}"
+
+    async def _check(self):
+        return await asyncio.to_thread(self._find)
+
+    def _find(self):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit() or int(pid) == os.getpid():
+                continue
+
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+            except OSError:
+                # Exited while listing
+                continue
+
+            if self.pattern.search(cmdline):
+                return True
+
+        self.error = "no matching process"
+        return False
+
+
+class LogProbe(Probe):
+    required = ["path", "pattern"]
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.pattern = re.compile(config["pattern"])
+
+        # Only match the lines written from now on, not the ones of a previous run
+        path = os.path.expanduser(config["path"])
+        self.offset = os.path.getsize(path) if os.path.exists(path) else 0
+
+    @property
+    def description(self):
+        return f"log {self.config['path']}"
+
+    async def _check(self):
+        return await asyncio.to_thread(self._find)
+
+    def _find(self):
+        path = os.path.expanduser(self.config["path"])
+        if not os.path.exists(path):
+            self.error = "no log file"
+            return False
+
+        # Rotated, read it from the start
+        if os.path.getsize(path) < self.offset:
+            self.offset = 0
+
+        with open(path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+
+        # Keep the last partial line for the next check
+        lines = data.split(b"\n")
+        self.offset += len(data) - len(lines[-1])
+
+        for line in lines[:-1]:
+            if self.pattern.search(line.decode(errors="replace")):
+                return True
+
+        self.error = "no matching line"
+        return False
+
+
+PROBES = {
+    "tcp": TcpProbe,
+    "http": HttpProbe,
+    "redis": RedisProbe,
+    "process": ProcessProbe,
+    "log": LogProbe,
+}
+
+
+def resolve_config(config: dict, instance: str = None):
+    """
+    Settings of a probe for an instance of a service upgraded side by side, with the
+    overrides of the instance and {instance} replaced by its name.
+    """
+    overrides = config.get("instances") or {}
+    resolved = {k: v for k, v in config.items() if k != "instances"}
+    if not instance:
+        return resolved
+
+    resolved.update(overrides.get(instance) or {})
+    return {
+        k: v.replace("{instance}", instance) if isinstance(v, str) else v
+        for k, v in resolved.items()
+    }
+
+
+def is_instance_aware(service):
+    # Probes passing for the previous instance would not say anything about the new one
+    if not service.readiness:
+        return False
+
+    return all(
+        resolve_config(x, saubg.INSTANCES[0]) != resolve_config(x, saubg.INSTANCES[1])
+        for x in service.readiness
+    )
+
+
+def create_probe(service: str, config: dict, instance: str = None):
+    config = resolve_config(config, instance)
+    probe_class = PROBES.get(config.get("type"))
+    if probe_class is None:
+        raise saue.InvalidProbeError(
+            service=service, details=f"Unknown probe type {config.get('type')}"
+        )
+
+    try:
+        return probe_class(config)
+    except (ValueError, re.error) as err:
+        raise saue.InvalidProbeError(
+            service=service, details=f"{config.get('type')} probe: {err}"
+        )
+
+
+async def poll(check: Callable[[], Awaitable[bool]], timeout: float = None):
+    """
+    Run the check until it succeeds, often at first then less and less, until the timeout.
+    """
+
+    async def run():
+        interval = sauc.SV_READINESS_MIN_INTERVAL
+        while not await check():
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, sauc.SV_READINESS_MAX_INTERVAL)
+
+    try:
+        await asyncio.wait_for(run(), timeout=timeout or None)
+    except asyncio.TimeoutError:
+        return False
+
+    return True
+
+
+class Readiness:
+    """
+    Probes a service started has to pass before the ones depending on it are started,
+    or a service running has to keep passing to be considered healthy.
+    """
+
+    def __init__(self, service, instance: str = None, health: bool = False):
+        self.service = service
+        self.probes: List[Probe] = [
+            create_probe(service=service.name, config=x, instance=instance)
+            for x in service.readiness or []
+            # A log line only tells the service started, not that it still runs
+            if not health or x.get("type") != "log"
+        ]
+        self.timeout = (
+            sauc.SV_SOAK_HEALTH_TIMEOUT
+            if health
+            else service.readiness_timeout or sauc.SV_READINESS_TIMEOUT
+        )
+
+    async def wait(self):
+        if not self.probes:
+            return
+
+        # Evaluate the probes at the same time, under the same deadline
+        start = time.monotonic()
+        for probe in self.probes:
+            probe.deadline = start + self.timeout
+        results = await asyncio.gather(
+            *[poll(x.check, timeout=self.timeout) for x in self.probes]
+        )
+
+        failures = [x for x, ready in zip(self.probes, results) if not ready]
+        if failures:
+            raise saue.ServiceNotReadyError(
+                service=self.service.name,
+                details="; ".join(
+                    f"{x.description} not ready after {self.timeout} seconds ({x.error})"
+                    for x in failures
+                ),
+            )
+
+        btul.logging.debug(
+            f"✅ {self.service.name} ready in {time.monotonic() - start:.2f}s",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
@@ -14,43 +14,125 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
-from typing import List
-from collections import defaultdict, deque
+from typing import Dict, FrozenSet, List, Tuple
+from collections import deque
 
+import subvortex.auto_upgrader.src.exception as saue
 import subvortex.auto_upgrader.src.service as saus
 
 
-class DependencyResolver:
+class DependencyPlan:
+    """
+    Orders of a set of services, computed once and shared by all the steps of an upgrade.
+    """
+
     def __init__(self, services: List[saus.Service]):
-        self.services = {s.id: s for s in services}
-        self.graph = defaultdict(list)
-        self.indegree = defaultdict(int)
-        self._build_graph()
+        self.services: Dict[str, saus.Service] = {s.id: s for s in services}
 
-    def _build_graph(self):
+        # Services depending on each service
+        graph = {sid: [] for sid in self.services}
         for service in self.services.values():
-            for dep in getattr(service, "depends_on", []):
-                self.graph[dep].append(service.id)
-                self.indegree[service.id] += 1
-            if service.id not in self.indegree:
-                self.indegree[service.id] = 0
+            for dep in getattr(service, "depends_on", None) or []:
+                if dep not in graph:
+                    raise saue.UnknownDependencyError(
+                        service=service.id, dependency=dep
+                    )
 
-    def resolve_order(self, reverse=False) -> List[saus.Service]:
-        queue = deque([sid for sid in self.services if self.indegree[sid] == 0])
-        ordered_ids = []
+                graph[dep].append(service.id)
+        self.dependents: Dict[str, Tuple[str, ...]] = {
+            sid: tuple(x) for sid, x in graph.items()
+        }
+
+        # Each level only depends on the levels before it
+        self.levels: Tuple[Tuple[saus.Service, ...], ...] = self._resolve_levels()
+        self.reverse_levels = tuple(reversed(self.levels))
+        self.order: Tuple[saus.Service, ...] = tuple(
+            service for level in self.levels for service in level
+        )
+        self.reverse_order = tuple(reversed(self.order))
+
+        # Services depending on a service, directly or not, resolved on demand
+        self._reachable: Dict[str, FrozenSet[str]] = {}
+
+    def get_dependents(self, service_id: str) -> FrozenSet[str]:
+        if service_id in self._reachable:
+            return self._reachable[service_id]
 
+        reachable = set()
+        queue = deque(self.dependents[service_id])
         while queue:
             sid = queue.popleft()
-            ordered_ids.append(sid)
-            for neighbor in self.graph[sid]:
-                self.indegree[neighbor] -= 1
-                if self.indegree[neighbor] == 0:
-                    queue.append(neighbor)
+            if sid in reachable:
+                continue
+
+            reachable.add(sid)
+            queue.extend(self.dependents[sid])
+
+        self._reachable[service_id] = frozenset(reachable)
+        return self._reachable[service_id]
+
+    def _resolve_levels(self):
+        indegree = {
+            sid: len(getattr(service, "depends_on", None) or [])
+            for sid, service in self.services.items()
+        }
+        level = [sid for sid in self.services if indegree[sid] == 0]
+        levels = []
+        resolved = 0
+
+        while level:
+            levels.append(tuple(self.services[sid] for sid in level))
+            resolved += len(level)
+
+            next_level = []
+            for sid in level:
+                for neighbor in self.dependents[sid]:
+                    indegree[neighbor] -= 1
+                    if indegree[neighbor] == 0:
+                        next_level.append(neighbor)
+            level = next_level
+
+        if resolved != len(self.services):
+            raise saue.CyclicDependencyError(
+                cycle=self._find_cycle(
+                    [sid for sid, count in indegree.items() if count > 0]
+                )
+            )
+
+        return tuple(levels)
+
+    def _find_cycle(self, unresolved: List[str]):
+        # Every unresolved service waits on another one, following them ends in a cycle
+        unresolved = set(unresolved)
+        path, positions = [], {}
+        sid = min(unresolved)
+        while sid not in positions:
+            positions[sid] = len(path)
+            path.append(sid)
+            sid = next(
+                dep for dep in self.services[sid].depends_on if dep in unresolved
+            )
+
+        # Each service of the cycle depends on the next one
+        cycle = path[positions[sid] :]
+        return cycle + [cycle[0]]
+
+
+class DependencyResolver:
+    def __init__(self, services: List[saus.Service]):
+        self.services = services
+        self.plan = None
+
+    def resolve_order(self, reverse=False) -> List[saus.Service]:
+        plan = self._get_plan()
+        return list(plan.reverse_order if reverse else plan.order)
 
-        if len(ordered_ids) != len(self.services):
-            raise Exception("Cyclic dependency detected!")
+    def resolve_levels(self, reverse=False) -> List[List[saus.Service]]:
+        plan = self._get_plan()
+        return [list(x) for x in (plan.reverse_levels if reverse else plan.levels)]
 
-        if reverse:
-            ordered_ids.reverse()
+    def _get_plan(self):
+        if self.plan is None:
+            self.plan = DependencyPlan(services=self.services)
 
-        return [self.services[sid] for sid in ordered_ids]
+        return self.plan
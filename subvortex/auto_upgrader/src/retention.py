@@ -0,0 +1,226 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import re
+import argparse
+from packaging.version import Version, InvalidVersion
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.version as sauv
+import subvortex.auto_upgrader.src.trash as sautr
+import subvortex.auto_upgrader.src.soak as sausk
+
+VERSION_DIRECTORY = re.compile(r"^subvortex-(\d+\.\d+\.\d+(?:[ab]|rc)?\d*)$")
+
+
+class RetentionManager:
+    """
+    Decide which version directories of the asset directory are kept warm for an
+    instant rollback and reclaim the others, by moving them into the trash.
+    """
+
+    def __init__(self, trash: sautr.Trash = None, directory: str = None):
+        self.directory = directory or sauc.SV_ASSET_DIR
+        self.trash = trash or sautr.Trash()
+
+    @property
+    def enabled(self):
+        return sauc.SV_RETENTION_KEEP > 0 or sauc.SV_RETENTION_SIZE > 0
+
+    def scan(self):
+        """
+        List the version directories, newest version first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                match = VERSION_DIRECTORY.match(entry.name)
+                if not match or not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                try:
+                    version = Version(match.group(1))
+                except InvalidVersion:
+                    continue
+
+                size, reclaimable = _get_size(entry.path)
+                entries.append(
+                    {
+                        "version": str(version),
+                        "path": entry.path,
+                        "complete": os.path.exists(
+                            os.path.join(entry.path, sauc.SV_ASSET_COMPLETE_MARKER)
+                        ),
+                        "size": size,
+                        "reclaimable": reclaimable,
+                    }
+                )
+
+        return sorted(entries, key=lambda x: Version(x["version"]), reverse=True)
+
+    def plan(self, protected: list = None):
+        """
+        Return the version directories to keep and the ones to reclaim. The versions
+        in `protected` and the one installed are always kept, the last complete ones
+        are kept warm within SV_RETENTION_KEEP and SV_RETENTION_SIZE.
+        """
+        protected = {sauv.normalize_version(x) for x in protected or [] if x}
+        installed_path = os.path.realpath(sauc.SV_EXECUTION_DIR)
+
+        keep, reclaim = [], []
+        kept, kept_size = 0, 0
+        for entry in self.scan():
+            if (
+                sauv.normalize_version(entry["version"]) in protected
+                or os.path.realpath(entry["path"]) == installed_path
+            ):
+                keep.append({**entry, "reason": "in use"})
+                continue
+
+            # An interrupted extraction is never used
+            if not entry["complete"]:
+                reclaim.append({**entry, "reason": "incomplete"})
+                continue
+
+            if not self.enabled or (
+                sauc.SV_RETENTION_KEEP > 0 and kept >= sauc.SV_RETENTION_KEEP
+            ):
+                reclaim.append({**entry, "reason": "count"})
+                continue
+
+            if (
+                sauc.SV_RETENTION_SIZE > 0
+                and kept_size + entry["size"] > sauc.SV_RETENTION_SIZE
+            ):
+                reclaim.append({**entry, "reason": "size"})
+                continue
+
+            kept += 1
+            kept_size += entry["size"]
+            keep.append({**entry, "reason": "warm"})
+
+        return keep, reclaim
+
+    def apply(self, protected: list = None):
+        """
+        Reclaim the version directories not kept, return the reclaimed ones.
+        """
+        _, reclaim = self.plan(protected=protected)
+
+        reclaimed = []
+        for entry in reclaim:
+            try:
+                self.trash.put(path=entry["path"])
+            except OSError as e:
+                btul.logging.warning(
+                    f"⚠️ Could not reclaim version {entry['version']}: {e}",
+                    prefix=sauc.SV_LOGGER_NAME,
+                )
+                continue
+
+            reclaimed.append(entry)
+
+            btul.logging.debug(
+                f"🗑️ Version {entry['version']} reclaimed ({entry['reason']}, {entry['reclaimable']} bytes)",
+                prefix=sauc.SV_LOGGER_NAME,
+            )
+
+        return reclaimed
+
+    def report(self, protected: list = None):
+        keep, reclaim = self.plan(protected=protected)
+
+        warm = [x for x in keep if x["reason"] == "warm"]
+        btul.logging.info(
+            f"📊 {len(warm)} version(s) kept warm for rollback ({sum(x['size'] for x in warm)} bytes), "
+            f"{len(reclaim)} reclaimable ({sum(x['reclaimable'] for x in reclaim)} bytes)",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+
+        return keep, reclaim
+
+
+def _get_size(path: str):
+    # Bytes used by the tree and bytes freed by removing it, files linked elsewhere excluded
+    size, reclaimable = 0, 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+
+                stat = entry.stat(follow_symlinks=False)
+                size += stat.st_size
+                if stat.st_nlink == 1:
+                    reclaimable += stat.st_size
+
+    return size, reclaimable
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Manage the versions extracted in the asset directory"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("report", help="List the versions kept and reclaimable")
+    subparsers.add_parser("apply", help="Reclaim the versions not kept")
+
+    config = parser.parse_args(args)
+
+    manager = RetentionManager()
+
+    if config.command == "apply":
+        # Without a policy, every version but the installed one would be reclaimed
+        if not manager.enabled:
+            parser.error(
+                "no retention policy configured, set SUBVORTEX_RETENTION_KEEP or SUBVORTEX_RETENTION_SIZE"
+            )
+
+        # The versions the containers run are only known by the auto upgrader
+        if sauc.SV_EXECUTION_METHOD == "container":
+            parser.error("the auto upgrader applies the policy in container execution")
+
+    # The previous versions soaking are kept for a rollback, as the auto upgrader does
+    protected = list(sausk.load_soaking_versions())
+
+    if config.command == "apply":
+        reclaimed = manager.apply(protected=protected)
+        print(f"{len(reclaimed)} version(s) reclaimed")
+
+    keep, reclaim = manager.plan(protected=protected)
+    for entry in keep + reclaim:
+        status = "keep" if entry in keep else "reclaim"
+        print(
+            f"{entry['version']:<12}  {entry['size']:>12}  {status:<8}  {entry['reason']}"
+        )
+
+    print(
+        f"{len(keep)} version(s) kept, {len(reclaim)} reclaimable "
+        f"({sum(x['reclaimable'] for x in reclaim)} bytes)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import signal
+import asyncio
+from collections import deque
+from typing import Dict, List
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+
+
+class Runner:
+    """
+    Run the scripts of the services without blocking the event loop, streaming their
+    output to the logs, and kill them when they time out or on shutdown.
+    """
+
+    def __init__(self):
+        self.processes = set()
+
+    async def run(
+        self,
+        args: List[str],
+        action: str,
+        name: str,
+        cwd: str = None,
+        env: Dict[str, str] = None,
+        timeout: float = None,
+    ):
+        # Run the script in its own process group, to kill its children with it
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        self.processes.add(process)
+
+        # Keep the last lines of the output for the error report
+        output = deque(maxlen=sauc.SV_SCRIPT_OUTPUT_LINES)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._stream(process.stdout, f"{name} {action}", output),
+                    self._stream(process.stderr, f"{name} {action}", output),
+                    process.wait(),
+                ),
+                timeout=timeout or None,
+            )
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            raise saue.RuntimeError(
+                action=action,
+                details=_get_details(
+                    f"{name} timed out after {timeout} seconds", output
+                ),
+            )
+        except asyncio.CancelledError:
+            await self._kill(process)
+            raise
+        finally:
+            self.processes.discard(process)
+
+        if process.returncode != 0:
+            raise saue.RuntimeError(
+                action=action,
+                details=_get_details(
+                    f"{name} exited with code {process.returncode}", output
+                ),
+            )
+
+    def cancel(self):
+        # Shutting down, do not wait for the scripts in flight
+        for process in list(self.processes):
+            _signal(process, signal.SIGKILL)
+
+    async def _stream(self, stream: asyncio.StreamReader, label: str, output: deque):
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line longer than the buffer, it has been dropped
+                continue
+
+            if not line:
+                return
+
+            line = line.decode(errors="replace").rstrip()
+            output.append(line)
+            btul.logging.trace(f"📝 {label}: {line}", prefix=sauc.SV_LOGGER_NAME)
+
+    async def _kill(self, process: asyncio.subprocess.Process):
+        # Let the script stop gracefully, before killing it
+        _signal(process, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), timeout=sauc.SV_SCRIPT_KILL_TIMEOUT)
+        except asyncio.TimeoutError:
+            _signal(process, signal.SIGKILL)
+            await process.wait()
+
+
+def _signal(process: asyncio.subprocess.Process, sig: int):
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        # Already exited
+        pass
+
+
+def _get_details(reason: str, output: deque):
+    if not output:
+        return reason
+
+    return "\n".join([reason] + list(output))
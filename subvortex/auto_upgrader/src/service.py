@@ -15,7 +15,7 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 import subprocess
-from typing import List, Literal
+from typing import Dict, List, Literal
 
 import subvortex.auto_upgrader.src.constants as sauc
 import subvortex.auto_upgrader.src.version as sauv
@@ -38,6 +38,10 @@ class Service:
         teardown_command: str,
         depends_on: List[str] = [],
         migration_type: str = None,
+        timeouts: Dict[str, int] = None,
+        readiness: List[dict] = None,
+        readiness_timeout: int = None,
+        blue_green: bool = False,
     ):
         self.id = id
         self.name = name
@@ -52,6 +56,10 @@ class Service:
         self.stop_command = stop_command
         self.teardown_command = teardown_command
         self.depends_on = depends_on
+        self.timeouts = timeouts or {}
+        self.readiness = [readiness] if isinstance(readiness, dict) else readiness
+        self.readiness_timeout = readiness_timeout
+        self.blue_green = blue_green
         self.needs_update = False
         self.must_remove = False
         self.upgrade_type = None
@@ -78,6 +86,14 @@ class Service:
             stop_command=metadata.get("setup_command"),
             teardown_command=metadata.get("teardown_command"),
             depends_on=metadata.get("depends_on"),
+            timeouts={
+                action: metadata.get(f"{action}_timeout")
+                for action in ["setup", "start", "stop", "teardown"]
+                if metadata.get(f"{action}_timeout")
+            },
+            readiness=metadata.get("readiness"),
+            readiness_timeout=metadata.get("readiness_timeout"),
+            blue_green=metadata.get("blue_green") or False,
         )
 
     @property
@@ -100,6 +116,10 @@ class Service:
 
         return details[-1]
 
+    def get_timeout(self, action: str):
+        # Time in seconds the script of the action can run
+        return self.timeouts.get(action) or sauc.SV_SCRIPT_TIMEOUT
+
     def switch_to_version(self, version: str):
         # Get the root path of the version
         version_path = self._get_root_path(version=version)
@@ -0,0 +1,64 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import json
+from typing import Dict
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+
+
+def get_soaking_file():
+    return os.path.join(sauc.SV_ASSET_DIR, sauc.SV_SOAKING_FILE)
+
+
+def load_soaking_versions() -> Dict[str, float]:
+    try:
+        with open(get_soaking_file(), "r", encoding="utf-8") as f:
+            return {k: float(v) for k, v in json.load(f).items()}
+    except FileNotFoundError:
+        # No previous version is soaking
+        return {}
+    except (OSError, ValueError, AttributeError) as e:
+        btul.logging.warning(
+            f"⚠️ Could not load the soaking versions: {e}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
+        return {}
+
+
+def save_soaking_versions(versions: Dict[str, float]):
+    path = get_soaking_file()
+    try:
+        if not versions:
+            # Nothing soaking anymore
+            if os.path.lexists(path):
+                os.remove(path)
+            return
+
+        # Write in a temporary file first so a crash never leaves a truncated file
+        temp_file = f"{path}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(versions, f)
+
+        os.replace(temp_file, path)
+    except OSError as e:
+        btul.logging.warning(
+            f"⚠️ Could not save the soaking versions: {e}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
@@ -0,0 +1,214 @@
+# The MIT License (MIT)
+# Copyright © 2024 Eclipse Vortex
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bittensor.utils.btlogging as btul
+
+import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.utils as sauu
+
+# Prefix of the trashed directories claimed by the collector
+DELETING_PREFIX = ".deleting-"
+
+
+class Trash:
+    """
+    Directories removed by a rename into a trash directory, instantly, and deleted
+    later by the collector at low priority. Until then, they can be restored.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.path.join(sauc.SV_ASSET_DIR, ".trash")
+        self.stopped = threading.Event()
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="trash", initializer=sauu.lower_priority
+        )
+
+        # Restoring and claiming a directory must not interleave
+        self._lock = threading.Lock()
+
+    def put(self, path: str):
+        """
+        Move `path` into the trash, return its path in the trash.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Keep the name to restore it, made unique by the time it was trashed
+        trashed_path = os.path.join(
+            self.directory, f"{os.path.basename(path)}.{time.time_ns()}"
+        )
+        os.replace(path, trashed_path)
+
+        btul.logging.trace(f"{path} moved into the trash", prefix=sauc.SV_LOGGER_NAME)
+
+        return trashed_path
+
+    def restore(self, path: str):
+        """
+        Move the last trashed directory named as `path` back into place, if not
+        collected yet. Return True if restored.
+        """
+        if os.path.lexists(path):
+            return False
+
+        name = os.path.basename(path)
+        with self._lock:
+            entries = [
+                x
+                for x in self._list()
+                if x.rsplit(".", 1)[0] == name and not x.startswith(DELETING_PREFIX)
+            ]
+            if not entries:
+                return False
+
+            # Get the last trashed one
+            entry = max(entries, key=_get_trashed_at)
+            os.replace(os.path.join(self.directory, entry), path)
+
+        btul.logging.debug(
+            f"♻️ {path} restored from the trash", prefix=sauc.SV_LOGGER_NAME
+        )
+
+        return True
+
+    async def collect(self):
+        """
+        Delete the trashed directories, oldest first, rate limited to
+        SV_TRASH_GC_FILES_PER_SECOND files and SV_TRASH_GC_BYTES_PER_SECOND bytes.
+        """
+        self.stopped.clear()
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._collect
+            )
+        except asyncio.CancelledError:
+            # Stop between two files, the rest is deleted by the next collection
+            self.stopped.set()
+            raise
+
+    def _collect(self):
+        limiter = _RateLimiter(
+            files=sauc.SV_TRASH_GC_FILES_PER_SECOND,
+            size=sauc.SV_TRASH_GC_BYTES_PER_SECOND,
+            stopped=self.stopped,
+        )
+
+        # Resume the directories claimed by a previous collection first
+        entries = sorted(
+            self._list(),
+            key=lambda x: (not x.startswith(DELETING_PREFIX), _get_trashed_at(x)),
+        )
+
+        for entry in entries:
+            if self.stopped.is_set():
+                return
+
+            path = self._claim(entry)
+            if path is None:
+                continue
+
+            self._delete(path, limiter)
+            if self.stopped.is_set():
+                return
+
+            btul.logging.debug(
+                f"🗑️ {entry} deleted from the trash", prefix=sauc.SV_LOGGER_NAME
+            )
+
+    def _claim(self, entry: str):
+        if entry.startswith(DELETING_PREFIX):
+            return os.path.join(self.directory, entry)
+
+        # A claimed directory cannot be restored anymore
+        with self._lock:
+            source = os.path.join(self.directory, entry)
+            if not os.path.lexists(source):
+                return None
+
+            path = os.path.join(self.directory, f"{DELETING_PREFIX}{entry}")
+            os.replace(source, path)
+
+        return path
+
+    def _delete(self, path: str, limiter):
+        if not os.path.isdir(path) or os.path.islink(path):
+            os.remove(path)
+            return
+
+        for root, directories, filenames in os.walk(path, topdown=False):
+            for filename in filenames:
+                if self.stopped.is_set():
+                    return
+
+                file_path = os.path.join(root, filename)
+                try:
+                    size = os.lstat(file_path).st_size
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    continue
+
+                limiter.consume(files=1, size=size)
+
+            for directory in directories:
+                directory_path = os.path.join(root, directory)
+                if os.path.islink(directory_path):
+                    os.remove(directory_path)
+                else:
+                    os.rmdir(directory_path)
+
+        os.rmdir(path)
+
+    def _list(self):
+        if not os.path.isdir(self.directory):
+            return []
+
+        # Only the entries named by the trash
+        return [x for x in os.listdir(self.directory) if x.rsplit(".", 1)[-1].isdigit()]
+
+
+def _get_trashed_at(entry: str):
+    return int(entry.rsplit(".", 1)[1])
+
+
+class _RateLimiter:
+    def __init__(self, files: int, size: int, stopped: threading.Event):
+        self.files = files
+        self.size = size
+        self.stopped = stopped
+        self.start = time.monotonic()
+        self.consumed_files = 0
+        self.consumed_size = 0
+
+    def consume(self, files: int, size: int):
+        self.consumed_files += files
+        self.consumed_size += size
+
+        # Time the consumed files and bytes should have taken at most, 0 for no limit
+        expected = max(
+            self.consumed_files / self.files if self.files > 0 else 0,
+            self.consumed_size / self.size if self.size > 0 else 0,
+        )
+
+        delay = expected - (time.monotonic() - self.start)
+        if delay > 0:
+            # Wake up as soon as the collection is stopped
+            self.stopped.wait(delay)
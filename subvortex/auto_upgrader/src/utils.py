@@ -14,6 +14,12 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import os
+import shutil
+import threading
+
+import bittensor.utils.btlogging as btul
+
 import subvortex.auto_upgrader.src.constants as sauc
 
 
@@ -29,3 +35,22 @@ def get_tag():
         return "stable"
     else:
         return "latest"
+
+
+def copy_file(source: str, target: str):
+    # Replace the target rather than writing into it, it may be linked to the same file of another version
+    temp_file = f"{target}.tmp"
+    shutil.copy2(source, temp_file)
+    os.replace(temp_file, target)
+
+
+def lower_priority():
+    # On Linux the niceness is per thread and, unless set explicitly, the I/O
+    # priority of a thread is derived from it
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError) as e:
+        btul.logging.trace(
+            f"Could not lower the priority of {threading.current_thread().name}: {e}",
+            prefix=sauc.SV_LOGGER_NAME,
+        )
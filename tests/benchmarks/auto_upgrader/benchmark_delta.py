@@ -0,0 +1,147 @@
+"""
+Bytes transferred and wall time of an upgrade between two synthetic release trees,
+pulling the full archive versus assembling a delta from the installed version.
+
+The new release changes a fraction of the files of the previous one, the delta
+reuses the others from the installed tree and downloads only the changed ones.
+
+Usage:
+    python -m tests.benchmarks.auto_upgrader.benchmark_delta [--files 2000] [--size 16384] [--changed 0.05]
+"""
+
+import io
+import os
+import time
+import random
+import shutil
+import tarfile
+import hashlib
+import argparse
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import subvortex.auto_upgrader.src.http_client as sauhcl
+import subvortex.auto_upgrader.src.archive as saua
+import subvortex.auto_upgrader.src.delta as saudt
+
+
+def build_tree(directory: str, files: int, size: int, changed: float, seed: int):
+    rng = random.Random(seed)
+    base, target = {}, {}
+    for i in range(files):
+        relpath = f"subvortex/module_{i // 50}/file_{i}.py"
+        base[relpath] = rng.randbytes(size)
+        target[relpath] = (
+            rng.randbytes(size) if rng.random() < changed else base[relpath]
+        )
+
+    for version, tree in (("1.0.0", base), ("1.1.0", target)):
+        for relpath, data in tree.items():
+            path = os.path.join(directory, f"subvortex-{version}", relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+    return target
+
+
+def build_archive(directory: str):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        tar.add(directory, arcname=os.path.basename(directory))
+
+    return buffer.getvalue()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/archive":
+            body = self.server.archive
+        else:
+            body = self.server.files[self.path.lstrip("/")]
+
+        self.server.sent += len(body)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def pull_full(session, base_url: str, directory: str):
+    with session.get(f"{base_url}/archive", stream=True) as response:
+        response.raw.decode_content = True
+        staging_dir, top_level_dir = saua.extract_stream(response.raw, directory)
+
+    saua.promote(staging_dir, top_level_dir, directory)
+
+
+def pull_delta(session, base_url: str, directory: str, manifest: dict):
+    def fetch(relpath: str):
+        response = session.get(f"{base_url}/{relpath}")
+        response.raise_for_status()
+        return response.content
+
+    staging_dir, _ = saudt.assemble(
+        base_dir=os.path.join(directory, "subvortex-1.0.0"),
+        manifest=manifest,
+        fetch=fetch,
+        directory=directory,
+    )
+    saua.promote(staging_dir, manifest["top_level_dir"], directory)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=16384)
+    parser.add_argument("--changed", type=float, default=0.05)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    target = build_tree(directory, args.files, args.size, args.changed, seed=0)
+    target_dir = os.path.join(directory, "subvortex-1.1.0")
+
+    manifest = {
+        "top_level_dir": "subvortex-1.1.0",
+        "files": {
+            relpath: {"size": len(x), "sha256": hashlib.sha256(x).hexdigest()}
+            for relpath, x in target.items()
+        },
+    }
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.archive = build_archive(target_dir)
+    server.files = target
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    session = sauhcl.create_session()
+    shutil.rmtree(target_dir)
+
+    results = {}
+    for name, pull in (
+        ("full archive", lambda: pull_full(session, base_url, directory)),
+        ("delta", lambda: pull_delta(session, base_url, directory, manifest)),
+    ):
+        server.sent = 0
+        start = time.perf_counter()
+        pull()
+        results[name] = (time.perf_counter() - start, server.sent)
+        shutil.rmtree(target_dir)
+
+    print(f"{args.files} files of {args.size} bytes, {args.changed:.0%} changed")
+    for name, (duration, sent) in results.items():
+        print(f"{name:>12}: {duration * 1000:8.1f} ms  {sent / 1024:10.1f} KiB")
+
+    server.shutdown()
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Time to order synthetic sets of services, rebuilding a resolver in each of the
+steps of an upgrade versus computing one dependency plan shared by all of them.
+
+Each service depends on up to a few of the services declared before it, the time
+per service stays flat as the number of services grows when the ordering is linear.
+
+Usage:
+    python -m tests.benchmarks.auto_upgrader.benchmark_dependency_plan [--sizes 10,100,1000,10000] [--dependencies 3] [--steps 8] [--runs 5]
+"""
+
+import time
+import random
+import argparse
+import statistics
+
+import subvortex.auto_upgrader.src.service as saus
+import subvortex.auto_upgrader.src.resolvers.dependency_resolver as saudr
+
+
+def build_services(count: int, dependencies: int, seed: int):
+    rng = random.Random(seed)
+    services = []
+    for i in range(count):
+        depends_on = sorted(
+            {f"service-{rng.randrange(i)}" for _ in range(rng.randint(0, dependencies))}
+            if i > 0
+            else set()
+        )
+        services.append(
+            saus.Service(
+                id=f"service-{i}",
+                name=f"service-{i}",
+                version="1.0.0",
+                component_version="1.0.0",
+                service_version="1.0.0",
+                execution="process",
+                migration="",
+                setup_command="",
+                start_command="",
+                stop_command="",
+                teardown_command="",
+                depends_on=depends_on,
+            )
+        )
+
+    return services
+
+
+def resolve_per_step(services, steps: int):
+    # As before, each step builds its own resolver
+    for i in range(steps):
+        resolver = saudr.DependencyResolver(services=services)
+        resolver.resolve_levels(reverse=i % 2 == 1)
+
+
+def resolve_shared(services, steps: int):
+    plan = saudr.DependencyPlan(services=services)
+    for i in range(steps):
+        plan.reverse_levels if i % 2 == 1 else plan.levels
+
+
+def measure(resolve, services, steps: int, runs: int):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        resolve(services, steps)
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--dependencies", type=int, default=3)
+    parser.add_argument("--steps", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {
+        f"resolver per step ({args.steps})": resolve_per_step,
+        "shared plan": resolve_shared,
+    }
+
+    for size in [int(x) for x in args.sizes.split(",")]:
+        services = build_services(size, args.dependencies, seed=size)
+        print(f"{size} services")
+        for name, resolve in results.items():
+            duration = measure(resolve, services, args.steps, args.runs)
+            print(
+                f"{name:>25}: {duration * 1000:9.3f} ms"
+                f"  {duration * 1e6 / size:7.2f} us/service"
+            )
+
+
+if __name__ == "__main__":
+    main()
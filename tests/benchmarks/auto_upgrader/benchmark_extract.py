@@ -0,0 +1,104 @@
+"""
+Files/s and MB/s of the extraction of a synthetic release archive, with
+tarfile.extractall versus the extractor writing the files with a pool of threads.
+
+Usage:
+    python -m tests.benchmarks.auto_upgrader.benchmark_extract [--files 5000] [--size 4096] [--workers 4] [--runs 3] [--directory /var/tmp]
+"""
+
+import io
+import os
+import time
+import random
+import shutil
+import tarfile
+import argparse
+import tempfile
+import statistics
+
+import subvortex.auto_upgrader.src.archive as saua
+
+
+def build_archive(path: str, files: int, size: int):
+    rng = random.Random(0)
+    with tarfile.open(path, mode="w:gz") as tar:
+        for i in range(files):
+            # Source-like content, compressible as the real release
+            content = (f"value_{i} = {rng.random()}\n" * (size // 24 + 1)).encode()
+            info = tarfile.TarInfo(f"subvortex-3.0.0/module_{i // 100}/file_{i}.py")
+            info.size = len(content[:size])
+            info.mode = 0o644
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(content[:size]))
+
+
+def extract_all(archive_path: str, directory: str):
+    with tarfile.open(archive_path, "r:gz") as tar:
+        tar.extractall(path=directory)
+
+
+def extract_parallel(archive_path: str, directory: str, workers: int, sync: bool):
+    with tarfile.open(archive_path, "r:gz") as tar:
+        extractor = saua.Extractor(path=directory, workers=workers, sync=sync)
+        for member in tar:
+            extractor.extract(tar=tar, member=member)
+
+        extractor.close()
+
+
+def measure(extract, archive_path: str, runs: int, root: str):
+    durations = []
+    for _ in range(runs):
+        # Start from a clean page cache state, not writing back the previous run
+        os.sync()
+
+        directory = tempfile.mkdtemp(dir=root)
+        try:
+            start = time.perf_counter()
+            extract(archive_path, directory)
+            durations.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(directory)
+
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--directory", default=None, help="where to extract")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    archive_path = os.path.join(directory, "subvortex_miner-3.0.0.tar.gz")
+    build_archive(archive_path, args.files, args.size)
+
+    # The extractor syncs the files it writes and their directories, extractall never syncs
+    results = {
+        "extractall": lambda x, y: extract_all(x, y),
+        f"extractor ({args.workers} threads)": lambda x, y: extract_parallel(
+            x, y, workers=args.workers, sync=False
+        ),
+        f"extractor ({args.workers} threads) + sync": lambda x, y: extract_parallel(
+            x, y, workers=args.workers, sync=True
+        ),
+    }
+
+    megabytes = args.files * args.size / (1024 * 1024)
+    print(f"{args.files} files of {args.size} bytes ({megabytes:.1f} MB)")
+    for name, extract in results.items():
+        duration = measure(extract, archive_path, args.runs, args.directory)
+        print(
+            f"{name:>30}: {duration * 1000:8.1f} ms"
+            f"  {args.files / duration:9.0f} files/s"
+            f"  {megabytes / duration:7.1f} MB/s"
+        )
+
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Per-cycle latency of the GitHub requests done by the auto upgrader, with a fresh
+connection per request (bare requests.get) versus the pooled keep-alive session.
+
+The stub server delays every new connection to emulate the TCP+TLS handshake
+of api.github.com, keep-alive requests skip that cost.
+
+Usage:
+    python -m tests.benchmarks.auto_upgrader.benchmark_http_session [--cycles 50] [--handshake-ms 40]
+"""
+import time
+import json
+import socket
+import argparse
+import statistics
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import subvortex.auto_upgrader.src.http_client as sauhcl
+
+RELEASES = json.dumps(
+    [{"tag_name": f"v3.0.{i}", "published_at": f"2025-01-{i + 1:02d}"} for i in range(30)]
+).encode()
+ASSET = b"x" * 256 * 1024
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        # Emulate the handshake cost paid once per connection
+        time.sleep(self.server.handshake)
+        super().setup()
+
+        # Avoid the Nagle/delayed ACK stall between the headers and the body
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        body = RELEASES if self.path.endswith("/releases") else ASSET
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_cycle(get, base_url: str):
+    # One cycle: list the releases and download the asset
+    get(f"{base_url}/repos/eclipsevortex/SubVortex/releases").json()
+    response = get(f"{base_url}/download/subvortex_miner-3.0.0.tar.gz")
+    for _ in response.iter_content(chunk_size=65536):
+        pass
+
+
+def measure(get, base_url: str, cycles: int):
+    durations = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        run_cycle(get, base_url)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--handshake-ms", type=float, default=40)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.handshake = args.handshake_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    session = sauhcl.create_session()
+    timeout = sauhcl.get_timeout()
+
+    results = {
+        "requests.get": measure(
+            lambda url: requests.get(url, stream=True), base_url, args.cycles
+        ),
+        "pooled session": measure(
+            lambda url: session.get(url, stream=True, timeout=timeout),
+            base_url,
+            args.cycles,
+        ),
+    }
+
+    print(f"{args.cycles} cycles, {args.handshake_ms:.0f} ms emulated handshake")
+    for name, durations in results.items():
+        print(
+            f"{name:>16}: mean {statistics.mean(durations):7.2f} ms"
+            f"  p50 {statistics.median(durations):7.2f} ms"
+            f"  max {max(durations):7.2f} ms"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
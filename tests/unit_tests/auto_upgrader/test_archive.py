@@ -0,0 +1,316 @@
+import io
+import os
+import tarfile
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.archive as saua
+import subvortex.auto_upgrader.src.exception as saue
+
+
+def build_archive(files: dict):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            if content is None:
+                info = tarfile.TarInfo(name)
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+                continue
+
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    return buffer.getvalue()
+
+
+class SequentialReader:
+    # Mimic a network stream, no seek available
+    def __init__(self, data: bytes):
+        self.data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self.data.read(size)
+
+
+def test_extract_stream_extracts_into_staging(tmp_path):
+    # Arrange
+    data = build_archive(
+        {
+            "subvortex-1.2.3": None,
+            "subvortex-1.2.3/README.md": b"readme",
+            "subvortex-1.2.3/subvortex/miner/version.py": b"__version__ = '1.2.3'",
+        }
+    )
+
+    # Act
+    staging_dir, top_level_dir = saua.extract_stream(
+        fileobj=SequentialReader(data), directory=str(tmp_path)
+    )
+
+    # Assert
+    assert top_level_dir == "subvortex-1.2.3"
+    assert os.path.dirname(staging_dir) == str(tmp_path)
+    with open(os.path.join(staging_dir, "subvortex-1.2.3", "README.md"), "rb") as f:
+        assert f.read() == b"readme"
+    assert not os.path.exists(tmp_path / "subvortex-1.2.3")
+
+
+def test_extract_stream_removes_staging_on_error(tmp_path):
+    # Arrange
+    data = build_archive({"subvortex-1.2.3/README.md": b"readme" * 1000})
+
+    # Act
+    with pytest.raises((tarfile.TarError, EOFError)):
+        saua.extract_stream(
+            fileobj=SequentialReader(data[: len(data) // 2]), directory=str(tmp_path)
+        )
+
+    # Assert
+    assert os.listdir(tmp_path) == []
+
+
+def test_extract_stream_raises_on_empty_archive(tmp_path):
+    # Arrange
+    data = build_archive({})
+
+    # Act
+    with pytest.raises(ValueError):
+        saua.extract_stream(fileobj=SequentialReader(data), directory=str(tmp_path))
+
+    # Assert
+    assert os.listdir(tmp_path) == []
+
+
+def test_promote_replaces_existing_directory(tmp_path):
+    # Arrange
+    (tmp_path / "subvortex-1.2.3").mkdir()
+    (tmp_path / "subvortex-1.2.3" / "stale.txt").write_text("stale")
+
+    data = build_archive({"subvortex-1.2.3/README.md": b"readme"})
+    staging_dir, top_level_dir = saua.extract_stream(
+        fileobj=SequentialReader(data), directory=str(tmp_path)
+    )
+
+    # Act
+    target_dir = saua.promote(
+        staging_dir=staging_dir, top_level_dir=top_level_dir, directory=str(tmp_path)
+    )
+
+    # Assert
+    assert target_dir == str(tmp_path / "subvortex-1.2.3")
+    assert sorted(os.listdir(target_dir)) == [".complete", "README.md"]
+    assert not os.path.exists(staging_dir)
+
+
+def test_extract_stream_skips_members_of_other_roles(tmp_path):
+    # Arrange
+    data = build_archive(
+        {
+            "subvortex-1.2.3": None,
+            "subvortex-1.2.3/README.md": b"readme",
+            "subvortex-1.2.3/subvortex/core/utils.py": b"core",
+            "subvortex-1.2.3/subvortex/miner/neuron/metadata.json": b"{}",
+            "subvortex-1.2.3/subvortex/validator": None,
+            "subvortex-1.2.3/subvortex/validator/neuron/metadata.json": b"{}",
+            "subvortex-1.2.3/subvortex/validator/redis/metadata.json": b"{}",
+        }
+    )
+
+    # Act
+    staging_dir, top_level_dir = saua.extract_stream(
+        fileobj=SequentialReader(data),
+        directory=str(tmp_path),
+        include=saua.get_role_filter(role="miner"),
+    )
+
+    # Assert
+    root = os.path.join(staging_dir, top_level_dir)
+    assert os.path.exists(os.path.join(root, "README.md"))
+    assert os.path.exists(os.path.join(root, "subvortex", "core", "utils.py"))
+    assert os.path.exists(os.path.join(root, "subvortex", "miner", "neuron"))
+    assert not os.path.exists(os.path.join(root, "subvortex", "validator"))
+    assert saua.load_skipped(root) == {
+        "role": "miner",
+        "skipped": {"subvortex/validator": {"members": 3, "bytes": 4}},
+    }
+
+
+def test_path_filter_keeps_only_included_paths():
+    # Arrange
+    include = saua.PathFilter(included=["subvortex/validator"])
+
+    # Act
+    result = {
+        x: include(tarfile.TarInfo(x))
+        for x in [
+            "subvortex-1.2.3",
+            "subvortex-1.2.3/README.md",
+            "subvortex-1.2.3/subvortex/validator/neuron/metadata.json",
+            "subvortex-1.2.3/subvortex/validator_old/metadata.json",
+        ]
+    }
+
+    # Assert
+    assert result == {
+        "subvortex-1.2.3": True,
+        "subvortex-1.2.3/README.md": False,
+        "subvortex-1.2.3/subvortex/validator/neuron/metadata.json": True,
+        "subvortex-1.2.3/subvortex/validator_old/metadata.json": False,
+    }
+    assert include.skipped == {}
+
+
+def build_tree_archive(files: int):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for i in range(files):
+            content = f"file {i}".encode()
+            info = tarfile.TarInfo(f"subvortex-1.2.3/module_{i % 3}/file_{i}.py")
+            info.size = len(content)
+            info.mode = 0o755 if i % 2 else 0o644
+            info.mtime = 1700000000 + i
+            tar.addfile(info, io.BytesIO(content))
+
+        info = tarfile.TarInfo("subvortex-1.2.3/latest.py")
+        info.type = tarfile.SYMTYPE
+        info.linkname = "module_0/file_0.py"
+        tar.addfile(info)
+
+    buffer.seek(0)
+    return buffer
+
+
+def test_extractor_writes_files_with_their_attributes(tmp_path):
+    # Arrange
+    archive = build_tree_archive(files=50)
+
+    # Act
+    with (
+        tarfile.open(fileobj=archive, mode="r|gz") as tar,
+        saua.Extractor(path=str(tmp_path), workers=4) as extractor,
+    ):
+        for member in tar:
+            extractor.extract(tar=tar, member=member)
+
+    # Assert
+    root = tmp_path / "subvortex-1.2.3"
+    assert extractor.files == 50
+    for i in range(50):
+        path = root / f"module_{i % 3}" / f"file_{i}.py"
+        assert path.read_bytes() == f"file {i}".encode()
+        assert os.stat(path).st_mode & 0o777 == (0o755 if i % 2 else 0o644)
+        assert os.stat(path).st_mtime == 1700000000 + i
+    assert os.readlink(root / "latest.py") == "module_0/file_0.py"
+
+
+def test_extractor_syncs_the_files_it_writes_and_not_the_host(tmp_path):
+    # Arrange
+    archive = build_tree_archive(files=20)
+
+    # Act
+    with (
+        patch("subvortex.auto_upgrader.src.archive.os.sync") as mock_sync,
+        patch(
+            "subvortex.auto_upgrader.src.archive.os.fsync", wraps=os.fsync
+        ) as mock_fsync,
+        patch(
+            "subvortex.auto_upgrader.src.archive.sync_directory",
+            wraps=saua.sync_directory,
+        ) as mock_sync_directory,
+    ):
+        with (
+            tarfile.open(fileobj=archive, mode="r|gz") as tar,
+            saua.Extractor(path=str(tmp_path), sync=True) as extractor,
+        ):
+            for member in tar:
+                extractor.extract(tar=tar, member=member)
+
+            extractor.wait()
+            files_synced = mock_fsync.call_count
+            mock_sync_directory.assert_not_called()
+
+    # Assert
+    mock_sync.assert_not_called()
+    assert files_synced == 20
+    synced = {x.args[0] for x in mock_sync_directory.call_args_list}
+    assert str(tmp_path) in synced
+    assert str(tmp_path / "subvortex-1.2.3" / "module_0") in synced
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_EXTRACT_FSYNC", True)
+def test_promote_syncs_the_directory_of_the_rename(tmp_path):
+    # Arrange
+    staging_dir = tmp_path / ".staging"
+    (staging_dir / "subvortex-1.2.3").mkdir(parents=True)
+
+    # Act
+    with patch(
+        "subvortex.auto_upgrader.src.archive.sync_directory"
+    ) as mock_sync_directory:
+        target_dir = saua.promote(
+            staging_dir=str(staging_dir),
+            top_level_dir="subvortex-1.2.3",
+            directory=str(tmp_path),
+        )
+
+    # Assert
+    assert os.path.exists(os.path.join(target_dir, ".complete"))
+    mock_sync_directory.assert_called_once_with(str(tmp_path))
+
+
+def test_extractor_raises_write_error(tmp_path):
+    # Arrange
+    archive = build_tree_archive(files=20)
+
+    # Act
+    with patch.object(
+        saua.Extractor, "_write", side_effect=OSError("No space left on device")
+    ):
+        with pytest.raises(OSError):
+            with (
+                tarfile.open(fileobj=archive, mode="r|gz") as tar,
+                saua.Extractor(path=str(tmp_path)) as extractor,
+            ):
+                for member in tar:
+                    extractor.extract(tar=tar, member=member)
+
+
+@pytest.mark.parametrize(
+    "name,linkname",
+    [
+        ("../evil.py", None),
+        ("subvortex-1.2.3/../../evil.py", None),
+        ("subvortex-1.2.3/evil.py", "../../evil.py"),
+    ],
+)
+def test_extractor_rejects_members_outside_the_target(tmp_path, name, linkname):
+    # Arrange
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo(name)
+        if linkname:
+            info.type = tarfile.SYMTYPE
+            info.linkname = linkname
+            tar.addfile(info)
+        else:
+            info.size = len(b"evil")
+            tar.addfile(info, io.BytesIO(b"evil"))
+    buffer.seek(0)
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+
+    # Act
+    with pytest.raises(saue.UnsafeArchiveMemberError):
+        with (
+            tarfile.open(fileobj=buffer, mode="r|gz") as tar,
+            saua.Extractor(path=str(target_dir)) as extractor,
+        ):
+            for member in tar:
+                extractor.extract(tar=tar, member=member)
+
+    # Assert
+    assert os.listdir(tmp_path) == ["target"]
+    assert not os.path.lexists(target_dir / "subvortex-1.2.3" / "evil.py")
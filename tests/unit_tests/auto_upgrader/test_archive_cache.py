@@ -0,0 +1,195 @@
+import os
+import hashlib
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.archive_cache as sauac
+
+
+@pytest.fixture(autouse=True)
+def asset_dir(tmp_path):
+    with (
+        patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)),
+        patch("subvortex.auto_upgrader.src.constants.SV_ARCHIVE_CACHE_SIZE", 1024),
+    ):
+        yield tmp_path
+
+
+def create_archive(directory, name: str, content: bytes):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(content)
+
+    return path, hashlib.sha256(content).hexdigest()
+
+
+def test_get_returns_none_when_version_not_cached():
+    # Arrange
+    cache = sauac.ArchiveCache()
+
+    # Act
+    result = cache.get(version="1.2.3", role="miner")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_put_moves_archive_into_cache(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"v1")
+
+    # Act
+    cache.put(version="1.2.3", role="miner", path=path, sha256=sha256)
+    result = cache.get(version="1.2.3", role="miner")
+
+    # Assert
+    assert result == os.path.join(cache.path, f"{sha256}.tar.gz")
+    assert not os.path.exists(path)
+    with open(result, "rb") as f:
+        assert f.read() == b"v1"
+    assert cache.get(version="1.2.3", role="validator") is None
+
+
+def test_versions_with_same_content_share_the_archive(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path1, sha256 = create_archive(asset_dir, "archive1.tar.gz", b"same")
+    path2, _ = create_archive(asset_dir, "archive2.tar.gz", b"same")
+
+    # Act
+    cache.put(version="1.2.3", role="miner", path=path1, sha256=sha256)
+    cache.put(version="1.2.4", role="miner", path=path2, sha256=sha256)
+
+    # Assert
+    assert cache.get(version="1.2.3", role="miner") == cache.get(
+        version="1.2.4", role="miner"
+    )
+    assert cache.stats()["entries"] == 1
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_ARCHIVE_CACHE_SIZE", 10)
+def test_put_evicts_least_recently_used_archives(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    for version in ["1.0.0", "1.1.0"]:
+        path, sha256 = create_archive(asset_dir, "archive.tar.gz", version.encode())
+        cache.put(version=version, role="miner", path=path, sha256=sha256)
+
+    # Use 1.0.0 so 1.1.0 is the least recently used
+    cache.get(version="1.0.0", role="miner")
+
+    # Act
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"1.2.0")
+    cache.put(version="1.2.0", role="miner", path=path, sha256=sha256)
+
+    # Assert
+    assert cache.get(version="1.1.0", role="miner") is None
+    assert cache.get(version="1.0.0", role="miner") is not None
+    assert cache.get(version="1.2.0", role="miner") is not None
+    assert cache.stats()["evictions"] == 1
+    assert len(os.listdir(cache.path)) == 3  # 2 archives and the index
+
+
+def test_purge_from_the_cli_is_not_undone_by_a_running_cache(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    for version in ["1.0.0", "1.1.0"]:
+        path, sha256 = create_archive(asset_dir, "archive.tar.gz", version.encode())
+        cache.put(version=version, role="miner", path=path, sha256=sha256)
+
+    # Act
+    sauac.main(["purge", "--version", "1.0.0", "--role", "miner"])
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"1.2.0")
+    cache.put(version="1.2.0", role="miner", path=path, sha256=sha256)
+
+    # Assert
+    keys = [x["keys"] for x in sauac.ArchiveCache().list()]
+    assert sorted(keys) == [["miner-1.1.0"], ["miner-1.2.0"]]
+    assert cache.get(version="1.0.0", role="miner") is None
+
+
+def test_entries_whose_archive_is_gone_are_skipped(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"v1")
+    cache.put(version="1.2.3", role="miner", path=path, sha256=sha256)
+    os.remove(os.path.join(cache.path, f"{sha256}.tar.gz"))
+
+    # Act
+    result = cache.get(version="1.2.3", role="miner")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["entries"] == 0
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_ARCHIVE_CACHE_SIZE", 0)
+def test_put_does_nothing_when_cache_disabled(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"v1")
+
+    # Act
+    result = cache.put(version="1.2.3", role="miner", path=path, sha256=sha256)
+
+    # Assert
+    assert result is False
+    assert os.path.exists(path)
+
+
+def test_stats_are_persisted(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"v1")
+    cache.put(version="1.2.3", role="miner", path=path, sha256=sha256)
+    cache.get(version="1.2.3", role="miner")
+    cache.get(version="1.2.4", role="miner")
+
+    # Act
+    stats = sauac.ArchiveCache().stats()
+
+    # Assert
+    assert stats == {
+        "entries": 1,
+        "size": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_archive_removed_behind_our_back_is_forgotten(asset_dir):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    path, sha256 = create_archive(asset_dir, "archive.tar.gz", b"v1")
+    cache.put(version="1.2.3", role="miner", path=path, sha256=sha256)
+    os.remove(os.path.join(cache.path, f"{sha256}.tar.gz"))
+
+    # Act
+    result = sauac.ArchiveCache().get(version="1.2.3", role="miner")
+
+    # Assert
+    assert result is None
+
+
+def test_cli_lists_and_purges_archives(asset_dir, capsys):
+    # Arrange
+    cache = sauac.ArchiveCache()
+    for version in ["1.0.0", "1.1.0"]:
+        path, sha256 = create_archive(asset_dir, "archive.tar.gz", version.encode())
+        cache.put(version=version, role="miner", path=path, sha256=sha256)
+
+    # Act
+    sauac.main(["list"])
+    listed = capsys.readouterr().out
+    sauac.main(["purge", "--version", "1.0.0", "--role", "miner"])
+    purged = capsys.readouterr().out
+
+    # Assert
+    assert "miner-1.0.0" in listed and "miner-1.1.0" in listed
+    assert "1 archive(s) removed" in purged
+    assert "miner-1.0.0" not in purged and "miner-1.1.0" in purged
+    assert sauac.ArchiveCache().get(version="1.0.0", role="miner") is None
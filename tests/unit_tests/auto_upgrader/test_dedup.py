@@ -0,0 +1,128 @@
+import io
+import os
+import tarfile
+import hashlib
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.archive as saua
+import subvortex.auto_upgrader.src.dedup as saudd
+import subvortex.auto_upgrader.src.delta as saudt
+
+
+def write_tree(directory, files: dict, mode: int = 0o644):
+    for relpath, content in files.items():
+        path = os.path.join(directory, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        os.chmod(path, mode)
+
+
+def build_archive(files: dict):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(content))
+
+    buffer.seek(0)
+    return buffer
+
+
+def test_dedup_index_finds_identical_file(tmp_path):
+    # Arrange
+    write_tree(tmp_path / "subvortex-1.0.0", {"a.py": b"same", "b.py": b"diff"})
+    write_tree(tmp_path / "other", {"a.py": b"same"})
+
+    # Act
+    dedup = saudd.DedupIndex(directory=str(tmp_path))
+
+    # Assert
+    assert dedup.find(4, hashlib.sha256(b"same").hexdigest()) == str(
+        tmp_path / "subvortex-1.0.0" / "a.py"
+    )
+    assert dedup.find(4, hashlib.sha256(b"nope").hexdigest()) is None
+    assert not dedup.has_size(5)
+
+
+def test_dedup_index_hashes_only_files_of_same_size(tmp_path):
+    # Arrange
+    write_tree(tmp_path / "subvortex-1.0.0", {"a.py": b"same", "b.py": b"longer"})
+    dedup = saudd.DedupIndex(directory=str(tmp_path))
+
+    # Act
+    with patch.object(saudt, "hash_file", wraps=saudt.hash_file) as mock_hash:
+        dedup.find(4, hashlib.sha256(b"same").hexdigest())
+        dedup.find(4, hashlib.sha256(b"same").hexdigest())
+
+    # Assert
+    mock_hash.assert_called_once_with(str(tmp_path / "subvortex-1.0.0" / "a.py"))
+
+
+def test_dedup_index_does_not_link_file_with_another_mode(tmp_path):
+    # Arrange
+    write_tree(tmp_path / "subvortex-1.0.0", {"run.sh": b"echo"}, mode=0o755)
+    dedup = saudd.DedupIndex(directory=str(tmp_path))
+
+    # Act
+    linked = dedup.link(b"echo", str(tmp_path / "run.sh"), mode=0o644)
+
+    # Assert
+    assert linked is False
+    assert not os.path.exists(tmp_path / "run.sh")
+
+
+def test_extract_stream_links_files_identical_to_other_versions(tmp_path):
+    # Arrange
+    write_tree(
+        tmp_path / "subvortex-1.0.0",
+        {"README.md": b"readme", "subvortex/version.py": b"1.0.0"},
+    )
+    dedup = saudd.DedupIndex(directory=str(tmp_path))
+    archive = build_archive(
+        {
+            "subvortex-1.1.0/README.md": b"readme",
+            "subvortex-1.1.0/subvortex/version.py": b"1.1.0",
+        }
+    )
+
+    # Act
+    with patch.object(saudt, "link_file", wraps=saudt.link_file) as mock_link:
+        staging_dir, top_level_dir = saua.extract_stream(
+            fileobj=archive, directory=str(tmp_path), dedup=dedup
+        )
+
+    # Assert
+    root = os.path.join(staging_dir, top_level_dir)
+    mock_link.assert_called_once_with(
+        str(tmp_path / "subvortex-1.0.0" / "README.md"),
+        os.path.join(root, "README.md"),
+    )
+    with open(os.path.join(root, "README.md"), "rb") as f:
+        assert f.read() == b"readme"
+    with open(os.path.join(root, "subvortex", "version.py"), "rb") as f:
+        assert f.read() == b"1.1.0"
+    assert dedup.linked == 1
+    assert dedup.bytes == 6
+
+
+def test_break_links_gives_a_private_copy(tmp_path):
+    # Arrange
+    write_tree(tmp_path / "subvortex-1.0.0", {"config.json": b"{}"})
+    os.makedirs(tmp_path / "subvortex-1.1.0")
+    source = tmp_path / "subvortex-1.0.0" / "config.json"
+    target = tmp_path / "subvortex-1.1.0" / "config.json"
+    os.link(source, target)
+
+    # Act
+    count = saudd.break_links(str(tmp_path / "subvortex-1.1.0"))
+    with open(target, "ab") as f:
+        f.write(b"\n")
+
+    # Assert
+    assert count == 1
+    assert os.stat(target).st_nlink == 1
+    assert source.read_bytes() == b"{}"
+    assert target.read_bytes() == b"{}\n"
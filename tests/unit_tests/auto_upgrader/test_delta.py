@@ -0,0 +1,185 @@
+import os
+import hashlib
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.delta as saudt
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.utils as sauu
+
+
+def create_tree(directory, files: dict):
+    for relpath, content in files.items():
+        path = os.path.join(directory, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    return str(directory)
+
+
+def create_manifest(files: dict, top_level_dir="subvortex-1.1.0"):
+    return {
+        "top_level_dir": top_level_dir,
+        "files": {
+            relpath: {
+                "size": len(content),
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "mode": 0o644,
+            }
+            for relpath, content in files.items()
+        },
+    }
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    base_dir = create_tree(
+        tmp_path / "subvortex-1.0.0",
+        {
+            "README.md": b"readme",
+            "subvortex/miner/version.py": b"1.0.0",
+            "subvortex/miner/neuron.py": b"neuron",
+        },
+    )
+    for root, _, filenames in os.walk(base_dir):
+        for filename in filenames:
+            os.chmod(os.path.join(root, filename), 0o644)
+
+    return base_dir
+
+
+def test_build_manifest_hashes_only_candidates(base_dir):
+    # Arrange
+    candidates = create_manifest(
+        {"README.md": b"readme", "subvortex/miner/version.py": b"1.1.0"}
+    )["files"]
+    candidates["subvortex/miner/neuron.py"] = {"size": 1, "sha256": "x"}
+
+    # Act
+    manifest = saudt.build_manifest(base_dir, candidates=candidates)
+
+    # Assert
+    assert sorted(manifest) == ["README.md", "subvortex/miner/version.py"]
+    assert manifest["README.md"]["sha256"] == hashlib.sha256(b"readme").hexdigest()
+
+
+def test_assemble_reuses_identical_files_and_fetches_the_others(base_dir, tmp_path):
+    # Arrange
+    files = {
+        "README.md": b"readme",
+        "subvortex/miner/version.py": b"1.1.0",
+        "subvortex/miner/neuron.py": b"neuron",
+        "subvortex/miner/new.py": b"new",
+    }
+    fetched = []
+
+    def fetch(relpath):
+        fetched.append(relpath)
+        return files[relpath]
+
+    # Act
+    with patch(
+        "subvortex.auto_upgrader.src.delta.link_file", wraps=saudt.link_file
+    ) as mock_link_file:
+        staging_dir, stats = saudt.assemble(
+            base_dir=base_dir,
+            manifest=create_manifest(files),
+            fetch=fetch,
+            directory=str(tmp_path),
+        )
+
+    # Assert
+    root = os.path.join(staging_dir, "subvortex-1.1.0")
+    for relpath, content in files.items():
+        with open(os.path.join(root, relpath), "rb") as f:
+            assert f.read() == content
+
+    assert sorted(fetched) == ["subvortex/miner/new.py", "subvortex/miner/version.py"]
+    assert stats == {"reused": 2, "fetched": 2, "bytes": 8}
+    assert sorted(
+        os.path.relpath(x[0][0], base_dir) for x in mock_link_file.call_args_list
+    ) == [
+        "README.md",
+        os.path.join("subvortex", "miner", "neuron.py"),
+    ]
+
+
+def test_link_file_shares_content_without_copying(tmp_path):
+    # Arrange
+    create_tree(tmp_path, {"base/README.md": b"readme"})
+
+    # Act
+    method = saudt.link_file(
+        str(tmp_path / "base" / "README.md"), str(tmp_path / "README.md")
+    )
+
+    # Assert
+    assert method in ("reflink", "hardlink")
+    assert (tmp_path / "README.md").read_bytes() == b"readme"
+
+
+def test_assemble_copies_file_whose_mode_changed(base_dir, tmp_path):
+    # Arrange
+    manifest = create_manifest({"README.md": b"readme"})
+    manifest["files"]["README.md"]["mode"] = 0o755
+
+    # Act
+    staging_dir, _ = saudt.assemble(
+        base_dir=base_dir, manifest=manifest, fetch=None, directory=str(tmp_path)
+    )
+
+    # Assert
+    path = os.path.join(staging_dir, "subvortex-1.1.0", "README.md")
+    assert os.stat(path).st_mode & 0o777 == 0o755
+    assert os.stat(os.path.join(base_dir, "README.md")).st_mode & 0o777 == 0o644
+
+
+def test_assemble_rejects_fetched_file_not_matching_manifest(base_dir, tmp_path):
+    # Arrange
+    manifest = create_manifest({"subvortex/miner/version.py": b"1.1.0"})
+
+    # Act
+    with pytest.raises(saue.ChecksumMismatchError):
+        saudt.assemble(
+            base_dir=base_dir,
+            manifest=manifest,
+            fetch=lambda relpath: b"tampered",
+            directory=str(tmp_path),
+        )
+
+    # Assert
+    assert [x for x in os.listdir(tmp_path) if x.startswith(".staging")] == []
+
+
+def test_assemble_rejects_path_outside_of_version_directory(base_dir, tmp_path):
+    # Arrange
+    manifest = create_manifest({"../../evil.sh": b"evil"})
+
+    # Act
+    with pytest.raises(ValueError):
+        saudt.assemble(
+            base_dir=base_dir,
+            manifest=manifest,
+            fetch=lambda relpath: b"evil",
+            directory=str(tmp_path),
+        )
+
+    # Assert
+    assert not os.path.exists(tmp_path.parent / "evil.sh")
+
+
+def test_copy_file_does_not_write_into_linked_file(tmp_path):
+    # Arrange
+    create_tree(tmp_path, {"base/redis.conf": b"base"})
+    os.link(tmp_path / "base" / "redis.conf", tmp_path / "redis.conf")
+    source = create_tree(tmp_path, {"template-redis.conf": b"template"})
+
+    # Act
+    sauu.copy_file(
+        os.path.join(source, "template-redis.conf"), str(tmp_path / "redis.conf")
+    )
+
+    # Assert
+    assert (tmp_path / "redis.conf").read_bytes() == b"template"
+    assert (tmp_path / "base" / "redis.conf").read_bytes() == b"base"
@@ -15,8 +15,12 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 import pytest
+import subvortex.auto_upgrader.src.exception as saue
 from subvortex.auto_upgrader.src.service import Service
-from subvortex.auto_upgrader.src.resolvers.dependency_resolver import DependencyResolver
+from subvortex.auto_upgrader.src.resolvers.dependency_resolver import (
+    DependencyPlan,
+    DependencyResolver,
+)
 
 def create_service(id, depends_on=None):
     return Service(
@@ -85,3 +89,105 @@ def test_detects_cycles():
     resolver = DependencyResolver(services)
     with pytest.raises(Exception, match="Cyclic dependency detected"):
         resolver.resolve_order()
+
+
+def test_resolve_levels():
+    services = [
+        create_service("redis"),
+        create_service("metagraph", depends_on=["redis"]),
+        create_service("neuron", depends_on=["redis"]),
+        create_service("api", depends_on=["metagraph", "neuron"]),
+    ]
+    resolver = DependencyResolver(services)
+    levels = resolver.resolve_levels()
+    assert [[s.id for s in level] for level in levels] == [
+        ["redis"],
+        ["metagraph", "neuron"],
+        ["api"],
+    ]
+
+
+def test_resolve_levels_reverse():
+    services = [
+        create_service("redis"),
+        create_service("metagraph", depends_on=["redis"]),
+        create_service("neuron", depends_on=["redis"]),
+    ]
+    resolver = DependencyResolver(services)
+    levels = resolver.resolve_levels(reverse=True)
+    assert [[s.id for s in level] for level in levels] == [
+        ["metagraph", "neuron"],
+        ["redis"],
+    ]
+
+
+def test_resolve_levels_detects_cycles():
+    services = [
+        create_service("a", depends_on=["b"]),
+        create_service("b", depends_on=["a"]),
+        create_service("c"),
+    ]
+    resolver = DependencyResolver(services)
+    with pytest.raises(Exception, match="Cyclic dependency detected"):
+        resolver.resolve_levels()
+
+
+def test_resolve_order_can_be_called_several_times():
+    services = [
+        create_service("a"),
+        create_service("b", depends_on=["a"]),
+    ]
+    resolver = DependencyResolver(services)
+    assert [s.id for s in resolver.resolve_order()] == ["a", "b"]
+    assert [s.id for s in resolver.resolve_order(reverse=True)] == ["b", "a"]
+    assert [s.id for s in resolver.resolve_order()] == ["a", "b"]
+
+
+def test_dependency_plan():
+    services = [
+        create_service("redis"),
+        create_service("metagraph", depends_on=["redis"]),
+        create_service("neuron", depends_on=["redis"]),
+        create_service("api", depends_on=["metagraph", "neuron"]),
+    ]
+    plan = DependencyPlan(services)
+    assert [s.id for s in plan.order] == ["redis", "metagraph", "neuron", "api"]
+    assert [s.id for s in plan.reverse_order] == ["api", "neuron", "metagraph", "redis"]
+    assert [[s.id for s in level] for level in plan.reverse_levels] == [
+        ["api"],
+        ["metagraph", "neuron"],
+        ["redis"],
+    ]
+
+
+def test_dependency_plan_get_dependents():
+    services = [
+        create_service("redis"),
+        create_service("metagraph", depends_on=["redis"]),
+        create_service("neuron", depends_on=["metagraph"]),
+        create_service("api"),
+    ]
+    plan = DependencyPlan(services)
+    assert plan.get_dependents("redis") == {"metagraph", "neuron"}
+    assert plan.get_dependents("metagraph") == {"neuron"}
+    assert plan.get_dependents("api") == frozenset()
+
+
+def test_dependency_plan_names_services_of_the_cycle():
+    services = [
+        create_service("a"),
+        create_service("b", depends_on=["a", "d"]),
+        create_service("c", depends_on=["b"]),
+        create_service("d", depends_on=["c"]),
+        create_service("e", depends_on=["d"]),
+    ]
+    with pytest.raises(saue.CyclicDependencyError, match="b -> d -> c -> b"):
+        DependencyPlan(services)
+
+
+def test_dependency_plan_rejects_unknown_dependency():
+    services = [create_service("a", depends_on=["redis"])]
+    with pytest.raises(
+        saue.UnknownDependencyError, match="Service a depends on unknown service redis"
+    ):
+        DependencyPlan(services)
@@ -0,0 +1,479 @@
+import os
+import json
+import hashlib
+import socket
+import threading
+import pytest
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.http_client as sauhcl
+import subvortex.auto_upgrader.src.downloader as saudl
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        payload = self.server.payload
+
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(payload)))
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        payload = self.server.payload
+        self.server.ranges.append(self.headers.get("Range"))
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        # Honour the range only if the file has not changed since
+        start, end = 0, len(payload) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if (
+            self.server.accept_ranges
+            and range_header
+            and (if_range is None or if_range == self.server.etag)
+        ):
+            start, _, last = range_header.split("=")[1].partition("-")
+            start, end = int(start), int(last) if last else end
+
+        if start >= len(payload):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(payload)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = payload[start : end + 1]
+        partial = len(body) != len(payload)
+        self.send_response(206 if partial else 200)
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+        self.end_headers()
+
+        # Drop the connection in the middle of the body
+        with self.server.lock:
+            disconnect = self.server.disconnects > 0
+            self.server.disconnects -= 1 if disconnect else 0
+
+        if disconnect:
+            self.wfile.write(body[: len(body) // 3])
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_RDWR)
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    server.payload = PAYLOAD
+    server.etag = '"v1"'
+    server.disconnects = 0
+    server.ranges = []
+    server.accept_ranges = True
+    server.lock = threading.Lock()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def chunk_size():
+    # Small chunks so a dropped connection leaves some bytes on disk
+    with patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_CHUNK_SIZE", 16384):
+        yield
+
+
+@pytest.fixture
+def downloader():
+    return saudl.Downloader(session=sauhcl.create_session())
+
+
+def get_url(server, path="/archive.tar.gz"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_download_writes_the_file_atomically(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    result = downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert result == target
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert not os.path.exists(f"{target}.part")
+    assert not os.path.exists(f"{target}.part.json")
+
+
+def test_download_returns_none_when_asset_does_not_exist(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    result = downloader.download(url=get_url(server, "/missing"), target_path=target)
+
+    # Assert
+    assert result is None
+    assert not os.path.exists(target)
+
+
+def test_download_resumes_after_disconnects(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 2
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert server.ranges[0] is None
+    assert all(x.startswith("bytes=") for x in server.ranges[1:])
+    assert len(server.ranges) == 3
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_MAX_RESUMES", 0)
+def test_download_keeps_part_to_resume_on_next_call(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 1
+    target = str(tmp_path / "archive.tar.gz")
+
+    with pytest.raises(requests.RequestException):
+        downloader.download(url=get_url(server), target_path=target)
+
+    offset = os.path.getsize(f"{target}.part")
+    with open(f"{target}.part.json") as f:
+        sidecar = json.load(f)
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert 0 < offset < len(PAYLOAD)
+    assert sidecar["etag"] == '"v1"'
+    assert sidecar["expected_length"] == len(PAYLOAD)
+    assert server.ranges[-1] == f"bytes={offset}-"
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_MAX_RESUMES", 0)
+def test_download_restarts_when_remote_file_changed(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 1
+    target = str(tmp_path / "archive.tar.gz")
+
+    with pytest.raises(requests.RequestException):
+        downloader.download(url=get_url(server), target_path=target)
+
+    server.etag = '"v2"'
+    server.payload = PAYLOAD[::-1]
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD[::-1]
+
+
+def test_download_discards_part_of_another_url(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    with open(f"{target}.part", "wb") as f:
+        f.write(b"garbage")
+    with open(f"{target}.part.json", "w") as f:
+        json.dump({"url": "http://elsewhere", "etag": '"v1"'}, f)
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert server.ranges == [None]
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+def test_download_completes_an_already_complete_part(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    with open(f"{target}.part", "wb") as f:
+        f.write(PAYLOAD)
+    with open(f"{target}.part.json", "w") as f:
+        json.dump(
+            {"url": get_url(server), "etag": '"v1"', "expected_length": len(PAYLOAD)},
+            f,
+        )
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert server.ranges == [f"bytes={len(PAYLOAD)}-"]
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+def test_download_stops_when_cancelled(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    downloader.cancelled.set()
+
+    # Act
+    with pytest.raises(saue.OperationCancelledError):
+        downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert not os.path.exists(target)
+
+
+def test_download_verifies_checksum(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    sha256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+    # Act
+    result = downloader.download(url=get_url(server), target_path=target, sha256=sha256)
+
+    # Assert
+    assert result == target
+
+
+def test_download_rejects_checksum_mismatch(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    with pytest.raises(saue.ChecksumMismatchError):
+        downloader.download(url=get_url(server), target_path=target, sha256="0" * 64)
+
+    # Assert
+    assert not os.path.exists(target)
+    assert not os.path.exists(f"{target}.part")
+    assert not os.path.exists(f"{target}.part.json")
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_SEGMENTS", 4)
+def test_segmented_download_writes_each_range_at_its_offset(
+    server, downloader, tmp_path
+):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    size = len(PAYLOAD) // 4
+
+    # Act
+    downloader.download(
+        url=get_url(server),
+        target_path=target,
+        sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    # Assert
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert sorted(server.ranges) == sorted(
+        f"bytes={i * size}-{(i + 1) * size - 1}" for i in range(4)
+    )
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_SEGMENTS", 4)
+def test_segmented_download_resumes_interrupted_segments(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 2
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert len(server.ranges) == 6
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_SEGMENTS", 4)
+def test_segmented_download_falls_back_without_range_support(
+    server, downloader, tmp_path
+):
+    # Arrange
+    server.accept_ranges = False
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert server.ranges == [None]
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_SEGMENTS", 4)
+def test_segmented_download_falls_back_when_file_changes(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    original_head = RangeHandler.do_HEAD
+
+    def do_HEAD(handler):
+        # The file is replaced right after the HEAD
+        original_head(handler)
+        handler.server.etag = '"v2"'
+        handler.server.payload = PAYLOAD[::-1]
+
+    # Act
+    with patch.object(RangeHandler, "do_HEAD", do_HEAD):
+        downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD[::-1]
+
+
+def test_stream_copies_bytes_into_target(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    with downloader.stream(
+        url=get_url(server),
+        target_path=target,
+        sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+    ) as stream:
+        head = stream.read(1000)
+
+    # Assert
+    assert head == PAYLOAD[:1000]
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_stream_returns_none_when_asset_does_not_exist(server, downloader):
+    # Act
+    with downloader.stream(url=get_url(server, "/missing")) as stream:
+        # Assert
+        assert stream is None
+
+
+def test_stream_rejects_checksum_mismatch(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+
+    # Act
+    with pytest.raises(saue.ChecksumMismatchError):
+        with downloader.stream(
+            url=get_url(server), target_path=target, sha256="0" * 64
+        ) as stream:
+            stream.read()
+
+    # Assert
+    assert not os.path.exists(target)
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_stream_interrupted_is_resumed_by_download(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 1
+    target = str(tmp_path / "archive.tar.gz")
+
+    with pytest.raises(requests.RequestException):
+        with downloader.stream(url=get_url(server), target_path=target) as stream:
+            stream.read()
+
+    offset = os.path.getsize(f"{target}.part")
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert offset > 0
+    assert server.ranges[-1] == f"bytes={offset}-"
+    with open(target, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+def test_download_records_verified_digest(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    sha256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Assert
+    assert downloader.is_verified(target)
+    assert downloader.is_verified(target, sha256=sha256)
+    assert not downloader.is_verified(target, sha256="0" * 64)
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_MAX_RESUMES", 0)
+def test_resumed_download_hashes_the_whole_file(server, downloader, tmp_path):
+    # Arrange
+    server.disconnects = 1
+    target = str(tmp_path / "archive.tar.gz")
+    sha256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+    with pytest.raises(requests.RequestException):
+        downloader.download(url=get_url(server), target_path=target, sha256=sha256)
+
+    # Act
+    downloader.download(url=get_url(server), target_path=target, sha256=sha256)
+
+    # Assert
+    assert downloader.is_verified(target, sha256=sha256)
+
+
+def test_modified_file_is_not_verified(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Act
+    with open(target, "r+b") as f:
+        f.truncate(1000)
+
+    # Assert
+    assert downloader.is_recorded(target)
+    assert not downloader.is_verified(target)
+
+
+def test_remove_deletes_file_and_records(server, downloader, tmp_path):
+    # Arrange
+    target = str(tmp_path / "archive.tar.gz")
+    downloader.download(url=get_url(server), target_path=target)
+
+    # Act
+    downloader.remove(target)
+
+    # Assert
+    assert os.listdir(tmp_path) == []
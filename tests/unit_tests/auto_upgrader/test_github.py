@@ -1,18 +1,34 @@
 # The MIT License (MIT)
 # Copyright © 2024 Eclipse Vortex
+import io
+import os
+import time
 import pytest
-from unittest.mock import patch, MagicMock
+import asyncio
+import tarfile
+import hashlib
+import requests
+from unittest.mock import patch, MagicMock, AsyncMock
 
 import subvortex.auto_upgrader.src.constants as sauc
 import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.archive as saua
 
 from subvortex.auto_upgrader.src.github import Github
 
 
+@pytest.fixture(autouse=True)
+def asset_dir(tmp_path):
+    # Keep the http cache of each test isolated
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        yield tmp_path
+
+
 @patch("subvortex.auto_upgrader.src.github.os.readlink")
 @patch("subvortex.auto_upgrader.src.github.os.path.islink", return_value=True)
 @patch("subvortex.auto_upgrader.src.github.os.path.isfile", return_value=False)
-def test_get_local_version_symlink_returns_version(
+@pytest.mark.asyncio
+async def test_get_local_version_symlink_returns_version(
     mock_isfile, mock_islink, mock_readlink
 ):
     # Arrange
@@ -20,7 +36,7 @@ def test_get_local_version_symlink_returns_version(
     mock_readlink.return_value = "/var/tmp/subvortex/subvortex-1.2.3"
 
     # Act
-    version = github.get_local_version()
+    version = await github.get_local_version()
 
     # Assert
     assert version == "1.2.3"
@@ -29,13 +45,14 @@ def test_get_local_version_symlink_returns_version(
 
 @patch("subvortex.auto_upgrader.src.github.os.readlink")
 @patch("subvortex.auto_upgrader.src.github.os.path.islink", return_value=False)
-def test_get_local_version_symlink_not_found(mock_islink, mock_readlink):
+@pytest.mark.asyncio
+async def test_get_local_version_symlink_not_found(mock_islink, mock_readlink):
     # Arrange
     github = Github()
     mock_readlink.return_value = "/some/unknown/path/no-version-here"
 
     # Act
-    version = github.get_local_version()
+    version = await github.get_local_version()
 
     # Assert
     assert version is None
@@ -43,13 +60,14 @@ def test_get_local_version_symlink_not_found(mock_islink, mock_readlink):
 
 @patch("subvortex.auto_upgrader.src.github.os.readlink")
 @patch("subvortex.auto_upgrader.src.github.os.path.islink", return_value=True)
-def test_get_local_version_symlink_invalid_path(mock_islink, mock_readlink):
+@pytest.mark.asyncio
+async def test_get_local_version_symlink_invalid_path(mock_islink, mock_readlink):
     # Arrange
     github = Github()
     mock_readlink.return_value = "/some/unknown/path/no-version-here"
 
     # Act
-    version = github.get_local_version()
+    version = await github.get_local_version()
 
     # Assert
     assert version is None
@@ -59,7 +77,8 @@ def test_get_local_version_symlink_invalid_path(mock_islink, mock_readlink):
 @patch("subvortex.auto_upgrader.src.github.os.path.islink", return_value=True)
 @patch("subvortex.auto_upgrader.src.github.os.path.isfile", return_value=True)
 @patch("subvortex.auto_upgrader.src.github.os.remove")
-def test_get_local_version_symlink_force_marker(
+@pytest.mark.asyncio
+async def test_get_local_version_symlink_force_marker(
     mock_remove, mock_isfile, mock_islink, mock_readlink
 ):
     # Arrange
@@ -67,20 +86,22 @@ def test_get_local_version_symlink_force_marker(
     mock_readlink.return_value = "/var/tmp/subvortex/subvortex-3.0.0a40"
 
     # Act
-    version = github.get_local_version()
+    version = await github.get_local_version()
 
     # Assert
     assert version is None
     mock_remove.assert_called_once()
 
 
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_service_returns_version(mock_requests_get):
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_returns_version(mock_requests_get):
     # Arrange
     github = Github()
 
     mock_response = MagicMock()
     mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = [
         {"tag_name": "v1.2.3", "published_at": "2025-04-20T12:34:56Z"},
         {"tag_name": "v1.2.2", "published_at": "2025-04-19T12:34:56Z"},
@@ -88,25 +109,29 @@ def test_get_latest_version_service_returns_version(mock_requests_get):
     mock_requests_get.return_value = mock_response
 
     # Act
-    version = github.get_latest_version()
+    version = await github.get_latest_version()
 
     # Assert
     assert version == "1.2.3"
     mock_requests_get.assert_called_once()
 
 
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_service_raise_release_url_not_found(mock_requests_get):
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_raise_release_url_not_found(
+    mock_requests_get,
+):
     # Arrange
     github = Github()
 
     mock_response = MagicMock()
     mock_response.status_code = 404
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Act
     with pytest.raises(saue.ReleaseNotFoundError) as exc:
-        github.get_latest_version()
+        await github.get_latest_version()
 
     # Assert
     assert (
@@ -115,27 +140,32 @@ def test_get_latest_version_service_raise_release_url_not_found(mock_requests_ge
     )
 
 
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_service_raise_no_release_available_found(mock_requests_get):
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_raise_no_release_available_found(
+    mock_requests_get,
+):
     # Arrange
     github = Github()
 
     mock_response = MagicMock()
     mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = []
     mock_requests_get.return_value = mock_response
 
     # Act
     with pytest.raises(saue.NoReleaseAvailableError) as exc:
-        github.get_latest_version()
+        await github.get_latest_version()
 
     # Assert
     assert "[AU1012] No release available" == str(exc.value)
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-def test_get_local_version_container_returns_none_when_no_valid_images(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_get_local_version_container_returns_none_when_no_valid_images(
     mock_subprocess_run,
 ):
     # Arrange
@@ -150,7 +180,7 @@ def test_get_local_version_container_returns_none_when_no_valid_images(
 
     # Patch get_tag to return the expected floating tag
     with patch("subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="dev"):
-        version = github.get_local_version()
+        version = await github.get_local_version()
 
     # Assert
     assert version is None
@@ -158,9 +188,10 @@ def test_get_local_version_container_returns_none_when_no_valid_images(
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_version(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_version(
     mock_requests_get, mock_subprocess_run
 ):
     # Arrange
@@ -169,6 +200,7 @@ def test_get_latest_version_container_returns_version(
     # Mock responses for GitHub API
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [
         {"name": "subvortex-miner-neuron"},
     ]
@@ -187,7 +219,7 @@ def test_get_latest_version_container_returns_version(
     ]
 
     # Act
-    version = github.get_latest_version()
+    version = await github.get_latest_version()
 
     # Assert
     assert version == "1.2.3"
@@ -196,9 +228,10 @@ def test_get_latest_version_container_returns_version(
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_ROLE", "validator")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_new_version_if_at_least_one_service_has_the_new_version(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_new_version_if_at_least_one_service_has_the_new_version(
     mock_requests_get, mock_subprocess_run
 ):
     # Arrange
@@ -207,6 +240,7 @@ def test_get_latest_version_container_returns_new_version_if_at_least_one_servic
     # Mock responses for GitHub API
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [
         {"name": "subvortex-validator-neuron"},
         {"name": "subvortex-validator-redis"},
@@ -231,7 +265,7 @@ def test_get_latest_version_container_returns_new_version_if_at_least_one_servic
     ]
 
     # Act
-    version = github.get_latest_version()
+    version = await github.get_latest_version()
 
     # Assert
     assert version == "1.2.3"
@@ -240,9 +274,10 @@ def test_get_latest_version_container_returns_new_version_if_at_least_one_servic
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_ROLE", "validator")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_new_version_if_all_service_has_new_version(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_new_version_if_all_service_has_new_version(
     mock_requests_get, mock_subprocess_run
 ):
     # Arrange
@@ -251,6 +286,7 @@ def test_get_latest_version_container_returns_new_version_if_all_service_has_new
     # Mock responses for GitHub API
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [
         {"name": "subvortex-validator-neuron"},
         {"name": "subvortex-validator-redis"},
@@ -275,7 +311,7 @@ def test_get_latest_version_container_returns_new_version_if_all_service_has_new
     ]
 
     # Act
-    version = github.get_latest_version()
+    version = await github.get_latest_version()
 
     # Assert
     assert version == "1.2.3"
@@ -283,20 +319,24 @@ def test_get_latest_version_container_returns_new_version_if_all_service_has_new
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_none_when_no_packages(mock_requests_get):
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_none_when_no_packages(
+    mock_requests_get,
+):
     # Arrange
     github = Github()
 
     # Mock packages list response (empty list)
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = []
 
     mock_requests_get.side_effect = [packages_response]
 
     # Act
-    version = github.get_latest_version()
+    version = await github.get_latest_version()
 
     # Assert
     assert version is None
@@ -304,18 +344,22 @@ def test_get_latest_version_container_returns_none_when_no_packages(mock_request
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_raise_package_url_not_found(mock_requests_get):
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_raise_package_url_not_found(
+    mock_requests_get,
+):
     # Arrange
     github = Github()
 
     mock_response = MagicMock()
     mock_response.status_code = 404
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Act
     with pytest.raises(saue.PackageNotFoundError) as exc:
-        github.get_latest_version()
+        await github.get_latest_version()
 
     # Assert
     assert (
@@ -325,9 +369,10 @@ def test_get_latest_version_container_raise_package_url_not_found(mock_requests_
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_skip_package_if_image_could_not_be_found(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_skip_package_if_image_could_not_be_found(
     mock_requests_get, mock_subprocess_run
 ):
     github = Github()
@@ -335,6 +380,7 @@ def test_get_latest_version_container_skip_package_if_image_could_not_be_found(
     # Simulate GitHub returning one container package
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [{"name": "subvortex-miner-neuron"}]
     mock_requests_get.return_value = packages_response
 
@@ -346,7 +392,7 @@ def test_get_latest_version_container_skip_package_if_image_could_not_be_found(
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version is None
     assert mock_requests_get.call_count == 1
@@ -354,9 +400,10 @@ def test_get_latest_version_container_skip_package_if_image_could_not_be_found(
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_none_if_image_could_not_be_pulled_and_no_local_version_found(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_none_if_image_could_not_be_pulled_and_no_local_version_found(
     mock_requests_get, mock_subprocess_run
 ):
     github = Github()
@@ -365,6 +412,7 @@ def test_get_latest_version_container_returns_none_if_image_could_not_be_pulled_
     # Simulate GitHub returning one container package
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [{"name": "subvortex-miner-neuron"}]
     mock_requests_get.return_value = packages_response
 
@@ -377,7 +425,7 @@ def test_get_latest_version_container_returns_none_if_image_could_not_be_pulled_
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version is None
     assert mock_requests_get.call_count == 1
@@ -385,9 +433,10 @@ def test_get_latest_version_container_returns_none_if_image_could_not_be_pulled_
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_local_version_if_image_could_not_be_pulled_and_local_version_found(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_local_version_if_image_could_not_be_pulled_and_local_version_found(
     mock_requests_get, mock_subprocess_run
 ):
     github = Github()
@@ -396,6 +445,7 @@ def test_get_latest_version_container_returns_local_version_if_image_could_not_b
     # Simulate GitHub returning one container package
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [{"name": "subvortex-miner-neuron"}]
     mock_requests_get.return_value = packages_response
 
@@ -408,7 +458,7 @@ def test_get_latest_version_container_returns_local_version_if_image_could_not_b
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version == "1.0.0"
     assert mock_requests_get.call_count == 1
@@ -416,9 +466,10 @@ def test_get_latest_version_container_returns_local_version_if_image_could_not_b
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_none_if_inspect_fails_and_no_local_version_found(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_none_if_inspect_fails_and_no_local_version_found(
     mock_requests_get, mock_subprocess_run
 ):
     github = Github()
@@ -427,6 +478,7 @@ def test_get_latest_version_container_returns_none_if_inspect_fails_and_no_local
     # Simulate GitHub returning one container package
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [{"name": "subvortex-miner-neuron"}]
     mock_requests_get.return_value = packages_response
 
@@ -439,7 +491,7 @@ def test_get_latest_version_container_returns_none_if_inspect_fails_and_no_local
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version is None
     assert mock_requests_get.call_count == 1
@@ -447,9 +499,10 @@ def test_get_latest_version_container_returns_none_if_inspect_fails_and_no_local
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_container_returns_local_version_if_inspect_fails_and_local_version_found(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_container_returns_local_version_if_inspect_fails_and_local_version_found(
     mock_requests_get, mock_subprocess_run
 ):
     github = Github()
@@ -458,6 +511,7 @@ def test_get_latest_version_container_returns_local_version_if_inspect_fails_and
     # Simulate GitHub returning one container package
     packages_response = MagicMock()
     packages_response.status_code = 200
+    packages_response.headers = {}
     packages_response.json.return_value = [{"name": "subvortex-miner-neuron"}]
     mock_requests_get.return_value = packages_response
 
@@ -470,7 +524,7 @@ def test_get_latest_version_container_returns_local_version_if_inspect_fails_and
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version == "1.0.0"
     assert mock_requests_get.call_count == 1
@@ -478,8 +532,9 @@ def test_get_latest_version_container_returns_local_version_if_inspect_fails_and
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-def test_get_local_version_container_returns_version(mock_subprocess_run):
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_get_local_version_container_returns_version(mock_subprocess_run):
     # Arrange
     github = Github()
 
@@ -502,7 +557,7 @@ def test_get_local_version_container_returns_version(mock_subprocess_run):
 
     # Patch get_tag to return the expected floating tag
     with patch("subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="dev"):
-        version = github.get_local_version()
+        version = await github.get_local_version()
 
     # Assert
     assert version == "1.2.3"
@@ -510,8 +565,9 @@ def test_get_local_version_container_returns_version(mock_subprocess_run):
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-def test_get_local_version_image_returns_version(mock_subprocess_run):
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_get_local_version_image_returns_version(mock_subprocess_run):
     # Arrange
     github = Github()
 
@@ -534,7 +590,7 @@ def test_get_local_version_image_returns_version(mock_subprocess_run):
 
     # Patch get_tag to return the expected floating tag
     with patch("subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="dev"):
-        version = github.get_local_version()
+        version = await github.get_local_version()
 
     # Assert
     assert version == "1.2.3"
@@ -560,8 +616,8 @@ def test_get_local_container_versions_returns_default_if_missing():
 
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
 @pytest.mark.parametrize(
     "floating_tag,expected_version",
     [
@@ -570,7 +626,8 @@ def test_get_local_container_versions_returns_default_if_missing():
         ("dev", "3.0.0-alpha.21"),
     ],
 )
-def test_get_latest_container_version_different_tags(
+@pytest.mark.asyncio
+async def test_get_latest_container_version_different_tags(
     mock_subprocess_run,
     mock_requests_get,
     floating_tag,
@@ -586,6 +643,7 @@ def test_get_latest_container_version_different_tags(
         # Mock requests.get to return a list of container packages
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.json.return_value = [
             {"name": "subvortex-miner-neuron"},
         ]
@@ -601,7 +659,7 @@ def test_get_latest_container_version_different_tags(
         ]
 
         # Act
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
         # Assert
         assert version == expected_version
@@ -611,9 +669,10 @@ def test_get_latest_container_version_different_tags(
 
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
 @patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_ROLE", "miner")
-@patch("subvortex.auto_upgrader.src.github.subprocess.run")
-@patch("subvortex.auto_upgrader.src.github.requests.get")
-def test_get_latest_version_inspect_succeeds_after_pull_fails(
+@patch("subvortex.auto_upgrader.src.github.Github._run_command", new_callable=AsyncMock)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_inspect_succeeds_after_pull_fails(
     mock_requests_get,
     mock_subprocess_run,
 ):
@@ -622,6 +681,7 @@ def test_get_latest_version_inspect_succeeds_after_pull_fails(
     # Mock GitHub packages API to return one miner container
     mock_packages_response = MagicMock()
     mock_packages_response.status_code = 200
+    mock_packages_response.headers = {}
     mock_packages_response.json.return_value = [
         {"name": "subvortex-miner-neuron"},
     ]
@@ -639,8 +699,645 @@ def test_get_latest_version_inspect_succeeds_after_pull_fails(
     with patch(
         "subvortex.auto_upgrader.src.github.sauu.get_tag", return_value="latest"
     ):
-        version = github.get_latest_version()
+        version = await github.get_latest_version()
 
     assert version == "2.5.0"
     assert mock_requests_get.call_count == 1
     assert mock_subprocess_run.call_count == 2
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_reuse_cached_releases_when_not_modified(
+    mock_requests_get,
+):
+    # Arrange
+    github = Github()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {"ETag": '"abc"'}
+    mock_response.json.return_value = [
+        {"tag_name": "v1.2.3", "published_at": "2025-04-20T12:34:56Z"},
+    ]
+
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+    not_modified_response.headers = {"ETag": '"abc"'}
+
+    mock_requests_get.side_effect = [mock_response, not_modified_response]
+
+    # Act
+    first_version = await github.get_latest_version()
+    second_version = await github.get_latest_version()
+
+    # Assert
+    assert first_version == "1.2.3"
+    assert second_version == "1.2.3"
+    assert mock_requests_get.call_count == 2
+    assert "If-None-Match" not in mock_requests_get.call_args_list[0].kwargs["headers"]
+    assert (
+        mock_requests_get.call_args_list[1].kwargs["headers"]["If-None-Match"]
+        == '"abc"'
+    )
+    not_modified_response.json.assert_not_called()
+    assert github.http_cache.stats()["hits"] == 1
+    assert github.http_cache.stats()["misses"] == 1
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_send_conditional_request_after_restart(
+    mock_requests_get,
+):
+    # Arrange
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {"ETag": '"abc"'}
+    mock_response.json.return_value = [
+        {"tag_name": "v1.2.3", "published_at": "2025-04-20T12:34:56Z"},
+    ]
+
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+    not_modified_response.headers = {}
+
+    mock_requests_get.side_effect = [mock_response, not_modified_response]
+
+    await Github().get_latest_version()
+
+    # Act
+    version = await Github().get_latest_version()
+
+    # Assert
+    assert version == "1.2.3"
+    assert (
+        mock_requests_get.call_args_list[1].kwargs["headers"]["If-None-Match"]
+        == '"abc"'
+    )
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_get_latest_version_service_uses_timeouts(mock_requests_get):
+    # Arrange
+    github = Github()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.json.return_value = [
+        {"tag_name": "v1.2.3", "published_at": "2025-04-20T12:34:56Z"},
+    ]
+    mock_requests_get.return_value = mock_response
+
+    # Act
+    await github.get_latest_version()
+
+    # Assert
+    assert mock_requests_get.call_args.kwargs["timeout"] == (
+        sauc.SV_HTTP_CONNECT_TIMEOUT,
+        sauc.SV_HTTP_READ_TIMEOUT,
+    )
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+async def test_get_latest_version_service_does_not_block_the_event_loop(
+    mock_requests_get,
+):
+    # Arrange
+    github = Github()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.json.return_value = [
+        {"tag_name": "v1.2.3", "published_at": "2025-04-20T12:34:56Z"},
+    ]
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.3)
+        return mock_response
+
+    mock_requests_get.side_effect = slow_get
+
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    # Act
+    version, _ = await asyncio.gather(github.get_latest_version(), ticker())
+
+    # Assert
+    assert version == "1.2.3"
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.2
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_assets_stops_when_cancelled(mock_requests_get, asset_dir):
+    # Arrange
+    github = Github()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.__enter__.return_value = mock_response
+    mock_response.iter_content.return_value = iter([b"a" * 10] * 10)
+
+    mock_checksum = MagicMock()
+    mock_checksum.status_code = 404
+
+    mock_requests_get.side_effect = lambda url, **kwargs: (
+        mock_response if url.endswith(".tar.gz") else mock_checksum
+    )
+
+    github.cancel()
+
+    # Act
+    with pytest.raises(saue.OperationCancelledError):
+        github._download_assets(version="1.2.3", role="miner")
+
+
+DIGEST = "ab" * 32
+
+
+@pytest.mark.parametrize(
+    "asset,body,expected",
+    [
+        (f"{DIGEST}  subvortex_miner-1.2.3.tar.gz\n", None, DIGEST),
+        (None, f"## Checksums\n{DIGEST.upper()}  subvortex_miner-1.2.3.tar.gz", DIGEST),
+        (None, f"{DIGEST}  subvortex_validator-1.2.3.tar.gz", None),
+        (None, None, None),
+    ],
+)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_get_published_checksum(mock_requests_get, asset, body, expected):
+    # Arrange
+    github = Github()
+    url = "https://example.com/v1.2.3/subvortex_miner-1.2.3.tar.gz"
+
+    def get(url, **kwargs):
+        response = MagicMock()
+        response.headers = {}
+        if url.endswith(".sha256"):
+            response.status_code = 200 if asset else 404
+            response.text = asset
+        else:
+            response.status_code = 200 if body else 404
+            response.json.return_value = {"body": body}
+        return response
+
+    mock_requests_get.side_effect = get
+
+    # Act
+    result = github._get_published_checksum(url=url, version="1.2.3")
+
+    # Assert
+    assert result == expected
+    assert mock_requests_get.call_args_list[0][0][0] == f"{url}.sha256"
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_assets_accepts_verified_archive_with_a_stat(
+    mock_requests_get, asset_dir
+):
+    # Arrange
+    github = Github()
+    archive_path = str(asset_dir / "subvortex_miner-1.2.3.tar.gz")
+    with open(archive_path, "wb") as f:
+        f.write(b"archive")
+
+    sha256 = hashlib.sha256(b"archive").hexdigest()
+    github._get_published_checksum = MagicMock(return_value=sha256)
+
+    # Act
+    with patch.object(
+        github.downloader, "_hash_file", wraps=github.downloader._hash_file
+    ) as mock_hash:
+        github._download_assets(version="1.2.3", role="miner")
+        github._download_assets(version="1.2.3", role="miner")
+
+    # Assert
+    mock_hash.assert_called_once()
+    mock_requests_get.assert_not_called()
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_get_published_checksum_ignores_http_errors(mock_requests_get):
+    # Arrange
+    github = Github()
+    url = "https://example.com/v1.2.3/subvortex_miner-1.2.3.tar.gz"
+
+    response = MagicMock()
+    response.status_code = 403
+    response.raise_for_status.side_effect = requests.HTTPError("403 rate limit")
+    mock_requests_get.return_value = response
+
+    # Act
+    result = github._get_published_checksum(url=url, version="1.2.3")
+
+    # Assert
+    assert result is None
+
+
+def test_download_assets_skips_checksum_of_verified_archive(asset_dir):
+    # Arrange
+    github = Github()
+    archive_path = str(asset_dir / "subvortex_miner-1.2.3.tar.gz")
+    with open(archive_path, "wb") as f:
+        f.write(b"archive")
+
+    github.downloader.verify(
+        archive_path, sha256=hashlib.sha256(b"archive").hexdigest()
+    )
+    github._get_published_checksum = MagicMock()
+    github.downloader.download = MagicMock()
+
+    # Act
+    result = github._download_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert result == archive_path
+    github._get_published_checksum.assert_not_called()
+    github.downloader.download.assert_not_called()
+
+
+@patch("subvortex.auto_upgrader.src.github.tarfile.open")
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_assets_replaces_archive_not_matching_checksum(
+    mock_requests_get, mock_tarfile_open, asset_dir
+):
+    # Arrange
+    github = Github()
+    archive_path = str(asset_dir / "subvortex_miner-1.2.3.tar.gz")
+    with open(archive_path, "wb") as f:
+        f.write(b"truncated")
+
+    github._get_published_checksum = MagicMock(
+        return_value=hashlib.sha256(b"archive").hexdigest()
+    )
+    github.downloader.download = MagicMock(return_value=archive_path)
+
+    # Act
+    github._download_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert not os.path.exists(archive_path)
+    github.downloader.download.assert_called_once()
+    mock_tarfile_open.assert_not_called()
+
+
+def build_archive(top_level_dir: str):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        content = b"__version__ = '1.2.3'"
+        info = tarfile.TarInfo(f"{top_level_dir}/version.py")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+
+    return buffer.getvalue()
+
+
+def mock_release(mock_requests_get, archive: bytes, sha256: str = None, fail=False):
+    def get(url, **kwargs):
+        response = MagicMock()
+        response.__enter__.return_value = response
+
+        if not url.endswith(".tar.gz"):
+            response.status_code = 200 if sha256 else 404
+            response.text = f"{sha256}  archive.tar.gz" if sha256 else ""
+            return response
+
+        def iter_content(chunk_size):
+            yield archive[: len(archive) // 2]
+            if fail:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield archive[len(archive) // 2 :]
+
+        response.status_code = 200
+        response.headers = {"Content-Length": str(len(archive))}
+        response.iter_content.side_effect = iter_content
+        return response
+
+    mock_requests_get.side_effect = get
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_STREAMING", True)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_download_and_unzip_assets_streams_archive(mock_requests_get, asset_dir):
+    # Arrange
+    github = Github()
+    archive = build_archive("subvortex-1.2.3")
+    mock_release(mock_requests_get, archive, hashlib.sha256(archive).hexdigest())
+
+    # Act
+    result = await github.download_and_unzip_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert result == str(asset_dir / "subvortex-1.2.3")
+    assert os.path.isfile(asset_dir / "subvortex-1.2.3" / "version.py")
+    assert not os.path.exists(asset_dir / "subvortex_miner-1.2.3.tar.gz")
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_STREAMING", True)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_download_and_unzip_assets_does_not_extract_tampered_stream(
+    mock_requests_get, asset_dir
+):
+    # Arrange
+    github = Github()
+    mock_release(mock_requests_get, build_archive("subvortex-1.2.3"), "0" * 64)
+
+    # Act
+    with pytest.raises(saue.ChecksumMismatchError):
+        await github.download_and_unzip_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert not os.path.exists(asset_dir / "subvortex-1.2.3")
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_DOWNLOAD_STREAMING", True)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_download_and_unzip_assets_falls_back_when_stream_interrupted(
+    mock_requests_get, asset_dir
+):
+    # Arrange
+    github = Github()
+    archive = build_archive("subvortex-1.2.3")
+    mock_release(mock_requests_get, archive, fail=True)
+
+    github._download_assets = MagicMock(return_value=None)
+
+    # Act
+    result = await github.download_and_unzip_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert result is None
+    github._download_assets.assert_called_once_with(role="miner", version="1.2.3")
+    assert not os.path.exists(asset_dir / "subvortex-1.2.3")
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_ARCHIVE_CACHE_SIZE", 1024 * 1024)
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+@pytest.mark.asyncio
+async def test_download_and_unzip_assets_reuses_cached_archive(
+    mock_requests_get, asset_dir
+):
+    # Arrange
+    github = Github()
+    archive = build_archive("subvortex-1.2.3")
+    mock_release(mock_requests_get, archive, hashlib.sha256(archive).hexdigest())
+
+    await github.download_and_unzip_assets(version="1.2.3", role="miner")
+    mock_requests_get.reset_mock()
+
+    # Act
+    result = await Github().download_and_unzip_assets(version="1.2.3", role="miner")
+
+    # Assert
+    assert result == str(asset_dir / "subvortex-1.2.3")
+    mock_requests_get.assert_not_called()
+    assert not os.path.exists(asset_dir / "subvortex_miner-1.2.3.tar.gz")
+    assert Github().archive_cache.stats()["hits"] == 1
+
+
+def mock_delta_release(mock_requests_get, manifest: dict, files: dict):
+    def get(url, **kwargs):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {}
+        response.status_code = 404
+
+        if url.endswith(".manifest.json") and manifest is not None:
+            response.status_code = 200
+            response.json.return_value = manifest
+        elif "raw.githubusercontent.com" in url:
+            relpath = url.split("/v1.1.0/")[1]
+            response.status_code = 200
+            response.content = files[relpath]
+
+        return response
+
+    mock_requests_get.side_effect = get
+
+
+@pytest.fixture
+def delta_base(asset_dir):
+    base_dir = asset_dir / "subvortex-1.0.0"
+    (base_dir / "subvortex").mkdir(parents=True)
+    (base_dir / "README.md").write_bytes(b"readme")
+    (base_dir / "subvortex" / "version.py").write_bytes(b"1.0.0")
+    (base_dir / ".complete").touch()
+
+    with patch("subvortex.auto_upgrader.src.constants.SV_DELTA_UPDATE", True):
+        yield base_dir
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_and_unzip_assets_assembles_delta(
+    mock_requests_get, asset_dir, delta_base
+):
+    # Arrange
+    github = Github()
+    github.get_installed_version = MagicMock(return_value="1.0.0")
+    github._download_assets = MagicMock()
+
+    files = {"README.md": b"readme", "subvortex/version.py": b"1.1.0"}
+    manifest = {
+        "files": {
+            relpath: {"size": len(x), "sha256": hashlib.sha256(x).hexdigest()}
+            for relpath, x in files.items()
+        }
+    }
+    mock_delta_release(mock_requests_get, manifest, files)
+
+    # Act
+    result = github.download_and_unzip_assets_sync(version="1.1.0", role="miner")
+
+    # Assert
+    assert result == str(asset_dir / "subvortex-1.1.0")
+    assert (
+        asset_dir / "subvortex-1.1.0" / "subvortex" / "version.py"
+    ).read_bytes() == b"1.1.0"
+    assert (asset_dir / "subvortex-1.1.0" / "README.md").read_bytes() == b"readme"
+    raw_urls = [
+        x[0][0]
+        for x in mock_requests_get.call_args_list
+        if "raw.githubusercontent" in x[0][0]
+    ]
+    assert raw_urls == [
+        "https://raw.githubusercontent.com/eclipsevortex/SubVortex/v1.1.0/subvortex/version.py"
+    ]
+    github._download_assets.assert_not_called()
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_and_unzip_assets_falls_back_without_manifest(
+    mock_requests_get, asset_dir, delta_base
+):
+    # Arrange
+    github = Github()
+    github.get_installed_version = MagicMock(return_value="1.0.0")
+    github._download_assets = MagicMock(return_value=None)
+    mock_delta_release(mock_requests_get, None, {})
+
+    # Act
+    result = github.download_and_unzip_assets_sync(version="1.1.0", role="miner")
+
+    # Assert
+    assert result is None
+    github._download_assets.assert_called_once_with(role="miner", version="1.1.0")
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_and_unzip_assets_falls_back_when_delta_is_corrupted(
+    mock_requests_get, asset_dir, delta_base
+):
+    # Arrange
+    github = Github()
+    github.get_installed_version = MagicMock(return_value="1.0.0")
+    github._download_assets = MagicMock(return_value=None)
+
+    manifest = {"files": {"subvortex/version.py": {"size": 5, "sha256": "0" * 64}}}
+    mock_delta_release(mock_requests_get, manifest, {"subvortex/version.py": b"1.1.0"})
+
+    # Act
+    github.download_and_unzip_assets_sync(version="1.1.0", role="miner")
+
+    # Assert
+    github._download_assets.assert_called_once()
+    assert not os.path.exists(asset_dir / "subvortex-1.1.0")
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_and_unzip_assets_skips_delta_without_base(
+    mock_requests_get, asset_dir, delta_base
+):
+    # Arrange
+    github = Github()
+    github.get_installed_version = MagicMock(return_value=None)
+    github._download_assets = MagicMock(return_value=None)
+
+    # Act
+    github.download_and_unzip_assets_sync(version="1.1.0", role="miner")
+
+    # Assert
+    mock_requests_get.assert_not_called()
+    github._download_assets.assert_called_once()
+
+
+@patch("subvortex.auto_upgrader.src.http_client.requests.Session.get")
+def test_download_and_unzip_assets_keeps_the_force_reinstall_marker(
+    mock_requests_get, asset_dir, delta_base
+):
+    # Arrange
+    (delta_base / "force_reinstall").touch()
+    os.symlink(delta_base, asset_dir / "subvortex")
+    github = Github()
+    github._download_assets = MagicMock(return_value=None)
+    mock_delta_release(mock_requests_get, None, {})
+
+    # Act
+    with patch(
+        "subvortex.auto_upgrader.src.constants.SV_EXECUTION_DIR",
+        str(asset_dir / "subvortex"),
+    ):
+        github.download_and_unzip_assets_sync(version="1.1.0", role="miner")
+
+    # Assert
+    assert (delta_base / "force_reinstall").exists()
+    urls = [x[0][0] for x in mock_requests_get.call_args_list]
+    assert any(x.endswith(".manifest.json") for x in urls)
+    assert not any("None" in x for x in urls)
+
+
+def test_unzip_assets_promotes_complete_directory(asset_dir):
+    # Arrange
+    archive_path = asset_dir / "archive.tar.gz"
+    archive_path.write_bytes(build_archive("subvortex-1.2.3"))
+    (asset_dir / "subvortex-1.2.3").mkdir()
+    (asset_dir / "subvortex-1.2.3" / "stale.py").write_bytes(b"stale")
+
+    # Act
+    target_dir = Github()._unzip_assets(archive_path=str(archive_path))
+
+    # Assert
+    assert target_dir == str(asset_dir / "subvortex-1.2.3")
+    assert sorted(os.listdir(target_dir)) == [".complete", "version.py"]
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
+
+
+def test_unzip_assets_keeps_previous_directory_when_interrupted(asset_dir):
+    # Arrange
+    archive_path = asset_dir / "archive.tar.gz"
+    archive_path.write_bytes(build_archive("subvortex-1.2.3"))
+    (asset_dir / "subvortex-1.2.3").mkdir()
+    (asset_dir / "subvortex-1.2.3" / "version.py").write_bytes(b"previous")
+
+    # Act
+    with patch(
+        "subvortex.auto_upgrader.src.archive.Extractor._write",
+        side_effect=OSError("No space left on device"),
+    ):
+        with pytest.raises(OSError):
+            Github()._unzip_assets(archive_path=str(archive_path))
+
+    # Assert
+    assert (asset_dir / "subvortex-1.2.3" / "version.py").read_bytes() == b"previous"
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
+
+
+def build_release_archive(path, files: dict):
+    with tarfile.open(path, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"subvortex-1.2.3/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_EXTRACT_ROLE_ONLY", True)
+def test_complete_assets_extracts_skipped_members_for_new_role(asset_dir):
+    # Arrange
+    archive_path = asset_dir / "subvortex_miner-1.2.3.tar.gz"
+    build_release_archive(
+        archive_path,
+        {
+            "subvortex/miner/neuron/metadata.json": b"miner",
+            "subvortex/validator/neuron/metadata.json": b"validator",
+        },
+    )
+
+    github = Github()
+    target_dir = github._unzip_assets(
+        archive_path=str(archive_path), include=github._get_include_filter("miner")
+    )
+    assert not os.path.exists(os.path.join(target_dir, "subvortex", "validator"))
+
+    github._download_assets = MagicMock(return_value=str(archive_path))
+
+    # Act
+    unchanged = github.complete_assets_sync(version="1.2.3", role="miner")
+    completed = github.complete_assets_sync(version="1.2.3", role="validator")
+
+    # Assert
+    assert unchanged == []
+    assert completed == ["subvortex/validator"]
+    github._download_assets.assert_called_once_with(version="1.2.3", role="miner")
+    with open(
+        os.path.join(target_dir, "subvortex", "validator", "neuron", "metadata.json"),
+        "rb",
+    ) as f:
+        assert f.read() == b"validator"
+    assert saua.load_skipped(target_dir) is None
+    assert [x for x in os.listdir(asset_dir) if x.startswith(".staging")] == []
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import pytest
+from unittest.mock import patch
+
+from subvortex.auto_upgrader.src.http_cache import HttpCache
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return os.path.join(tmp_path, "http.json")
+
+
+def test_get_validators_returns_empty_when_url_not_cached(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+
+    # Act
+    validators = cache.get_validators(url="https://api.github.com/x")
+
+    # Assert
+    assert validators == {}
+
+
+def test_get_validators_returns_etag_and_last_modified(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+    cache.store(
+        url="https://api.github.com/x",
+        headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        body=[1],
+    )
+
+    # Act
+    validators = cache.get_validators(url="https://api.github.com/x")
+
+    # Assert
+    assert validators == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_store_skips_response_without_validators(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+
+    # Act
+    cache.store(url="https://api.github.com/x", headers={}, body=[1])
+
+    # Assert
+    assert cache.hit(url="https://api.github.com/x") is None
+    assert not os.path.exists(cache_file)
+
+
+def test_cache_survives_restart(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+    cache.store(url="https://api.github.com/x", headers={"ETag": '"abc"'}, body=[1])
+
+    # Act
+    body = HttpCache(path=cache_file).hit(url="https://api.github.com/x")
+
+    # Assert
+    assert body == [1]
+
+
+def test_hit_and_miss_counters(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+    cache.store(url="https://api.github.com/x", headers={"ETag": '"abc"'}, body=[1])
+
+    # Act
+    cache.hit(url="https://api.github.com/x")
+    cache.hit(url="https://api.github.com/x")
+
+    # Assert
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_CACHE_TTL", 60)
+def test_stale_entries_are_evicted_on_load(cache_file):
+    # Arrange
+    with open(cache_file, "w") as f:
+        json.dump(
+            {
+                "entries": {
+                    "https://api.github.com/old": {
+                        "etag": '"old"',
+                        "body": [],
+                        "accessed_at": time.time() - 120,
+                    },
+                    "https://api.github.com/new": {
+                        "etag": '"new"',
+                        "body": [],
+                        "accessed_at": time.time(),
+                    },
+                }
+            },
+            f,
+        )
+    cache = HttpCache(path=cache_file)
+
+    # Act
+    old_validators = cache.get_validators(url="https://api.github.com/old")
+    new_validators = cache.get_validators(url="https://api.github.com/new")
+
+    # Assert
+    assert old_validators == {}
+    assert new_validators == {"If-None-Match": '"new"'}
+    assert cache.stats()["evictions"] == 1
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_CACHE_MAX_ENTRIES", 2)
+def test_least_recently_used_entries_are_evicted_above_limit(cache_file):
+    # Arrange
+    cache = HttpCache(path=cache_file)
+    for name in ["a", "b"]:
+        cache.store(url=f"https://x/{name}", headers={"ETag": name}, body=name)
+    cache.entries["https://x/a"]["accessed_at"] = time.time() - 10
+
+    # Act
+    cache.store(url="https://x/c", headers={"ETag": "c"}, body="c")
+
+    # Assert
+    assert cache.hit(url="https://x/a") is None
+    assert cache.hit(url="https://x/b") == "b"
+    assert cache.hit(url="https://x/c") == "c"
+
+
+def test_corrupted_cache_is_ignored(cache_file):
+    # Arrange
+    with open(cache_file, "w") as f:
+        f.write("{not json")
+    cache = HttpCache(path=cache_file)
+
+    # Act
+    validators = cache.get_validators(url="https://api.github.com/x")
+
+    # Assert
+    assert validators == {}
@@ -0,0 +1,98 @@
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.http_client as sauhcl
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests += 1
+        self.server.connections.add(self.client_address)
+
+        # Fail the first requests with a transient error
+        status = 503 if self.server.requests <= self.server.failures else 200
+        body = b"ok"
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.requests = 0
+    server.failures = 0
+    server.connections = set()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_BACKOFF_FACTOR", 0)
+def test_session_retries_transient_server_errors(server):
+    # Arrange
+    server.failures = 2
+    session = sauhcl.create_session()
+
+    # Act
+    response = session.get(
+        f"http://127.0.0.1:{server.server_port}/releases",
+        timeout=sauhcl.get_timeout(),
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert server.requests == 3
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_BACKOFF_FACTOR", 0)
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_MAX_RETRIES", 1)
+def test_session_returns_last_response_when_retries_are_exhausted(server):
+    # Arrange
+    server.failures = 5
+    session = sauhcl.create_session()
+
+    # Act
+    response = session.get(f"http://127.0.0.1:{server.server_port}/releases")
+
+    # Assert
+    assert response.status_code == 503
+    assert server.requests == 2
+
+
+def test_session_reuses_connection_across_requests(server):
+    # Arrange
+    session = sauhcl.create_session()
+    url = f"http://127.0.0.1:{server.server_port}/releases"
+
+    # Act
+    for _ in range(3):
+        session.get(url)
+
+    # Assert
+    assert server.requests == 3
+    assert len(server.connections) == 1
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_CONNECT_TIMEOUT", 3)
+@patch("subvortex.auto_upgrader.src.constants.SV_HTTP_READ_TIMEOUT", 7)
+def test_get_timeout_returns_connect_and_read_timeouts():
+    # Act
+    timeout = sauhcl.get_timeout()
+
+    # Assert
+    assert timeout == (3, 7)
@@ -15,6 +15,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 import os
+import time
+import asyncio
 import pytest
 import shutil
 import tempfile
@@ -22,15 +24,20 @@ from unittest import mock
 from unittest.mock import patch
 
 import subvortex.auto_upgrader.src.constants as sauc
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.path as saup
+import subvortex.auto_upgrader.src.trash as sautr
+import subvortex.auto_upgrader.src.blue_green as saubg
+import subvortex.auto_upgrader.src.resolvers.dependency_resolver as saudr
 from subvortex.auto_upgrader.src.orchestrator import Orchestrator
 from subvortex.auto_upgrader.src.service import Service
 
 
 @pytest.fixture(autouse=True)
 def orchestrator():
-    # --- Patch subprocess.run ---
+    # --- Patch Runner.run ---
     subprocess_patcher = patch(
-        "subvortex.auto_upgrader.src.orchestrator.subprocess.run"
+        "subvortex.auto_upgrader.src.runner.Runner.run"
     )
     mock_subprocess_run = subprocess_patcher.start()
 
@@ -60,9 +67,9 @@ def orchestrator():
     orch.check_version_assets_exists = mock.MagicMock()
 
     # GitHub and metadata mocking
-    orch.github.get_local_version = mock.MagicMock()
-    orch.github.get_latest_version = mock.MagicMock()
-    orch.github.download_and_unzip_assets = mock.MagicMock()
+    orch.github.get_local_version = mock.AsyncMock()
+    orch.github.get_latest_version = mock.AsyncMock()
+    orch.github.download_and_unzip_assets = mock.AsyncMock()
     orch.metadata_resolver.list_directory = mock.MagicMock()
     orch.metadata_resolver.get_metadata = mock.MagicMock(
         return_value={
@@ -82,17 +89,18 @@ def orchestrator():
     orch._load_current_services = mock.MagicMock()
     orch._load_latest_services = mock.MagicMock()
     orch._copy_env_files = mock.MagicMock()
-    # orch._run = mock.MagicMock()
+    # orch._run = mock.AsyncMock()
 
     # Removal
     orch._remove_assets = mock.MagicMock()
-    orch._pull_assets = mock.MagicMock()
+    orch._pull_assets = mock.AsyncMock()
 
     yield orch  # <- yield the orchestrator instance for the tests
 
     # --- Stop patches after the test ---
     subprocess_patcher.stop()
     exists_patcher.stop()
+    makedirs_patcher.stop()
 
 
 @pytest.fixture(autouse=True)
@@ -181,10 +189,10 @@ def mock_all_steps(orch):
 
 
 def mock_all_scripts(orch):
-    orch._execute_setup = mock.MagicMock()
-    orch._execute_start = mock.MagicMock()
-    orch._execute_stop = mock.MagicMock()
-    orch._execute_teardown = mock.MagicMock()
+    orch._execute_setup = mock.AsyncMock()
+    orch._execute_start = mock.AsyncMock()
+    orch._execute_stop = mock.AsyncMock()
+    orch._execute_teardown = mock.AsyncMock()
 
 
 def assert_run_calls(
@@ -453,8 +461,8 @@ def test_switch_services_only_for_needed_updates(monkeypatch):
 
     # Patch dependency resolver
     monkeypatch.setattr(
-        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyResolver",
-        lambda services: mock.Mock(resolve_order=lambda: services),
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        lambda services: mock.Mock(order=services),
     )
 
     # Act
@@ -477,12 +485,8 @@ def test_rollback_switch_services(monkeypatch):
 
     # Patch dependency resolver
     monkeypatch.setattr(
-        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyResolver",
-        lambda services: mock.Mock(
-            resolve_order=lambda reverse=False: (
-                services[::-1] if reverse else services
-            )
-        ),
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        lambda services: mock.Mock(order=services, reverse_order=services[::-1]),
     )
 
     # Act
@@ -508,8 +512,8 @@ def test_switch_services_dependency_order(monkeypatch):
 
     # Simulate dependency order: A must come before B
     monkeypatch.setattr(
-        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyResolver",
-        lambda services: mock.Mock(resolve_order=lambda: [svc_a, svc_b]),
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        lambda services: mock.Mock(order=[svc_a, svc_b]),
     )
 
     # Act
@@ -530,10 +534,8 @@ def test_rollback_switch_skips_services_without_needs_update(monkeypatch):
     orch.services = [service]
 
     monkeypatch.setattr(
-        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyResolver",
-        lambda services: mock.Mock(
-            resolve_order=lambda reverse=False: services[::-1] if reverse else services
-        ),
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        lambda services: mock.Mock(order=services, reverse_order=services[::-1]),
     )
 
     # Act
@@ -560,10 +562,8 @@ def test_rollback_switch_skips_none_rollback_version(monkeypatch, caplog):
 
     # Patch dependency resolver
     monkeypatch.setattr(
-        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyResolver",
-        lambda services: mock.Mock(
-            resolve_order=lambda reverse=False: services[::-1] if reverse else services
-        ),
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        lambda services: mock.Mock(order=services, reverse_order=services[::-1]),
     )
 
     # Enable log capturing
@@ -581,3 +581,1040 @@ def test_rollback_switch_skips_none_rollback_version(monkeypatch, caplog):
         "Skipping rollback for redis (no rollback version available)" in message
         for message in caplog.messages
     )
+
+
+@pytest.mark.asyncio
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    return_value=True,
+)
+async def test_pull_latest_assets_uses_prefetched_assets(
+    mock_is_version_pulled, orchestrator
+):
+    # Arrange
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.prefetcher.prefetched["1.0.1"] = 0
+
+    # Action
+    await Orchestrator._pull_latest_assets(orchestrator)
+
+    # Assert
+    orchestrator._pull_assets.assert_not_called()
+    # Only checked by the prefetcher
+    mock_is_version_pulled.assert_called_once_with(version="1.0.1")
+    assert orchestrator.pulled_versions == ["1.0.1"]
+
+
+@pytest.mark.asyncio
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    side_effect=[False, True],
+)
+async def test_pull_latest_assets_pulls_when_not_prefetched(
+    mock_is_version_pulled, orchestrator
+):
+    # Arrange
+    orchestrator.latest_version = "1.0.1"
+
+    # Action
+    await Orchestrator._pull_latest_assets(orchestrator)
+
+    # Assert
+    orchestrator._pull_assets.assert_called_once_with(version="1.0.1")
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_DEDUP", True)
+@patch("subvortex.auto_upgrader.src.orchestrator.saudd.break_links")
+async def test_execute_setup_breaks_links_before_running_the_script(
+    mock_break_links, orchestrator
+):
+    # Arrange
+    service = create_service("1.0.1")
+    mock_break_links.side_effect = (
+        lambda *args: orchestrator.mock_subprocess_run.assert_not_called()
+    )
+
+    # Action
+    await orchestrator._execute_setup(service=service, version="1.0.1")
+
+    # Assert
+    mock_break_links.assert_called_once_with(
+        saup.get_service_directory(service=service, version="1.0.1")
+    )
+    orchestrator.mock_subprocess_run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_DEDUP", False)
+@patch("subvortex.auto_upgrader.src.constants.SV_DELTA_UPDATE", True)
+@patch("subvortex.auto_upgrader.src.constants.SV_DEDUP_WRITABLE_PATHS", ["setup.cfg"])
+async def test_execute_setup_only_breaks_links_of_the_files_it_writes(
+    tmp_path, orchestrator
+):
+    # Arrange
+    redis, metagraph, neuron = create_dependent_services("1.0.1")
+
+    def link(relpath: str):
+        source = tmp_path / "subvortex-1.0.0" / relpath
+        target = tmp_path / "subvortex-1.0.1" / relpath
+        for path in [source, target]:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("1.0.0")
+        os.link(source, target)
+        return target
+
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        service_dir = saup.get_service_directory(service=neuron, version="1.0.1")
+        service_file = link(
+            os.path.relpath(f"{service_dir}/main.py", tmp_path / "subvortex-1.0.1")
+        )
+        writable_file = link("setup.cfg")
+        shared_file = link("pyproject.toml")
+        other_service_file = link("subvortex/core/utils.py")
+
+        # Action
+        await asyncio.gather(
+            orchestrator._execute_setup(service=neuron, version="1.0.1"),
+            orchestrator._execute_setup(service=neuron, version="1.0.1"),
+        )
+
+    # Assert
+    assert os.stat(service_file).st_nlink == 1
+    assert os.stat(writable_file).st_nlink == 1
+    assert os.stat(shared_file).st_nlink == 2
+    assert os.stat(other_service_file).st_nlink == 2
+    assert orchestrator.mock_subprocess_run.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_DEDUP", True)
+@patch("subvortex.auto_upgrader.src.orchestrator.saudd.break_links")
+async def test_execute_start_does_not_break_links(mock_break_links, orchestrator):
+    # Arrange
+    service = create_service("1.0.1")
+
+    # Action
+    await orchestrator._execute_start(service=service, version="1.0.1")
+
+    # Assert
+    mock_break_links.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pull_current_assets_completes_assets_already_pulled(orchestrator):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.github.complete_assets = mock.AsyncMock(return_value=[])
+
+    # Action
+    await Orchestrator._pull_current_assets(orchestrator)
+
+    # Assert
+    orchestrator.github.complete_assets.assert_awaited_once_with(
+        version="1.0.0", role=sauc.SV_EXECUTION_ROLE
+    )
+    orchestrator._pull_assets.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    side_effect=[False, True],
+)
+async def test_pull_assets_restores_version_from_trash(
+    mock_is_version_pulled, orchestrator
+):
+    # Arrange
+    orchestrator.trash.restore = mock.MagicMock(return_value=True)
+
+    # Action
+    await Orchestrator._pull_assets(orchestrator, version="1.0.0")
+
+    # Assert
+    orchestrator.trash.restore.assert_called_once_with(
+        path=saup.get_version_directory(version="1.0.0")
+    )
+    orchestrator.github.download_and_unzip_assets.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    return_value=False,
+)
+async def test_pull_assets_downloads_version_not_in_trash(
+    mock_is_version_pulled, orchestrator
+):
+    # Arrange
+    orchestrator.trash.restore = mock.MagicMock(return_value=False)
+
+    # Action
+    await Orchestrator._pull_assets(orchestrator, version="1.0.0")
+
+    # Assert
+    orchestrator.github.download_and_unzip_assets.assert_awaited_once_with(
+        version="1.0.0", role=sauc.SV_EXECUTION_ROLE
+    )
+
+
+def test_remove_assets_moves_version_into_trash(orchestrator):
+    # Arrange
+    orchestrator.trash.put = mock.MagicMock()
+
+    # Action
+    Orchestrator._remove_assets(orchestrator, version="1.0.0")
+
+    # Assert
+    orchestrator.trash.put.assert_called_once_with(
+        path=saup.get_version_directory(version="1.0.0")
+    )
+
+
+@pytest.mark.asyncio
+async def test_pull_assets_uses_version_kept_warm(orchestrator):
+    # Arrange
+    orchestrator.trash.restore = mock.MagicMock()
+
+    # Action
+    await Orchestrator._pull_assets(orchestrator, version="1.0.0")
+
+    # Assert
+    orchestrator.trash.restore.assert_not_called()
+    orchestrator.github.download_and_unzip_assets.assert_not_called()
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 2)
+def test_remove_services_applies_retention_policy(orchestrator):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.latest_services = [create_service("1.0.1")]
+    orchestrator.retention.apply = mock.MagicMock(return_value=[])
+
+    # Action
+    orchestrator._remove_services()
+
+    # Assert
+    orchestrator.retention.apply.assert_called_once_with(protected=["1.0.1"])
+    orchestrator._remove_assets.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_SOAK_PERIOD", 600)
+async def test_rollback_during_soak_period_performs_no_http_request(
+    tmp_path, orchestrator
+):
+    # Arrange
+    orchestrator.mock_exists.side_effect = os.path.lexists
+    del orchestrator._pull_assets
+    del orchestrator._remove_assets
+    del orchestrator.github.download_and_unzip_assets
+    orchestrator.trash = sautr.Trash(directory=str(tmp_path / ".trash"))
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+    (tmp_path / "subvortex-1.0.0").mkdir()
+    (tmp_path / "subvortex-1.0.0" / ".complete").touch()
+
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        orchestrator.rollback_steps.append(
+            ("Remove previous version", orchestrator._rollback_remove_services)
+        )
+        orchestrator._remove_services()
+
+        # Action
+        with patch("requests.Session.send") as mock_send:
+            await orchestrator.run_rollback_plan()
+
+    # Assert
+    mock_send.assert_not_called()
+    assert not os.path.exists(tmp_path / ".trash")
+    assert os.path.exists(tmp_path / "subvortex-1.0.0" / ".complete")
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_SOAK_PERIOD", 600)
+def test_remove_services_keeps_previous_version_during_soak_period(
+    tmp_path, orchestrator
+):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        orchestrator._remove_services()
+        orchestrator.current_version = "1.0.1"
+        orchestrator._remove_soaked_versions()
+
+    # Assert
+    assert list(orchestrator.soaking_versions) == ["1.0.0"]
+    orchestrator._remove_assets.assert_not_called()
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_SOAK_PERIOD", 600)
+def test_soak_period_survives_a_restart(tmp_path, orchestrator):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        orchestrator._remove_services()
+
+        # Action
+        restarted = Orchestrator()
+        restarted._remove_assets = mock.MagicMock()
+        restarted.current_version = "1.0.1"
+        restarted.latest_version = "1.0.1"
+        restarted._remove_soaked_versions()
+        kept = dict(restarted.soaking_versions)
+
+        restarted.soaking_versions["1.0.0"] = 0
+        restarted._remove_soaked_versions()
+        removed = Orchestrator().soaking_versions
+
+    # Assert
+    assert list(kept) == ["1.0.0"]
+    assert kept["1.0.0"] > time.time() + 500
+    assert removed == {}
+    restarted._remove_assets.assert_called_once_with(version="1.0.0")
+    assert not (tmp_path / ".soaking.json").exists()
+
+
+def test_remove_soaked_versions_removes_version_once_soak_period_is_over(
+    orchestrator,
+):
+    # Arrange
+    orchestrator.current_version = "1.0.1"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.soaking_versions = {"1.0.0": 0}
+
+    # Action
+    orchestrator._remove_soaked_versions()
+
+    # Assert
+    assert orchestrator.soaking_versions == {}
+    orchestrator._remove_assets.assert_called_once_with(version="1.0.0")
+
+
+async def create_soaking_services(orchestrator, port: int):
+    orchestrator.current_version = "1.0.1"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.soaking_versions = {"1.0.0": time.time() + 600}
+    services = {
+        "1.0.0": create_dependent_services("1.0.0"),
+        "1.0.1": create_dependent_services("1.0.1"),
+    }
+    for service in services["1.0.0"]:
+        service.switch_to_version = mock.MagicMock()
+    services["1.0.1"][0].readiness = [{"type": "tcp", "port": port}]
+    orchestrator._load_services = mock.MagicMock(
+        side_effect=lambda version, versions: services[version]
+    )
+
+    events = []
+
+    async def start(service, version, instance=None):
+        events.append(("start", service.name, version))
+
+    async def stop(service, version, instance=None):
+        events.append(("stop", service.name, version))
+
+    orchestrator._execute_start = mock.AsyncMock(side_effect=start)
+    orchestrator._execute_stop = mock.AsyncMock(side_effect=stop)
+
+    return services, events
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+@patch("subvortex.auto_upgrader.src.constants.SV_SOAK_HEALTH_TIMEOUT", 0.2)
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    return_value=True,
+)
+async def test_unhealthy_services_roll_back_to_the_soaking_version(
+    mock_is_version_pulled, tmp_path, orchestrator
+):
+    # Arrange
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+    services, events = await create_soaking_services(orchestrator, port=port)
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        await orchestrator._check_soaking_versions()
+
+    # Assert
+    assert sorted(events[:2]) == [
+        ("stop", "metagraph", "1.0.1"),
+        ("stop", "neuron", "1.0.1"),
+    ]
+    assert events[2:4] == [("stop", "redis", "1.0.1"), ("start", "redis", "1.0.0")]
+    assert sorted(events[4:]) == [
+        ("start", "metagraph", "1.0.0"),
+        ("start", "neuron", "1.0.0"),
+    ]
+    for service in services["1.0.0"]:
+        service.switch_to_version.assert_called_once_with(version="1.0.0")
+    assert orchestrator.current_version == "1.0.0"
+    assert orchestrator.soaking_versions == {}
+    orchestrator._remove_assets.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+@patch(
+    "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+    return_value=True,
+)
+async def test_healthy_services_keep_soaking(mock_is_version_pulled, orchestrator):
+    # Arrange
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    services, events = await create_soaking_services(orchestrator, port=port)
+
+    # Action
+    await orchestrator._check_soaking_versions()
+    server.close()
+    await server.wait_closed()
+
+    # Assert
+    assert events == []
+    assert orchestrator.current_version == "1.0.1"
+    assert list(orchestrator.soaking_versions) == ["1.0.0"]
+
+
+def test_remove_soaked_versions_keeps_version_in_use_after_rollback(orchestrator):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.soaking_versions = {"1.0.0": 0}
+
+    # Action
+    orchestrator._remove_soaked_versions()
+
+    # Assert
+    assert orchestrator.soaking_versions == {}
+    orchestrator._remove_assets.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
+@patch("subvortex.auto_upgrader.src.constants.SV_PULL_CONCURRENCY", 2)
+async def test_pull_latest_assets_pulls_versions_concurrently(orchestrator):
+    # Arrange
+    orchestrator.github.latest_versions = {
+        "version": "1.0.3",
+        "miner.neuron": {"version": "1.0.1"},
+        "validator.redis": {"version": "1.0.2"},
+    }
+    pulled = set()
+    running, max_running = 0, 0
+
+    async def pull_assets(version):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        pulled.add(version)
+
+    orchestrator._pull_assets.side_effect = pull_assets
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+        side_effect=lambda version: version in pulled,
+    ):
+        await Orchestrator._pull_latest_assets(orchestrator)
+
+    # Assert
+    assert pulled == {"1.0.1", "1.0.2", "1.0.3"}
+    assert max_running == 2
+    assert sorted(orchestrator.pulled_versions) == ["1.0.1", "1.0.2", "1.0.3"]
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
+async def test_pull_latest_assets_skips_versions_already_pulled(orchestrator):
+    # Arrange
+    orchestrator.github.latest_versions = {
+        "miner.neuron": {"version": "1.0.1"},
+        "validator.redis": {"version": "1.0.2"},
+    }
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+        side_effect=lambda version: version == "1.0.1"
+        or orchestrator._pull_assets.called,
+    ):
+        await Orchestrator._pull_latest_assets(orchestrator)
+
+    # Assert
+    orchestrator._pull_assets.assert_called_once_with(version="1.0.2")
+    assert orchestrator.pulled_versions == ["1.0.2"]
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
+async def test_pull_latest_assets_reports_every_failed_version(orchestrator):
+    # Arrange
+    orchestrator.github.latest_versions = {
+        "miner.neuron": {"version": "1.0.1"},
+        "validator.neuron": {"version": "1.0.2"},
+        "validator.redis": {"version": "1.0.3"},
+    }
+    pulled = set()
+
+    async def pull_assets(version):
+        if version != "1.0.2":
+            raise ConnectionError(f"{version} unreachable")
+        pulled.add(version)
+
+    orchestrator._pull_assets.side_effect = pull_assets
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.orchestrator.saup.is_version_pulled",
+        side_effect=lambda version: version in pulled,
+    ):
+        with pytest.raises(saue.AssetsPullError) as e:
+            await Orchestrator._pull_latest_assets(orchestrator)
+
+    # Assert
+    assert "1.0.1 unreachable" in str(e.value)
+    assert "1.0.3 unreachable" in str(e.value)
+    assert pulled == {"1.0.2"}
+
+
+@pytest.mark.asyncio
+async def test_rollback_keeps_unmarked_version_directory_the_pull_did_not_replace(
+    tmp_path, orchestrator
+):
+    # Arrange
+    orchestrator.mock_exists.side_effect = os.path.lexists
+    del orchestrator._pull_assets
+    del orchestrator._remove_assets
+    orchestrator.trash = sautr.Trash(directory=str(tmp_path / ".trash"))
+    orchestrator.github.download_and_unzip_assets.side_effect = ConnectionError(
+        "1.0.1 unreachable"
+    )
+    (tmp_path / "subvortex-1.0.1").mkdir()
+    (tmp_path / "subvortex-1.0.1" / "notes.txt").write_text("kept")
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        with pytest.raises(ConnectionError):
+            await orchestrator._pull_latest_version_assets(version="1.0.1")
+        orchestrator._rollback_pull_latest_assets()
+
+    # Assert
+    assert orchestrator.pulled_versions == []
+    assert (tmp_path / "subvortex-1.0.1" / "notes.txt").read_text() == "kept"
+
+
+def test_rollback_pull_latest_assets_removes_only_versions_pulled(orchestrator):
+    # Arrange
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.pulled_versions = ["1.0.2"]
+
+    # Action
+    Orchestrator._rollback_pull_latest_assets(orchestrator)
+
+    # Assert
+    orchestrator._remove_assets.assert_called_once_with(version="1.0.2")
+
+
+@pytest.mark.asyncio
+async def test_run_plan_discovers_versions_and_pulls_assets_concurrently(
+    orchestrator,
+):
+    # Arrange
+    events = []
+
+    def make_step(name, delay, **attributes):
+        async def step():
+            events.append(f"start {name}")
+            await asyncio.sleep(delay)
+            for key, value in attributes.items():
+                setattr(orchestrator, key, value)
+            events.append(f"end {name}")
+
+        return step
+
+    orchestrator._get_current_version = make_step(
+        "current", 0.05, current_version="1.0.0"
+    )
+    orchestrator._get_latest_version = make_step(
+        "latest", 0.1, latest_version="1.0.1"
+    )
+    orchestrator._pull_current_assets = make_step("pull current", 0.1)
+    orchestrator._pull_latest_assets = make_step("pull latest", 0.01)
+    orchestrator._is_already_pulled_current_version = mock.MagicMock(
+        return_value=False
+    )
+    orchestrator._load_current_services = mock.MagicMock(
+        side_effect=RuntimeError("stop")
+    )
+
+    # Action
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_plan()
+
+    # Assert
+    assert events.index("start latest") < events.index("end current")
+    assert events.index("start pull current") < events.index("end latest")
+    assert events.index("start pull latest") > events.index("end latest")
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "container")
+async def test_run_plan_gets_latest_version_after_local_images_in_container(
+    orchestrator,
+):
+    # Arrange
+    events = []
+
+    def make_step(name, delay, **attributes):
+        async def step():
+            events.append(f"start {name}")
+            await asyncio.sleep(delay)
+            for key, value in attributes.items():
+                setattr(orchestrator, key, value)
+            events.append(f"end {name}")
+
+        return step
+
+    orchestrator._get_current_version = make_step(
+        "current", 0.05, current_version="1.0.0"
+    )
+    orchestrator._get_latest_version = make_step(
+        "latest", 0.01, latest_version="1.0.1"
+    )
+    orchestrator._pull_current_assets = make_step("pull current", 0.01)
+    orchestrator._pull_latest_assets = make_step("pull latest", 0.01)
+    orchestrator._is_already_pulled_current_version = mock.MagicMock(
+        return_value=False
+    )
+    orchestrator._load_current_services = mock.MagicMock(
+        side_effect=RuntimeError("stop")
+    )
+
+    # Action
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_plan()
+
+    # Assert
+    assert events.index("start latest") > events.index("end current")
+
+
+@pytest.mark.asyncio
+async def test_run_plan_registers_rollback_of_steps_in_flight_when_one_fails(
+    orchestrator,
+):
+    # Arrange
+    async def get_current_version():
+        orchestrator.current_version = "1.0.0"
+
+    async def get_latest_version():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("GitHub unreachable")
+
+    async def pull_current_assets():
+        await asyncio.sleep(0.05)
+
+    orchestrator._get_current_version = get_current_version
+    orchestrator._get_latest_version = get_latest_version
+    orchestrator._pull_current_assets = mock.AsyncMock(side_effect=pull_current_assets)
+    orchestrator._is_already_pulled_current_version = mock.MagicMock(
+        return_value=False
+    )
+
+    # Action
+    with pytest.raises(ConnectionError):
+        await orchestrator.run_plan()
+
+    # Assert
+    orchestrator._pull_current_assets.assert_awaited_once()
+    orchestrator._pull_latest_assets.assert_not_called()
+    assert [x for x, _ in orchestrator.rollback_steps] == [
+        "Get current version",
+        "Get latest version",
+        "Pull current version",
+    ]
+
+
+def create_dependent_services(version: str):
+    redis = create_service(version, id="subvortex-redis", name="redis")
+    metagraph = create_service(version, id="subvortex-metagraph", name="metagraph")
+    neuron = create_service(version, id="subvortex-neuron", name="neuron")
+    metagraph.depends_on = [redis.id]
+    neuron.depends_on = [redis.id]
+
+    for service in [redis, metagraph, neuron]:
+        service.needs_update = True
+
+    return [redis, metagraph, neuron]
+
+
+def record_executions(events):
+    async def execute(service, version):
+        events.append(f"start {service.name}")
+        await asyncio.sleep(0.05)
+        events.append(f"end {service.name}")
+
+    return execute
+
+
+@pytest.mark.asyncio
+async def test_start_latest_services_runs_independent_services_concurrently(
+    orchestrator,
+):
+    # Arrange
+    events = []
+    orchestrator.services = create_dependent_services("1.0.1")
+    orchestrator._execute_start = mock.AsyncMock(side_effect=record_executions(events))
+
+    # Action
+    await orchestrator._start_latest_services()
+
+    # Assert
+    assert events[:2] == ["start redis", "end redis"]
+    assert sorted(events[2:4]) == ["start metagraph", "start neuron"]
+    assert sorted(orchestrator.completed_services["start"]) == [
+        "subvortex-metagraph",
+        "subvortex-neuron",
+        "subvortex-redis",
+    ]
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_SERVICE_CONCURRENCY", 1)
+async def test_start_latest_services_respects_concurrency_cap(orchestrator):
+    # Arrange
+    events = []
+    orchestrator.services = create_dependent_services("1.0.1")
+    orchestrator._execute_start = mock.AsyncMock(side_effect=record_executions(events))
+
+    # Action
+    await orchestrator._start_latest_services()
+
+    # Assert
+    assert [x.split(" ")[0] for x in events] == ["start", "end"] * 3
+
+
+@pytest.mark.asyncio
+async def test_rollback_stop_current_services_restarts_only_stopped_services(
+    orchestrator,
+):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.current_services = create_dependent_services("1.0.0")
+    orchestrator.services = create_dependent_services("1.0.1")
+
+    async def stop(service, version):
+        if service.name == "neuron":
+            await asyncio.sleep(0.01)
+            raise saue.MissingFileError(file_path="neuron_process_stop.sh")
+
+    orchestrator._execute_stop = mock.AsyncMock(side_effect=stop)
+    orchestrator._execute_start = mock.AsyncMock()
+
+    # Action
+    with pytest.raises(saue.MissingFileError):
+        await orchestrator._stop_current_services()
+    await orchestrator._rollback_stop_current_services()
+
+    # Assert
+    assert orchestrator.completed_services["stop"] == ["subvortex-metagraph"]
+    orchestrator._execute_start.assert_called_once_with(
+        service=orchestrator.current_services[1], version="1.0.0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_dependency_plan_is_shared_by_the_steps(orchestrator):
+    # Arrange
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.current_services = create_dependent_services("1.0.0")
+    orchestrator.services = create_dependent_services("1.0.1")
+    for service in orchestrator.services:
+        service.switch_to_version = mock.MagicMock()
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.orchestrator.saudr.DependencyPlan",
+        wraps=saudr.DependencyPlan,
+    ) as mock_plan:
+        await orchestrator._stop_current_services()
+        orchestrator._switch_services()
+        await orchestrator._start_latest_services()
+        await orchestrator._rollback_start_latest_services()
+        orchestrator._rollback_switch_services()
+        await orchestrator._rollback_stop_current_services()
+
+    # Assert
+    mock_plan.assert_called_once_with(services=orchestrator.services)
+
+
+def test_dependency_plan_is_computed_again_when_services_change(orchestrator):
+    # Arrange
+    orchestrator.services = create_dependent_services("1.0.1")
+    plan = orchestrator._get_dependency_plan(services=orchestrator.services)
+
+    # Action
+    orchestrator.services[1].depends_on = []
+    new_plan = orchestrator._get_dependency_plan(services=orchestrator.services)
+
+    # Assert
+    assert new_plan is not plan
+    assert [len(x) for x in new_plan.levels] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_start_latest_services_starts_dependent_once_its_dependencies_are_ready(
+    orchestrator,
+):
+    # Arrange
+    events = []
+    redis, metagraph, neuron = create_dependent_services("1.0.1")
+    metagraph.depends_on = []
+    neuron.depends_on = [redis.id]
+    orchestrator.services = [redis, metagraph, neuron]
+
+    async def start(service, version):
+        events.append(f"start {service.name}")
+        await asyncio.sleep(0.1 if service.name == "metagraph" else 0.01)
+        events.append(f"end {service.name}")
+
+    orchestrator._execute_start = mock.AsyncMock(side_effect=start)
+
+    # Action
+    await orchestrator._start_latest_services()
+
+    # Assert
+    assert events.index("start neuron") < events.index("end metagraph")
+
+
+@pytest.mark.asyncio
+async def test_execute_start_fails_when_service_is_not_ready(orchestrator):
+    # Arrange
+    service = create_service("1.0.1")
+    service.readiness = [{"type": "process", "pattern": "no-such-process-[0-9]{32}"}]
+    service.readiness_timeout = 0.2
+
+    # Action
+    with pytest.raises(saue.ServiceNotReadyError):
+        await orchestrator._execute_start(service=service, version="1.0.1")
+
+    # Assert
+    orchestrator.mock_subprocess_run.assert_awaited_once()
+
+
+def create_blue_green_services(orchestrator, blue_green=True):
+    orchestrator.current_version = "1.0.0"
+    orchestrator.latest_version = "1.0.1"
+    orchestrator.current_services = create_dependent_services("1.0.0")
+    orchestrator.services = create_dependent_services("1.0.1")
+    for service in orchestrator.services:
+        service.upgrade_type = "upgrade"
+        service.blue_green = blue_green
+        service.readiness = [{"type": "process", "pattern": "{instance}"}]
+        service.switch_to_version = mock.MagicMock()
+
+    return orchestrator.services
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_BLUE_GREEN", True)
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+async def test_blue_green_stops_previous_instance_once_new_one_is_ready(
+    tmp_path, orchestrator
+):
+    # Arrange
+    redis, metagraph, neuron = create_blue_green_services(orchestrator)
+    events = []
+
+    async def start(service, version, instance=None):
+        events.append(("start", service.name, version, instance))
+
+    async def stop(service, version, instance=None):
+        events.append(("stop", service.name, version, instance))
+
+    orchestrator._execute_start = mock.AsyncMock(side_effect=start)
+    orchestrator._execute_stop = mock.AsyncMock(side_effect=stop)
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        await orchestrator._start_next_instances()
+        await orchestrator._stop_current_services()
+        orchestrator._switch_services()
+        await orchestrator._start_latest_services()
+        await orchestrator._stop_previous_instances()
+        instance = saubg.get_instance(neuron.id)
+
+    # Assert
+    assert events[:3] == [
+        ("start", "redis", "1.0.1", "green"),
+        ("start", "metagraph", "1.0.1", "green"),
+        ("start", "neuron", "1.0.1", "green"),
+    ]
+    assert sorted(events[3:5]) == [
+        ("stop", "metagraph", "1.0.0", "blue"),
+        ("stop", "neuron", "1.0.0", "blue"),
+    ]
+    assert events[5:] == [("stop", "redis", "1.0.0", "blue")]
+    neuron.switch_to_version.assert_called_once_with(version="1.0.1")
+    assert instance == "green"
+    assert orchestrator.unavailability == {
+        redis.id: 0.0,
+        metagraph.id: 0.0,
+        neuron.id: 0.0,
+    }
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_BLUE_GREEN", True)
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+async def test_blue_green_rollback_keeps_previous_instance(tmp_path, orchestrator):
+    # Arrange
+    redis, metagraph, neuron = create_blue_green_services(orchestrator)
+
+    async def start(service, version, instance=None):
+        if service.name == "neuron":
+            raise saue.ServiceNotReadyError(service="neuron", details="not ready")
+
+    orchestrator._execute_start = mock.AsyncMock(side_effect=start)
+    orchestrator._execute_stop = mock.AsyncMock()
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        with pytest.raises(saue.ServiceNotReadyError):
+            await orchestrator._start_next_instances()
+        await orchestrator._rollback_start_next_instances()
+        instance = saubg.get_instance(neuron.id)
+
+    # Assert
+    stopped = [
+        (x.kwargs["service"].name, x.kwargs["version"], x.kwargs["instance"])
+        for x in orchestrator._execute_stop.call_args_list
+    ]
+    assert stopped == [
+        ("neuron", "1.0.1", "green"),
+        ("metagraph", "1.0.1", "green"),
+        ("redis", "1.0.1", "green"),
+    ]
+    assert instance == "blue"
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_BLUE_GREEN", True)
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+def test_blue_green_excludes_services_depending_on_one_restarted(orchestrator):
+    # Arrange
+    redis, metagraph, neuron = create_blue_green_services(orchestrator)
+    redis.blue_green = False
+
+    # Action
+    services = orchestrator._get_blue_green_services()
+
+    # Assert
+    assert services == []
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_BLUE_GREEN", True)
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+def test_blue_green_excludes_services_whose_probes_ignore_the_instance(orchestrator):
+    # Arrange
+    redis, metagraph, neuron = create_blue_green_services(orchestrator)
+    neuron.readiness = [{"type": "tcp", "port": 8091}]
+
+    # Act
+    result = orchestrator._get_blue_green_services()
+
+    # Assert
+    assert result == [redis, metagraph]
+
+
+@pytest.mark.asyncio
+async def test_execute_start_probes_the_instance_started(orchestrator):
+    # Arrange
+    service = create_service("1.0.1")
+    service.blue_green = True
+    service.readiness = [{"type": "process", "pattern": "neuron-{instance}"}]
+    orchestrator._run = mock.AsyncMock()
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.orchestrator.saurd.Readiness"
+    ) as mock_readiness:
+        mock_readiness.return_value.wait = mock.AsyncMock()
+        await orchestrator._execute_start(service, "1.0.1", instance="green")
+
+    # Assert
+    mock_readiness.assert_called_once_with(service=service, instance="green")
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_BLUE_GREEN", False)
+def test_blue_green_is_opt_in(orchestrator):
+    # Arrange
+    create_blue_green_services(orchestrator)
+
+    # Action
+    services = orchestrator._get_blue_green_services()
+
+    # Assert
+    assert services == []
+
+
+@pytest.mark.asyncio
+async def test_unavailability_is_measured_from_stop_to_ready(orchestrator):
+    # Arrange
+    redis, metagraph, neuron = create_blue_green_services(
+        orchestrator, blue_green=False
+    )
+
+    async def start(service, version):
+        await asyncio.sleep(0.05)
+
+    orchestrator._execute_start = mock.AsyncMock(side_effect=start)
+    orchestrator._execute_stop = mock.AsyncMock()
+
+    # Action
+    await orchestrator._stop_current_services()
+    await orchestrator._start_latest_services()
+
+    # Assert
+    assert orchestrator.unavailability[redis.id] >= 0.05
+    assert orchestrator.unavailability[neuron.id] >= 0.1
+
+
+def test_unavailability_is_measured_until_the_new_instance_was_ready(orchestrator):
+    # Arrange
+    service = create_service("1.0.1")
+    orchestrator.stopped_at[service.id] = 10.0
+
+    # Action
+    orchestrator._record_unavailability(service=service, ready_at=10.25)
+
+    # Assert
+    assert orchestrator.unavailability[service.id] == 0.25
+    assert service.id not in orchestrator.stopped_at
+
+
+@pytest.mark.asyncio
+async def test_run_starts_instance_from_its_version_directory(orchestrator):
+    # Arrange
+    service = create_service("1.0.1")
+    service.blue_green = True
+
+    # Action
+    await orchestrator._execute_start(service=service, version="1.0.1", instance="green")
+
+    # Assert
+    env = orchestrator.mock_subprocess_run.call_args.kwargs["env"]
+    assert env["SUBVORTEX_INSTANCE"] == "green"
+    assert env["SUBVORTEX_WORKING_DIR"] == saup.get_version_directory("1.0.1")
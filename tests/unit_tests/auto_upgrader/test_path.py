@@ -52,6 +52,28 @@ def test_get_version_directory():
     assert saup.get_version_directory(version) == expected
 
 
+def test_is_version_pulled_requires_complete_marker(tmp_path):
+    with mock.patch.object(sauc, "SV_ASSET_DIR", str(tmp_path)):
+        assert not saup.is_version_pulled("v3.0.0")
+
+        os.makedirs(tmp_path / "subvortex-3.0.0")
+        assert not saup.is_version_pulled("v3.0.0")
+
+        (tmp_path / "subvortex-3.0.0" / sauc.SV_ASSET_COMPLETE_MARKER).touch()
+        assert saup.is_version_pulled("v3.0.0")
+
+
+def test_is_version_pulled_accepts_installed_version_without_marker(tmp_path):
+    os.makedirs(tmp_path / "subvortex-3.0.0")
+    os.symlink(tmp_path / "subvortex-3.0.0", tmp_path / "subvortex")
+
+    with mock.patch.object(sauc, "SV_ASSET_DIR", str(tmp_path)), mock.patch.object(
+        sauc, "SV_EXECUTION_DIR", str(tmp_path / "subvortex")
+    ):
+        assert saup.is_version_pulled("v3.0.0")
+        assert not saup.is_version_pulled("v3.0.1")
+
+
 def test_get_role_directory():
     version = "v3.0.0-alpha.1"
     expected = "/var/tmp/subvortex/subvortex-3.0.0a1/subvortex/miner"
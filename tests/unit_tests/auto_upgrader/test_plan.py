@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.plan as saupl
+
+
+def create_step(id, depends_on=None, action=None):
+    return saupl.Step(
+        id=id,
+        description=f"Step {id}",
+        action=action or (lambda: None),
+        depends_on=depends_on,
+    )
+
+
+def create_executor(events, delays=None, failures=None):
+    async def execute(step):
+        events.append(f"start {step.id}")
+        await asyncio.sleep((delays or {}).get(step.id, 0))
+        if step.id in (failures or []):
+            raise RuntimeError(f"{step.id} failed")
+        events.append(f"end {step.id}")
+
+    return execute
+
+
+def test_order_follows_dependencies_and_declaration():
+    # Arrange
+    plan = saupl.Plan(
+        steps=[
+            create_step("c", depends_on=["a", "b"]),
+            create_step("a"),
+            create_step("b", depends_on=["a"]),
+            create_step("d"),
+        ]
+    )
+
+    # Act
+    ordered = plan.order()
+
+    # Assert
+    assert [x.id for x in ordered] == ["a", "d", "b", "c"]
+
+
+def test_plan_with_unknown_dependency_is_rejected():
+    # Act
+    with pytest.raises(saue.InvalidPlanError) as e:
+        saupl.Plan(steps=[create_step("a", depends_on=["b"])])
+
+    # Assert
+    assert "Step a depends on unknown step b" in str(e.value)
+
+
+def test_plan_with_cycle_is_rejected():
+    # Act
+    with pytest.raises(saue.InvalidPlanError) as e:
+        saupl.Plan(
+            steps=[
+                create_step("a", depends_on=["c"]),
+                create_step("b", depends_on=["a"]),
+                create_step("c", depends_on=["b"]),
+            ]
+        )
+
+    # Assert
+    assert "Cyclic dependency detected" in str(e.value)
+
+
+@pytest.mark.asyncio
+async def test_run_starts_independent_steps_concurrently():
+    # Arrange
+    events = []
+    plan = saupl.Plan(
+        steps=[
+            create_step("a"),
+            create_step("b"),
+            create_step("c", depends_on=["a", "b"]),
+        ]
+    )
+
+    # Act
+    await plan.run(create_executor(events, delays={"a": 0.02, "b": 0.01}))
+
+    # Assert
+    assert events == ["start a", "start b", "end b", "end a", "start c", "end c"]
+    assert plan.completed == ["b", "a", "c"]
+    assert set(plan.timings) == {"a", "b", "c"}
+    assert plan.timings["a"] >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_run_awaits_steps_in_flight_and_starts_no_other_on_failure():
+    # Arrange
+    events = []
+    plan = saupl.Plan(
+        steps=[
+            create_step("a"),
+            create_step("b"),
+            create_step("c", depends_on=["a"]),
+            create_step("d", depends_on=["b"]),
+        ]
+    )
+
+    # Act
+    with pytest.raises(RuntimeError) as e:
+        await plan.run(
+            create_executor(events, delays={"a": 0.01, "b": 0.03}, failures=["a"])
+        )
+
+    # Assert
+    assert "a failed" in str(e.value)
+    assert events == ["start a", "start b", "end b"]
+    assert plan.completed == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_run_cancels_steps_in_flight_when_cancelled():
+    # Arrange
+    events = []
+    plan = saupl.Plan(steps=[create_step("a"), create_step("b")])
+    task = asyncio.create_task(plan.run(create_executor(events, delays={"a": 10})))
+    await asyncio.sleep(0.01)
+
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert events == ["start a", "start b", "end b"]
+    assert plan.completed == ["b"]
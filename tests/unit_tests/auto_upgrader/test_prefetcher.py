@@ -0,0 +1,231 @@
+import os
+import shutil
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.prefetcher as saupf
+from subvortex.auto_upgrader.src.github import Github
+
+
+@pytest.fixture(autouse=True)
+def asset_dir(tmp_path):
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        with patch(
+            "subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "service"
+        ):
+            yield tmp_path
+
+
+@pytest.fixture
+def github(asset_dir):
+    github = MagicMock()
+    github.get_installed_version = MagicMock(return_value="1.0.0")
+    github.get_latest_version = AsyncMock(return_value="1.1.0")
+
+    def download_and_unzip_assets_sync(version, role):
+        path = asset_dir / f"subvortex-{version}"
+        path.mkdir()
+        (path / ".complete").touch()
+        return str(path)
+
+    github.download_and_unzip_assets_sync = MagicMock(
+        side_effect=download_and_unzip_assets_sync
+    )
+
+    return github
+
+
+@pytest.mark.asyncio
+async def test_check_prefetches_newer_version(github, asset_dir):
+    # Arrange
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    await prefetcher.check()
+    await prefetcher.wait(version="1.1.0")
+
+    # Assert
+    github.download_and_unzip_assets_sync.assert_called_once_with(
+        version="1.1.0", role="miner"
+    )
+    assert "1.1.0" in prefetcher.prefetched
+    assert prefetcher.tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_check_does_nothing_when_up_to_date(github):
+    # Arrange
+    github.get_latest_version.return_value = "1.0.0"
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    await prefetcher.check()
+
+    # Assert
+    assert prefetcher.tasks == {}
+    github.download_and_unzip_assets_sync.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_keeps_the_force_reinstall_marker(asset_dir):
+    # Arrange
+    (asset_dir / "subvortex-1.0.0").mkdir()
+    (asset_dir / "subvortex-1.0.0" / "force_reinstall").touch()
+    os.symlink(asset_dir / "subvortex-1.0.0", asset_dir / "subvortex")
+    github = Github()
+    github.get_latest_version = AsyncMock(return_value="1.0.0")
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    with patch(
+        "subvortex.auto_upgrader.src.constants.SV_EXECUTION_DIR",
+        str(asset_dir / "subvortex"),
+    ):
+        await prefetcher.check()
+        kept = (asset_dir / "subvortex-1.0.0" / "force_reinstall").exists()
+
+        # The upgrade still acts on it
+        version = await github.get_local_version()
+
+    # Assert
+    assert kept
+    assert prefetcher.tasks == {}
+    assert version is None
+
+
+@pytest.mark.asyncio
+async def test_check_ignores_github_errors(github):
+    # Arrange
+    github.get_latest_version.side_effect = saue.NoReleaseAvailableError()
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    await prefetcher.check()
+
+    # Assert
+    assert prefetcher.tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_schedule_skips_version_already_pulled(github, asset_dir):
+    # Arrange
+    (asset_dir / "subvortex-1.1.0").mkdir()
+    (asset_dir / "subvortex-1.1.0" / ".complete").touch()
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    prefetcher.schedule(version="1.1.0")
+
+    # Assert
+    assert prefetcher.tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_schedule_prefetches_version_partially_extracted(github, asset_dir):
+    # Arrange
+    (asset_dir / "subvortex-1.1.0").mkdir()
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    prefetcher.schedule(version="1.1.0")
+
+    # Assert
+    assert "1.1.0" in prefetcher.tasks
+    prefetcher.cancel()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_runs_in_a_low_priority_thread(github):
+    # Arrange
+    priorities = []
+
+    def download_and_unzip_assets_sync(version, role):
+        priorities.append(os.getpriority(os.PRIO_PROCESS, threading.get_native_id()))
+        return None
+
+    github.download_and_unzip_assets_sync.side_effect = download_and_unzip_assets_sync
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    prefetcher.schedule(version="1.1.0")
+    await prefetcher.wait(version="1.1.0")
+
+    # Assert
+    assert priorities == [19]
+    assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) != 19
+    assert prefetcher.prefetched == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_left_to_the_upgrade(github):
+    # Arrange
+    github.download_and_unzip_assets_sync.side_effect = saue.ChecksumMismatchError(
+        file_path="archive", expected="a", actual="b"
+    )
+    prefetcher = saupf.Prefetcher(github=github)
+
+    # Act
+    prefetcher.schedule(version="1.1.0")
+    await prefetcher.wait(version="1.1.0")
+
+    # Assert
+    assert prefetcher.consume(version="1.1.0") is False
+
+
+@pytest.mark.asyncio
+async def test_wait_lets_prefetch_in_progress_finish(github):
+    # Arrange
+    release = threading.Event()
+    original = github.download_and_unzip_assets_sync.side_effect
+
+    def download_and_unzip_assets_sync(version, role):
+        release.wait(timeout=5)
+        return original(version=version, role=role)
+
+    github.download_and_unzip_assets_sync.side_effect = download_and_unzip_assets_sync
+    prefetcher = saupf.Prefetcher(github=github)
+    prefetcher.schedule(version="1.1.0")
+
+    # Act
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    await prefetcher.wait(version="1.1.0")
+
+    # Assert
+    assert prefetcher.consume(version="1.1.0") is True
+
+
+@pytest.mark.asyncio
+async def test_consume_reports_lead_time(github):
+    # Arrange
+    prefetcher = saupf.Prefetcher(github=github)
+    prefetcher.schedule(version="1.1.0")
+    await prefetcher.wait(version="1.1.0")
+    prefetcher.prefetched["1.1.0"] = time.time() - 42
+
+    # Act
+    with patch("subvortex.auto_upgrader.src.prefetcher.btul.logging") as mock_logging:
+        result = prefetcher.consume(version="1.1.0")
+
+    # Assert
+    assert result is True
+    assert "42." in mock_logging.info.call_args[0][0]
+    assert prefetcher.consume(version="1.1.0") is False
+
+
+@pytest.mark.asyncio
+async def test_consume_returns_false_when_assets_removed(github, asset_dir):
+    # Arrange
+    prefetcher = saupf.Prefetcher(github=github)
+    prefetcher.schedule(version="1.1.0")
+    await prefetcher.wait(version="1.1.0")
+    shutil.rmtree(asset_dir / "subvortex-1.1.0")
+
+    # Act
+    result = prefetcher.consume(version="1.1.0")
+
+    # Assert
+    assert result is False
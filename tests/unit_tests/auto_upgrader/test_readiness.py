@@ -0,0 +1,278 @@
+import time
+import asyncio
+import pytest
+import subprocess
+from unittest import mock
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.readiness as saurd
+from subvortex.auto_upgrader.src.service import Service
+
+
+def create_service(readiness=None, readiness_timeout=None):
+    return Service(
+        id="subvortex-neuron",
+        name="neuron",
+        version="1.0.0",
+        component_version="1.0.0",
+        service_version="1.0.0",
+        execution="process",
+        migration="",
+        setup_command="",
+        start_command="",
+        stop_command="",
+        teardown_command="",
+        readiness=readiness,
+        readiness_timeout=readiness_timeout,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tcp_probe_is_ready_once_the_port_accepts_connections():
+    # Arrange
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    probe = saurd.create_probe(
+        "neuron", {"type": "tcp", "host": "127.0.0.1", "port": port}
+    )
+
+    # Action
+    ready = await probe.check()
+    server.close()
+    await server.wait_closed()
+    closed = await probe.check()
+
+    # Assert
+    assert ready is True
+    assert closed is False
+    assert probe.error
+
+
+@pytest.mark.asyncio
+async def test_http_probe_checks_the_expected_status():
+    # Arrange
+    probe = saurd.create_probe(
+        "neuron", {"type": "http", "url": "http://localhost/health", "status": 204}
+    )
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.readiness.requests.get",
+        return_value=mock.Mock(status_code=200),
+    ):
+        ready = await probe.check()
+
+    # Assert
+    assert ready is False
+    assert probe.error == "status 200"
+
+
+@pytest.mark.asyncio
+async def test_http_probe_waits_for_its_timeout_within_the_deadline():
+    # Arrange
+    probe = saurd.create_probe(
+        "neuron", {"type": "http", "url": "http://localhost/health", "timeout": 5}
+    )
+
+    # Action
+    with patch(
+        "subvortex.auto_upgrader.src.readiness.requests.get",
+        return_value=mock.Mock(status_code=200),
+    ) as mock_get:
+        await probe.check()
+        probe.deadline = time.monotonic() + 2
+        await probe.check()
+
+    # Assert
+    assert mock_get.call_args_list[0].kwargs["timeout"] == 5
+    assert 1 < mock_get.call_args_list[1].kwargs["timeout"] <= 2
+
+
+def test_probe_has_to_implement_its_check():
+    # Act
+    with pytest.raises(TypeError):
+        saurd.Probe({"type": "none"})
+
+
+@pytest.mark.asyncio
+async def test_process_probe_finds_a_running_process():
+    # Arrange
+    process = subprocess.Popen(["sleep", "30.123"])
+    probe = saurd.create_probe(
+        "neuron", {"type": "process", "pattern": r"sleep 30\.123"}
+    )
+
+    # Action
+    try:
+        ready = await probe.check()
+    finally:
+        process.kill()
+        process.wait()
+    exited = await probe.check()
+
+    # Assert
+    assert ready is True
+    assert exited is False
+
+
+@pytest.mark.asyncio
+async def test_log_probe_only_matches_lines_written_after_its_creation(tmp_path):
+    # Arrange
+    path = tmp_path / "neuron.log"
+    path.write_text("Neuron started\n")
+    probe = saurd.create_probe(
+        "neuron", {"type": "log", "path": str(path), "pattern": "Neuron started"}
+    )
+
+    # Action
+    before = await probe.check()
+    with open(path, "a") as f:
+        f.write("Loading...\nNeuron sta")
+    partial = await probe.check()
+    with open(path, "a") as f:
+        f.write("rted\n")
+    after = await probe.check()
+
+    # Assert
+    assert before is False
+    assert partial is False
+    assert after is True
+
+
+def test_unknown_probe_is_rejected():
+    # Act
+    with pytest.raises(saue.InvalidProbeError) as e:
+        saurd.create_probe("neuron", {"type": "ftp"})
+
+    # Assert
+    assert "Unknown probe type ftp" in str(e.value)
+
+
+def test_probe_missing_a_setting_is_rejected():
+    # Act
+    with pytest.raises(saue.InvalidProbeError) as e:
+        saurd.create_probe("neuron", {"type": "tcp"})
+
+    # Assert
+    assert "tcp probe: missing port" in str(e.value)
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_READINESS_MIN_INTERVAL", 0.01)
+@patch("subvortex.auto_upgrader.src.constants.SV_READINESS_MAX_INTERVAL", 0.04)
+async def test_poll_backs_off_until_the_check_succeeds():
+    # Arrange
+    check = mock.AsyncMock(side_effect=[False] * 5 + [True])
+    intervals = []
+
+    async def sleep(interval):
+        intervals.append(interval)
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.readiness.asyncio.sleep", sleep):
+        ready = await saurd.poll(check, timeout=10)
+
+    # Assert
+    assert ready is True
+    assert intervals == [0.01, 0.02, 0.04, 0.04, 0.04]
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_right_away_without_probes():
+    # Arrange
+    readiness = saurd.Readiness(service=create_service())
+
+    # Act
+    await asyncio.wait_for(readiness.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_raises_with_the_probes_not_ready_at_the_deadline():
+    # Arrange
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    service = create_service(
+        readiness=[
+            {"type": "tcp", "host": "127.0.0.1", "port": port},
+            {"type": "process", "pattern": "no-such-process-[0-9]{32}"},
+        ],
+        readiness_timeout=0.3,
+    )
+    readiness = saurd.Readiness(service=service)
+
+    # Action
+    with pytest.raises(saue.ServiceNotReadyError) as e:
+        await readiness.wait()
+    server.close()
+    await server.wait_closed()
+
+    # Assert
+    assert "Service neuron is not ready" in str(e.value)
+    assert "process no-such-process" in str(e.value)
+    assert "tcp 127.0.0.1" not in str(e.value)
+
+
+def test_probe_settings_are_resolved_for_the_instance():
+    # Arrange
+    config = {
+        "type": "log",
+        "path": "/var/log/neuron-{instance}.log",
+        "pattern": "Neuron started",
+        "instances": {"green": {"pattern": "Neuron (green) started"}},
+    }
+
+    # Act
+    blue = saurd.resolve_config(config, "blue")
+    green = saurd.resolve_config(config, "green")
+
+    # Assert
+    assert blue == {
+        "type": "log",
+        "path": "/var/log/neuron-blue.log",
+        "pattern": "Neuron started",
+    }
+    assert green == {
+        "type": "log",
+        "path": "/var/log/neuron-green.log",
+        "pattern": "Neuron (green) started",
+    }
+
+
+def test_probes_telling_instances_apart_are_instance_aware():
+    # Arrange
+    aware = create_service(
+        readiness=[
+            {"type": "tcp", "instances": {"blue": {"port": 1}, "green": {"port": 2}}},
+            {"type": "process", "pattern": "neuron --instance {instance}"},
+        ]
+    )
+    shared = create_service(
+        readiness=[
+            {"type": "tcp", "instances": {"blue": {"port": 1}, "green": {"port": 2}}},
+            {"type": "tcp", "port": 8091},
+        ]
+    )
+
+    # Act
+    result = [saurd.is_instance_aware(x) for x in [aware, shared, create_service()]]
+
+    # Assert
+    assert result == [True, False, False]
+
+
+def test_service_reads_readiness_from_the_manifest():
+    # Act
+    service = Service.create(
+        {
+            "id": "validator-redis",
+            "name": "redis",
+            "version": "1.0.0",
+            "readiness": {"type": "redis"},
+            "readiness_timeout": 30,
+        }
+    )
+
+    # Assert
+    assert service.readiness == [{"type": "redis"}]
+    assert service.readiness_timeout == 30
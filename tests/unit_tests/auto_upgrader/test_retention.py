@@ -0,0 +1,189 @@
+import os
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.retention as saurt
+import subvortex.auto_upgrader.src.trash as sautr
+
+
+@pytest.fixture
+def manager(tmp_path):
+    trash = sautr.Trash(directory=str(tmp_path / ".trash"))
+    with patch(
+        "subvortex.auto_upgrader.src.constants.SV_EXECUTION_DIR",
+        str(tmp_path / "subvortex"),
+    ):
+        yield saurt.RetentionManager(trash=trash, directory=str(tmp_path))
+    trash.executor.shutdown(wait=True)
+
+
+def create_version(path, size: int = 100, complete: bool = True):
+    os.makedirs(path / "subvortex")
+    (path / "subvortex" / "file.py").write_bytes(b"x" * size)
+    if complete:
+        (path / ".complete").touch()
+
+
+def get_decisions(entries):
+    return [(x["version"], x["reason"]) for x in entries]
+
+
+def test_scan_lists_versions_newest_first(tmp_path, manager):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+    create_version(tmp_path / "subvortex-1.0.10")
+    create_version(tmp_path / "subvortex-1.0.2", complete=False)
+    os.makedirs(tmp_path / ".trash")
+    os.makedirs(tmp_path / "archives")
+
+    # Act
+    entries = manager.scan()
+
+    # Assert
+    assert [x["version"] for x in entries] == ["1.0.10", "1.0.2", "1.0.0"]
+    assert [x["complete"] for x in entries] == [True, False, True]
+    assert entries[0]["size"] == 100
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_SIZE", 0)
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 2)
+def test_plan_keeps_last_versions_warm(tmp_path, manager):
+    # Arrange
+    for version in ["1.0.0", "1.0.1", "1.0.2", "1.0.3", "1.0.4"]:
+        create_version(tmp_path / f"subvortex-{version}")
+
+    # Act
+    keep, reclaim = manager.plan(protected=["1.0.4"])
+
+    # Assert
+    assert get_decisions(keep) == [
+        ("1.0.4", "in use"),
+        ("1.0.3", "warm"),
+        ("1.0.2", "warm"),
+    ]
+    assert get_decisions(reclaim) == [("1.0.1", "count"), ("1.0.0", "count")]
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_SIZE", 250)
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 0)
+def test_plan_keeps_versions_within_size_budget(tmp_path, manager):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0", size=100)
+    create_version(tmp_path / "subvortex-1.0.1", size=200)
+    create_version(tmp_path / "subvortex-1.0.2", size=100)
+    create_version(tmp_path / "subvortex-1.0.3", size=500)
+
+    # Act
+    keep, reclaim = manager.plan(protected=["1.0.3"])
+
+    # Assert
+    assert get_decisions(keep) == [
+        ("1.0.3", "in use"),
+        ("1.0.2", "warm"),
+        ("1.0.0", "warm"),
+    ]
+    assert get_decisions(reclaim) == [("1.0.1", "size")]
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 5)
+def test_plan_reclaims_incomplete_versions(tmp_path, manager):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+    create_version(tmp_path / "subvortex-1.0.1", complete=False)
+
+    # Act
+    keep, reclaim = manager.plan()
+
+    # Assert
+    assert get_decisions(keep) == [("1.0.0", "warm")]
+    assert get_decisions(reclaim) == [("1.0.1", "incomplete")]
+
+
+def test_plan_always_keeps_installed_version(tmp_path, manager):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+    create_version(tmp_path / "subvortex-1.0.1")
+    os.symlink(tmp_path / "subvortex-1.0.0", tmp_path / "subvortex")
+
+    # Act
+    keep, reclaim = manager.plan(protected=["1.0.1"])
+
+    # Assert
+    assert get_decisions(keep) == [("1.0.1", "in use"), ("1.0.0", "in use")]
+    assert reclaim == []
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 1)
+def test_apply_moves_reclaimed_versions_into_trash(tmp_path, manager):
+    # Arrange
+    for version in ["1.0.0", "1.0.1", "1.0.2"]:
+        create_version(tmp_path / f"subvortex-{version}")
+
+    # Act
+    reclaimed = manager.apply(protected=["1.0.2"])
+
+    # Assert
+    assert get_decisions(reclaimed) == [("1.0.0", "count")]
+    assert not os.path.exists(tmp_path / "subvortex-1.0.0")
+    assert os.path.exists(tmp_path / "subvortex-1.0.1")
+    assert len(os.listdir(manager.trash.directory)) == 1
+
+
+def test_cli_refuses_to_apply_without_policy(tmp_path, capsys):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+
+    # Act
+    with patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)):
+        with pytest.raises(SystemExit) as e:
+            saurt.main(["apply"])
+
+    # Assert
+    assert e.value.code == 2
+    assert "no retention policy configured" in capsys.readouterr().err
+    assert os.path.exists(tmp_path / "subvortex-1.0.0")
+
+
+@patch("subvortex.auto_upgrader.src.constants.SV_RETENTION_KEEP", 1)
+@patch("subvortex.auto_upgrader.src.constants.SV_EXECUTION_METHOD", "process")
+def test_cli_apply_keeps_the_versions_soaking(tmp_path, capsys):
+    # Arrange
+    for version in ["1.0.0", "1.0.1", "1.0.2", "1.0.3"]:
+        create_version(tmp_path / f"subvortex-{version}")
+    os.symlink(tmp_path / "subvortex-1.0.3", tmp_path / "subvortex")
+    (tmp_path / ".soaking.json").write_text('{"1.0.0": 4102444800}')
+
+    # Act
+    with (
+        patch("subvortex.auto_upgrader.src.constants.SV_ASSET_DIR", str(tmp_path)),
+        patch(
+            "subvortex.auto_upgrader.src.constants.SV_EXECUTION_DIR",
+            str(tmp_path / "subvortex"),
+        ),
+    ):
+        saurt.main(["apply"])
+
+    # Assert
+    assert "1 version(s) reclaimed" in capsys.readouterr().out
+    assert os.path.exists(tmp_path / "subvortex-1.0.0")
+    assert not os.path.exists(tmp_path / "subvortex-1.0.1")
+    assert os.path.exists(tmp_path / "subvortex-1.0.2")
+    assert os.path.exists(tmp_path / "subvortex-1.0.3")
+
+
+def test_get_size_excludes_linked_files_from_reclaimable(tmp_path):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0", size=100)
+    create_version(tmp_path / "subvortex-1.0.1", size=100)
+    (tmp_path / "subvortex-1.0.1" / "subvortex" / "shared.py").write_bytes(b"x" * 50)
+    os.link(
+        tmp_path / "subvortex-1.0.1" / "subvortex" / "shared.py",
+        tmp_path / "subvortex-1.0.0" / "subvortex" / "shared.py",
+    )
+
+    # Act
+    size, reclaimable = saurt._get_size(str(tmp_path / "subvortex-1.0.0"))
+
+    # Assert
+    assert size == 150
+    assert reclaimable == 100
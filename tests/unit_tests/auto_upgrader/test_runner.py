@@ -0,0 +1,115 @@
+import os
+import time
+import asyncio
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.exception as saue
+import subvortex.auto_upgrader.src.runner as saurn
+
+
+def is_running(pid: int):
+    # A killed process may stay a zombie until its new parent reaps it
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            state = f.read().rsplit(")", 1)[1].split()[0]
+    except FileNotFoundError:
+        return False
+
+    return state != "Z"
+
+
+@pytest.mark.asyncio
+async def test_run_streams_output_to_the_logs():
+    # Arrange
+    runner = saurn.Runner()
+
+    # Action
+    with patch("subvortex.auto_upgrader.src.runner.btul.logging.trace") as mock_trace:
+        await runner.run(
+            ["bash", "-c", "echo hello; echo world >&2"], action="start", name="neuron"
+        )
+
+    # Assert
+    messages = [x.args[0] for x in mock_trace.call_args_list]
+    assert "📝 neuron start: hello" in messages
+    assert "📝 neuron start: world" in messages
+    assert runner.processes == set()
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_SCRIPT_OUTPUT_LINES", 2)
+async def test_run_raises_with_the_last_lines_on_failure():
+    # Arrange
+    runner = saurn.Runner()
+
+    # Action
+    with pytest.raises(saue.RuntimeError) as e:
+        await runner.run(
+            ["bash", "-c", "echo one; echo two; echo three; exit 3"],
+            action="setup",
+            name="neuron",
+        )
+
+    # Assert
+    assert "neuron exited with code 3\ntwo\nthree" in str(e.value)
+
+
+@pytest.mark.asyncio
+async def test_run_kills_the_process_group_on_timeout(tmp_path):
+    # Arrange
+    runner = saurn.Runner()
+    pid_file = tmp_path / "pid"
+
+    # Action
+    start = time.monotonic()
+    with pytest.raises(saue.RuntimeError) as e:
+        await runner.run(
+            ["bash", "-c", f"sleep 30 & echo $! > {pid_file}; wait"],
+            action="stop",
+            name="neuron",
+            timeout=0.5,
+        )
+
+    # Assert
+    assert time.monotonic() - start < 10
+    assert "neuron timed out after 0.5 seconds" in str(e.value)
+    assert not is_running(int(pid_file.read_text()))
+
+
+@pytest.mark.asyncio
+async def test_run_kills_the_script_when_cancelled():
+    # Arrange
+    runner = saurn.Runner()
+    task = asyncio.create_task(
+        runner.run(["bash", "-c", "sleep 30"], action="start", name="neuron")
+    )
+    await asyncio.sleep(0.2)
+    (process,) = runner.processes
+
+    # Action
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert process.returncode is not None
+    assert runner.processes == set()
+
+
+@pytest.mark.asyncio
+async def test_cancel_kills_the_scripts_in_flight():
+    # Arrange
+    runner = saurn.Runner()
+    task = asyncio.create_task(
+        runner.run(["bash", "-c", "sleep 30"], action="start", name="neuron")
+    )
+    await asyncio.sleep(0.2)
+
+    # Action
+    runner.cancel()
+
+    # Assert
+    with pytest.raises(saue.RuntimeError) as e:
+        await asyncio.wait_for(task, timeout=5)
+    assert "neuron exited with code -9" in str(e.value)
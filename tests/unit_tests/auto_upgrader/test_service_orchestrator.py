@@ -30,9 +30,9 @@ from subvortex.auto_upgrader.src.exception import (
 
 @pytest.fixture(autouse=True)
 def orchestrator():
-    # --- Patch subprocess.run ---
+    # --- Patch Runner.run ---
     subprocess_patcher = patch(
-        "subvortex.auto_upgrader.src.orchestrator.subprocess.run"
+        "subvortex.auto_upgrader.src.runner.Runner.run"
     )
     mock_subprocess_run = subprocess_patcher.start()
 
@@ -62,9 +62,9 @@ def orchestrator():
     orch.check_version_assets_exists = mock.MagicMock()
 
     # GitHub and metadata mocking
-    orch.github.get_local_version = mock.MagicMock()
-    orch.github.get_latest_version = mock.MagicMock()
-    orch.github.download_and_unzip_assets = mock.MagicMock()
+    orch.github.get_local_version = mock.AsyncMock()
+    orch.github.get_latest_version = mock.AsyncMock()
+    orch.github.download_and_unzip_assets = mock.AsyncMock()
     orch.metadata_resolver.list_directory = mock.MagicMock()
     orch.metadata_resolver.get_metadata = mock.MagicMock(
         return_value={
@@ -88,17 +88,18 @@ def orchestrator():
     orch._copy_templates_files = mock.MagicMock()
     orch._is_already_pulled_current_version = mock.MagicMock()
     orch._is_already_pulled_current_version.return_value = False
-    # orch._run = mock.MagicMock()
+    # orch._run = mock.AsyncMock()
 
     # Removal
     orch._remove_assets = mock.MagicMock()
-    orch._pull_assets = mock.MagicMock()
+    orch._pull_assets = mock.AsyncMock()
 
     yield orch  # <- yield the orchestrator instance for the tests
 
     # --- Stop patches after the test ---
     subprocess_patcher.stop()
     exists_patcher.stop()
+    makedirs_patcher.stop()
 
 
 @pytest.fixture(autouse=True)
@@ -154,10 +155,10 @@ def mock_all_steps(orch):
 
 
 def mock_all_scripts(orch):
-    orch._execute_setup = mock.MagicMock()
-    orch._execute_start = mock.MagicMock()
-    orch._execute_stop = mock.MagicMock()
-    orch._execute_teardown = mock.MagicMock()
+    orch._execute_setup = mock.AsyncMock()
+    orch._execute_start = mock.AsyncMock()
+    orch._execute_stop = mock.AsyncMock()
+    orch._execute_teardown = mock.AsyncMock()
 
 
 def assert_run_calls(
@@ -183,7 +184,7 @@ def assert_run_calls(
     called_actions = []
 
     for call_obj in subprocess_mock.call_args_list:
-        args = call_obj.args[0]  # arguments passed to subprocess.run
+        args = call_obj.args[0]  # arguments passed to Runner.run
         env = call_obj.kwargs.get("env", {})
         if not args or not env:
             continue
@@ -1062,12 +1063,12 @@ async def test_raise_exception_when_version_asset_directory_does_not_exist_after
         orchestrator, "latest_version", "1.0.1"
     )
 
-    orchestrator._pull_assets = mock.MagicMock()
+    orchestrator._pull_assets = mock.AsyncMock()
 
     mock_get_version_directory.return_value = "fake-path"
     mock_os_path_exists.return_value = False
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(MissingDirectoryError) as exc:
@@ -1128,7 +1129,7 @@ async def test_raise_exception_when_source_env_file_does_not_exist_during_the_co
     mock_get_au_environment_file.return_value = "fake-source-file"
     mock_os_path_exists.side_effect = [False, True]
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(MissingFileError) as exc:
@@ -1138,7 +1139,9 @@ async def test_raise_exception_when_source_env_file_does_not_exist_during_the_co
     assert "[AU1002] Required file is missing: Path not found: fake-source-file" == str(
         exc.value
     )
-    assert 8 == len(orchestrator.rollback_steps)
+    # The templates are copied alongside the env files
+    assert 9 == len(orchestrator.rollback_steps)
+    assert "📦 Copying templates" == orchestrator.rollback_steps[-1][0]
     assert orchestrator._get_current_version.called
     assert orchestrator._get_latest_version.called
     assert orchestrator._pull_current_assets.called
@@ -1188,7 +1191,7 @@ async def test_raise_exception_when_target_env_dir_does_not_exist_during_the_cop
     mock_get_environment_file.return_value = "fake-target-file"
     mock_os_path_exists.side_effect = [True, False]
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(MissingDirectoryError) as exc:
@@ -1199,7 +1202,9 @@ async def test_raise_exception_when_target_env_dir_does_not_exist_during_the_cop
         "[AU1001] Required directory is missing: Path not found: /var/tmp/subvortex/subvortex-1.0.1/subvortex/miner/neuron"
         == str(exc.value)
     )
-    assert 8 == len(orchestrator.rollback_steps)
+    # The templates are copied alongside the env files
+    assert 9 == len(orchestrator.rollback_steps)
+    assert "📦 Copying templates" == orchestrator.rollback_steps[-1][0]
     assert orchestrator._get_current_version.called
     assert orchestrator._get_latest_version.called
     assert orchestrator._pull_current_assets.called
@@ -1250,7 +1255,7 @@ async def test_raise_exception_when_role_directory_does_not_exist_while_pulling_
     mock_get_role_directory.return_value = "fake-role-dir"
     mock_os_path_exists.return_value = False
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(MissingDirectoryError) as exc:
@@ -1312,7 +1317,7 @@ async def test_raise_exception_when_role_directory_does_not_exist_while_pulling_
     mock_get_role_directory.return_value = "fake-role-dir"
     mock_os_path_exists.return_value = False
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(MissingDirectoryError) as exc:
@@ -1369,7 +1374,7 @@ async def test_raise_exception_when_latest_services_doe_not_exist_after_pulling_
     mock_get_role_directory.return_value = "valid-role-dir"
     mock_os_path_exists.return_value = True
 
-    orchestrator._run = mock.MagicMock()
+    orchestrator._run = mock.AsyncMock()
 
     # Action
     with pytest.raises(ServicesLoadError) as exc:
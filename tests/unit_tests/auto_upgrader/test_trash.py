@@ -0,0 +1,120 @@
+import os
+import time
+import asyncio
+import pytest
+from unittest.mock import patch
+
+import subvortex.auto_upgrader.src.trash as sautr
+
+
+@pytest.fixture
+def trash(tmp_path):
+    trash = sautr.Trash(directory=str(tmp_path / ".trash"))
+    yield trash
+    trash.executor.shutdown(wait=True)
+
+
+def create_version(path, files: int = 3):
+    os.makedirs(path / "subvortex")
+    for i in range(files):
+        (path / "subvortex" / f"file_{i}.py").write_bytes(b"x" * 100)
+    (path / ".complete").touch()
+
+
+def test_put_moves_directory_into_trash(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+
+    # Act
+    trashed_path = trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Assert
+    assert not os.path.exists(tmp_path / "subvortex-1.0.0")
+    assert os.path.dirname(trashed_path) == trash.directory
+    assert os.path.basename(trashed_path).startswith("subvortex-1.0.0.")
+    assert os.path.exists(os.path.join(trashed_path, ".complete"))
+
+
+def test_restore_moves_last_trashed_directory_back(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+    trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+    create_version(tmp_path / "subvortex-1.0.0", files=5)
+    trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Act
+    result = trash.restore(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Assert
+    assert result is True
+    assert len(os.listdir(tmp_path / "subvortex-1.0.0" / "subvortex")) == 5
+    assert len(os.listdir(trash.directory)) == 1
+
+
+def test_restore_returns_false_when_not_in_trash(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.1")
+    trash.put(path=str(tmp_path / "subvortex-1.0.1"))
+
+    # Act
+    result = trash.restore(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Assert
+    assert result is False
+
+
+@pytest.mark.asyncio
+async def test_collect_deletes_trashed_directories(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0")
+    create_version(tmp_path / "subvortex-1.0.1")
+    trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+    trash.put(path=str(tmp_path / "subvortex-1.0.1"))
+
+    # Act
+    await trash.collect()
+
+    # Assert
+    assert os.listdir(trash.directory) == []
+    assert trash.restore(path=str(tmp_path / "subvortex-1.0.0")) is False
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_TRASH_GC_FILES_PER_SECOND", 50)
+async def test_collect_is_rate_limited(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0", files=10)
+    trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Act
+    start = time.monotonic()
+    await trash.collect()
+    duration = time.monotonic() - start
+
+    # Assert
+    assert duration >= 11 / 50 - 0.02
+    assert os.listdir(trash.directory) == []
+
+
+@pytest.mark.asyncio
+@patch("subvortex.auto_upgrader.src.constants.SV_TRASH_GC_FILES_PER_SECOND", 10)
+async def test_collect_cancelled_is_resumed_and_not_restorable(tmp_path, trash):
+    # Arrange
+    create_version(tmp_path / "subvortex-1.0.0", files=20)
+    trash.put(path=str(tmp_path / "subvortex-1.0.0"))
+
+    # Act
+    task = asyncio.create_task(trash.collect())
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert
+    entries = os.listdir(trash.directory)
+    assert len(entries) == 1 and entries[0].startswith(sautr.DELETING_PREFIX)
+    assert trash.restore(path=str(tmp_path / "subvortex-1.0.0")) is False
+
+    with patch("subvortex.auto_upgrader.src.constants.SV_TRASH_GC_FILES_PER_SECOND", 0):
+        await trash.collect()
+    assert os.listdir(trash.directory) == []